@@ -3,7 +3,10 @@ import os
 import sys
 
 from openslides_backend.presenter.check_database import check_meetings
-from openslides_backend.presenter.check_database_all import check_everything
+from openslides_backend.presenter.check_database_all import (
+    check_everything,
+    check_everything_streaming,
+)
 from openslides_backend.services.database.extended_database import ExtendedDatabase
 from openslides_backend.services.postgresql.db_connection_handling import (
     get_new_os_conn,
@@ -18,7 +21,10 @@ def main() -> int:
     with get_new_os_conn() as conn:
         datastore = ExtendedDatabase(conn, logging, env)
         if arg == "all":
-            check_everything(datastore)
+            if "--streaming" in sys.argv[2:]:
+                check_everything_streaming(datastore, print)
+            else:
+                check_everything(datastore)
         else:
             meeting_id = int(arg) if arg else None
             errors = check_meetings(datastore, meeting_id)
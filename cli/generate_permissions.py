@@ -69,6 +69,15 @@ def main() -> None:
         dest.write("permission_parents: dict[Permission, list[Permission]] = ")
         dest.write(repr(all_parents))
 
+        dest.write(
+            "\n# Holds all permissions which are implied by each permission, including itself.\n"
+        )
+        dest.write("implied_permissions: dict[Permission, frozenset[Permission]] = {\n")
+        for permission, implied in get_implied_permissions(all_parents).items():
+            implied_str = ", ".join(repr(Permission(p)) for p in sorted(implied))
+            dest.write(f"    {permission!r}: frozenset({{{implied_str}}}),\n")
+        dest.write("}\n")
+
         if args.check:
             assert_equal(dest, DESTINATION)
             print("Permissions file up-to-date.")
@@ -76,6 +85,24 @@ def main() -> None:
             print(f"Permissions file {DESTINATION} successfully created.")
 
 
+def get_implied_permissions(
+    all_parents: dict[str, list[str]],
+) -> dict[str, set[str]]:
+    """
+    Calculates the transitive closure of the permission tree: Each permission implies
+    itself and all permissions of which it is a (transitive) parent.
+    """
+    implied: dict[str, set[str]] = {permission: set() for permission in all_parents}
+    for permission in all_parents:
+        queue = [permission]
+        while queue:
+            current = queue.pop()
+            if permission not in implied[current]:
+                implied[current].add(permission)
+                queue.extend(all_parents[current])
+    return implied
+
+
 def process_permission_level(
     collection: str, permission: str | None, children: dict[str, Any]
 ) -> Iterable[tuple[str, str | None]]:
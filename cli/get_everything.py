@@ -1,14 +1,15 @@
 import logging
 import os
 import sys
-from json import dumps
 
 import openslides_backend.models.models  # noqa
+from openslides_backend.models.base import model_registry
 from openslides_backend.services.database.extended_database import ExtendedDatabase
 from openslides_backend.services.postgresql.db_connection_handling import (
     get_new_os_conn,
 )
 from openslides_backend.shared.env import Environment
+from openslides_backend.shared.json_stream import write_json_collections
 
 
 def main() -> int:
@@ -17,8 +18,26 @@ def main() -> int:
     with get_new_os_conn() as conn:
         database = ExtendedDatabase(conn, logging, env)
 
-        everything = database.get_everything()
-        print(dumps(everything, indent=4, sort_keys=True, default=str))
+        # the collections are read with server-side cursors and written model
+        # by model, so that the database never has to fit into memory
+        write_json_collections(
+            sys.stdout,
+            (
+                (
+                    collection,
+                    (
+                        (id_, model)
+                        for batch in database.stream(collection, None, [])
+                        for id_, model in batch.items()
+                    ),
+                )
+                for collection in sorted(model_registry)
+            ),
+            sort_keys=True,
+            default=str,
+            use_decimal=False,
+        )
+        sys.stdout.write("\n")
 
     return 0
 
@@ -43,6 +43,7 @@ from ..shared.patterns import (
     id_from_fqid,
     transform_to_fqids,
 )
+from ..shared.schema_validator import LazySchemaValidator
 from ..shared.typing import DeletedModel, HistoryInformation
 from .relations.relation_manager import RelationManager, RelationUpdates
 from .relations.typing import FieldUpdateElement, ListUpdateElement
@@ -56,13 +57,14 @@ HISTORY_MODELS = list(
 
 class SchemaProvider(type):
     """
-    Metaclass to provide pre-compiled JSON schemas for faster validation.
+    Metaclass to provide cached JSON schema validators which are compiled on
+    first use.
     """
 
     def __new__(cls, name, bases, attrs):  # type: ignore
         schema = attrs.get("schema")
         if schema is not None:
-            attrs["schema_validator"] = fastjsonschema.compile(schema)
+            attrs["schema_validator"] = LazySchemaValidator(schema)
         return super().__new__(cls, name, bases, attrs)
 
 
@@ -474,7 +476,7 @@ class Action(BaseServiceProvider, metaclass=SchemaProvider):
                         [
                             GetManyRequest(collection, ids, ["meeting_id"])
                             for collection, ids in collection_to_ids.items()
-                            if model_registry[collection]().try_get_field("meeting_id")
+                            if model_registry[collection].try_get_field("meeting_id")
                         ],
                         use_changed_models=False,
                     )
@@ -653,7 +655,7 @@ class Action(BaseServiceProvider, metaclass=SchemaProvider):
                 }
 
         for fqid, v in fdict.items():
-            fqid_model: Model = model_registry[collection_from_fqid(fqid)]()
+            fqid_model = model_registry[collection_from_fqid(fqid)]
             type_ = v["type"]
             instance = v["fields"]
             if type_ in (EventType.Create, EventType.Update):
@@ -2,22 +2,20 @@ import re
 from collections.abc import Callable, Iterable
 from copy import deepcopy
 from http import HTTPStatus
-from time import sleep
 from typing import Any, TypeVar, cast
 
 import fastjsonschema
-from psycopg.errors import ForeignKeyViolation, RaiseException, SerializationFailure
+from psycopg.errors import ForeignKeyViolation, RaiseException
 
 from openslides_backend.services.database.extended_database import ExtendedDatabase
+from openslides_backend.services.database.write_scheduler import write_scheduler
 from openslides_backend.services.postgresql.db_connection_handling import (
     get_new_os_conn,
 )
-from openslides_backend.shared.exceptions import DatabaseException
 from openslides_backend.shared.patterns import fqid_from_collection_and_id
 
 from ..shared.exceptions import (
     ActionException,
-    BadCodingException,
     DatastoreLockedException,
     ModelDoesNotExist,
     RelationException,
@@ -118,19 +116,18 @@ class ActionHandler(BaseHandler):
         parsing all actions. In the end it sends everything to the event store.
         """
         with make_span(self.env, "handle request"):
-            with get_new_os_conn() as db_connection:
-                self.db_connection = db_connection
-                self.user_id = user_id
-                self.internal = internal
+            self.user_id = user_id
+            self.internal = internal
 
-                try:
-                    payload_schema(payload)
-                except fastjsonschema.JsonSchemaException as exception:
-                    raise ActionException(exception.message)
+            try:
+                payload_schema(payload)
+            except fastjsonschema.JsonSchemaException as exception:
+                raise ActionException(exception.message)
 
             retry_count = int(self.env.ACTION_MAX_RETRIES or 1)
             retry_timeout = float(self.env.ACTION_RETRY_TIMEOUT or 0.4)
-            for attempt in range(1, retry_count + 1):
+
+            def handle_transaction() -> ActionsResponse:
                 try:
                     with get_new_os_conn() as conn:
                         self.post_edit_necessary = False
@@ -196,13 +193,8 @@ class ActionHandler(BaseHandler):
                         )
                         raise ModelDoesNotExist(error_fqid)
                     raise e
-                except SerializationFailure:
-                    if attempt == retry_count:
-                        raise DatabaseException(
-                            "Database operation failed due to concurrent conflicting actions. Please try again later."
-                        )
-                    sleep(retry_timeout)
-            raise BadCodingException("This code should never execute")
+
+            return write_scheduler.run(handle_transaction, retry_count, retry_timeout)
 
     def execute_internal_action(self, action: str, data: dict[str, Any]) -> None:
         """Helper function to execute an internal action with user id -1."""
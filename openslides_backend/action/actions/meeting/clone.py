@@ -1,6 +1,9 @@
+import re
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Any, cast
+from typing import Any
+
+from psycopg import sql
 
 from openslides_backend.action.actions.meeting.mixins import MeetingPermissionMixin
 from openslides_backend.models.checker import (
@@ -11,15 +14,20 @@ from openslides_backend.models.checker import (
 from openslides_backend.models.models import Meeting, MeetingUser
 from openslides_backend.services.database.interface import GetManyRequest
 from openslides_backend.shared.exceptions import ActionException, PermissionDenied
+from openslides_backend.shared.filters import And, FilterOperator, Or
 from openslides_backend.shared.interfaces.event import Event, EventType
-from openslides_backend.shared.patterns import fqid_from_collection_and_id
+from openslides_backend.shared.patterns import (
+    EXTENSION_REFERENCE_IDS_PATTERN,
+    collection_and_id_from_fqid,
+    fqid_from_collection_and_id,
+)
 from openslides_backend.shared.schema import id_list_schema, required_id_schema
-from openslides_backend.shared.util import ONE_ORGANIZATION_FQID, ONE_ORGANIZATION_ID
+from openslides_backend.shared.util import ONE_ORGANIZATION_ID
 
-from ....shared.export_helper import export_meeting
+from ....shared.export_helper import get_relation_fields
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
-from ...util.typing import ActionData
+from ...util.typing import ActionData, ActionResultElement
 from .import_ import MeetingImport
 
 updatable_fields = [
@@ -35,6 +43,8 @@ updatable_fields = [
     "time_zone",
 ]
 
+EXTENSION_FIELDS = ["state_extension", "recommendation_extension"]
+
 
 @register_action("meeting.clone")
 class MeetingClone(MeetingImport):
@@ -94,253 +104,252 @@ class MeetingClone(MeetingImport):
         MeetingPermissionMixin.check_permissions(self, instance)
 
     def update_instance(self, instance: dict[str, Any]) -> dict[str, Any]:
-        meeting_json = export_meeting(
-            self.datastore, instance["meeting_id"], True, True
-        )
-        instance["meeting"] = meeting_json
+        meeting_id = instance.pop("meeting_id")
         additional_user_ids = instance.pop("user_ids", None) or []
         additional_admin_ids = instance.pop("admin_ids", None) or []
         set_as_template = instance.pop("set_as_template", False)
+        meeting = self.datastore.get(
+            fqid_from_collection_and_id("meeting", meeting_id),
+            [
+                "name",
+                "admin_group_id",
+                "default_group_id",
+                "organization_tag_ids",
+                "user_ids",
+            ],
+            lock_result=False,
+            use_changed_models=False,
+        )
 
-        # needs an empty map for superclass code
-        self.merge_user_map = {
-            int(id_): int(id_) for id_ in meeting_json.get("user", {})
-        }
-        self.number_of_imported_users = len(self.merge_user_map)
-        self.number_of_merged_users = len(self.merge_user_map)
+        # the other fields are guaranteed by the constraints of the database
+        extension_motions = self.check_special_fields(meeting_id)
+        self.check_limit_of_meetings(
+            text="clone",
+            text2="",
+        )
+        if not set_as_template and not additional_admin_ids:
+            admin_group = self.datastore.get(
+                fqid_from_collection_and_id("group", meeting["admin_group_id"]),
+                ["meeting_user_ids"],
+                lock_result=False,
+                use_changed_models=False,
+            )
+            if not admin_group.get("meeting_user_ids"):
+                raise ActionException(
+                    "Cannot create a non-template meeting without administrators"
+                )
 
-        # checks if the meeting is correct
-        self.check_one_meeting(instance)
-        meeting = self.get_meeting_from_json(meeting_json)
+        # users are not cloned, so all of them are merged
+        self.number_of_imported_users = len(meeting.get("user_ids") or [])
+        self.number_of_merged_users = self.number_of_imported_users
 
-        if committee_id := instance.get("committee_id"):
-            meeting["committee_id"] = committee_id
+        # Set proper types for TimestampFields
+        for field_name in ["start_time", "end_time"]:
+            if (value := instance.get(field_name)) and isinstance(value, int):
+                instance[field_name] = datetime.fromtimestamp(value, tz=timezone.utc)
 
-        # pre update the meeting
         if "name" not in instance:
             suffix = " - Copy"
             max_length = Meeting().name.constraints.get("maxLength")
             old_name = meeting["name"]
             if max_length and len(old_name) + len(suffix) > max_length:
-                meeting["name"] = (
+                instance["name"] = (
                     old_name[: max_length - len(suffix) - 3] + "..." + suffix
                 )
             else:
-                meeting["name"] = old_name + suffix
-
-        # Set proper types for TimestampFields
-        for field_name in ["start_time", "end_time"]:
-            if (value := instance.get(field_name)) and isinstance(value, int):
-                instance[field_name] = datetime.fromtimestamp(value, tz=timezone.utc)
-
-        meeting.pop("external_id", "")
-        for field in updatable_fields:
-            if field in instance:
-                meeting[field] = instance.pop(field)
-
-        vote_weight_min = Decimal(
-            MeetingUser.vote_weight.constraints.get("minimum", "0.000001")
+                instance["name"] = old_name + suffix
+        self.organization_tag_ids = instance.pop(
+            "organization_tag_ids", meeting.get("organization_tag_ids")
         )
-        for meeting_user in meeting_json.get("meeting_user", {}).values():
-            if (value := meeting_user.get("vote_weight")) is not None:
-                if Decimal(value) < vote_weight_min:
-                    meeting_user["vote_weight"] = "0.000001"
-            else:
-                user_id = meeting_user.get("user_id", 0)
-                value = (
-                    meeting_json.get("user", {})
-                    .get(str(user_id), "0")
-                    .get("default_vote_weight")
-                )
-                if value is not None and Decimal(value) < vote_weight_min:
-                    meeting_user["vote_weight"] = "0.000001"
-
-        # Necessary, because the check otherwise raise exception, even if user will not be imported
-        for user in meeting_json.get("user", {}).values():
-            if (value := user.get("default_vote_weight")) is not None:
-                if Decimal(value) < vote_weight_min:
-                    user["default_vote_weight"] = "0.000001"
+        instance["is_active_in_organization_id"] = ONE_ORGANIZATION_ID
+        instance["template_for_organization_id"] = (
+            ONE_ORGANIZATION_ID if set_as_template else None
+        )
+        instance["imported_at"] = datetime.now()
 
-        # check datavalidation
-        checker = Checker(
-            data=meeting_json,
-            mode="internal",
-            repair=True,
-            fields_to_remove={
+        instance["id"] = self.datastore.clone_meeting(
+            meeting_id,
+            get_clone_collections(),
+            {
+                "meeting": ["external_id", "is_archived_in_organization_id"],
                 "motion": external_motion_fields,
             },
         )
-        try:
-            checker.run_check()
-        except CheckException as ce:
-            raise ActionException(str(ce))
-        self.allowed_collections = checker.allowed_collections
+        self.duplicate_mediafiles(meeting_id)
+        self.motion_updates = self.get_extension_updates(extension_motions)
+        self.meeting_user_updates = self.get_vote_weight_updates(instance["id"])
 
-        # set active
-        meeting["is_active_in_organization_id"] = ONE_ORGANIZATION_ID
-        meeting.pop("is_archived_in_organization_id", 0)
-        meeting["template_for_organization_id"] = (
-            ONE_ORGANIZATION_ID if set_as_template else None
-        )
+        group_map = self.datastore.get_clone_id_map("group")
+        self.group_additions: dict[int, list[int]] = {}
+        for group_id, user_ids in (
+            (meeting["default_group_id"], additional_user_ids),
+            (meeting["admin_group_id"], additional_admin_ids),
+        ):
+            if user_ids:
+                self.group_additions.setdefault(group_map[group_id], []).extend(
+                    self._create_or_get_meeting_user(instance["id"], user_id)
+                    for user_id in user_ids
+                )
+        return instance
 
-        # check limit of meetings
-        self.check_limit_of_meetings(
-            text="clone",
-            text2="",
+    def check_special_fields(self, meeting_id: int) -> dict[int, dict[str, Any]]:
+        """
+        Checks the amendment paragraphs and the extension fields of the motions
+        and returns the motions with extension fields.
+        """
+        motions = self.datastore.filter(
+            "motion",
+            And(
+                FilterOperator("meeting_id", "=", meeting_id),
+                Or(
+                    *(
+                        FilterOperator(field, "!=", None)
+                        for field in ["amendment_paragraphs", *EXTENSION_FIELDS]
+                    )
+                ),
+            ),
+            ["amendment_paragraphs", *EXTENSION_FIELDS],
+            lock_result=False,
         )
-        # set imported_at
-        meeting["imported_at"] = datetime.now()
+        data = {"motion": {str(id_): motion for id_, motion in motions.items()}}
+        checker = Checker(data=data, mode="internal")
+        if referenced_ids := checker.get_missing_references().get("motion"):
+            referenced_motions = self.datastore.filter(
+                "motion",
+                And(
+                    FilterOperator("meeting_id", "=", meeting_id),
+                    FilterOperator("id", "in", list(referenced_ids)),
+                ),
+                ["id"],
+                lock_result=False,
+            )
+            checker = Checker(
+                data=data,
+                mode="internal",
+                referenced_data={
+                    "motion": {
+                        str(id_): motion for id_, motion in referenced_motions.items()
+                    }
+                },
+            )
+        try:
+            checker.run_special_check()
+        except CheckException as ce:
+            raise ActionException(str(ce))
+        return {
+            id_: motion
+            for id_, motion in motions.items()
+            if any(motion.get(field) for field in EXTENSION_FIELDS)
+        }
 
-        # Don't forward orga-wide mediafiles but create new meeting_mediafiles for them
-        meeting_wide_mediafiles_mediafiles: dict[int, dict[str, Any]] = {}
-        orga_mediafiles_replace_map: dict[int, int] = {}
-        for mediafile_id, mediafile in meeting_json.get("mediafile", {}).items():
-            if mediafile.get("owner_id") == ONE_ORGANIZATION_FQID:
-                old_id = mediafile["id"]
-                orga_mediafiles_replace_map[old_id] = old_id
-            else:
-                meeting_wide_mediafiles_mediafiles[mediafile_id] = mediafile
-        meeting_json["mediafile"] = meeting_wide_mediafiles_mediafiles
+    def get_extension_updates(
+        self, motions: dict[int, dict[str, Any]]
+    ) -> dict[int, dict[str, Any]]:
+        """Replaces the motion references in the extension fields with the clones."""
+        if not motions:
+            return {}
+        motion_map = self.datastore.get_clone_id_map("motion")
 
-        # replace ids in the meeting_json
-        self.create_replace_map(meeting_json)
-        if orga_mediafiles_replace_map:
-            self.replace_map["mediafile"].update(orga_mediafiles_replace_map)
+        def replace_fn(match: re.Match[str]) -> str:
+            collection, id_ = collection_and_id_from_fqid(match.group("fqid"))
+            return f"[{fqid_from_collection_and_id(collection, motion_map[id_])}]"
 
-        self.duplicate_mediafiles(meeting_json["mediafile"])
-        orga_wide_mediafiles = self.datastore.get_many(
-            [
-                GetManyRequest(
-                    "mediafile",
-                    list(orga_mediafiles_replace_map),
-                    ["meeting_mediafile_ids"],
-                )
-            ],
-            use_changed_models=False,
-        )["mediafile"]
-        updated_orga_wide_mediafiles = {
-            str(mediafile_id): {
-                "id": mediafile_id,
-                "meeting_mediafile_ids": orga_wide_mediafiles[mediafile_id][
-                    "meeting_mediafile_ids"
-                ]
-                + [self.replace_map["meeting_mediafile"][mm_data["id"]]],
+        return {
+            motion_map[id_]: {
+                field: EXTENSION_REFERENCE_IDS_PATTERN.sub(replace_fn, value)
+                for field in EXTENSION_FIELDS
+                if (value := motion.get(field))
             }
-            for mm_data in meeting_json["meeting_mediafile"].values()
-            if (mediafile_id := mm_data["mediafile_id"]) in orga_mediafiles_replace_map
+            for id_, motion in motions.items()
         }
-        self.replace_fields(instance)
-        instance["meeting"]["mediafile"].update(updated_orga_wide_mediafiles)
-
-        meeting_id = meeting["id"]
-        meeting_users_in_instance = instance["meeting"]["meeting_user"]
-        if additional_user_ids:
-            default_group_id = meeting.get("default_group_id")
-            group_in_instance = instance["meeting"]["group"][str(default_group_id)]
-            self._update_default_and_admin_group(
-                group_in_instance,
-                meeting_users_in_instance,
-                additional_user_ids,
-                meeting_id,
-            )
 
-        if additional_admin_ids:
-            admin_group_id = meeting.get("admin_group_id")
-            group_in_instance = instance["meeting"]["group"][str(admin_group_id)]
-            self._update_default_and_admin_group(
-                group_in_instance,
-                meeting_users_in_instance,
-                additional_admin_ids,
-                meeting_id,
-            )
-            if not set_as_template and not len(
-                group_in_instance.get("meeting_user_ids", [])
-            ):
-                raise ActionException(
-                    "Cannot create a non-template meeting without administrators"
-                )
-        elif not set_as_template and any(
-            [
-                not len(group.get("meeting_user_ids", []))
-                for group in meeting_json["group"].values()
-                if group.get("admin_group_for_meeting_id")
-            ]
-        ):
-            raise ActionException(
-                "Cannot create a non-template meeting without administrators"
-            )
-        self.transform_json_fields(instance)
-        return instance
+    def get_vote_weight_updates(self, meeting_id: int) -> dict[int, dict[str, Any]]:
+        """
+        Raises the vote weights of the cloned meeting users, which are below the
+        minimum, to the minimum.
+        """
+        vote_weight_min = MeetingUser.vote_weight.constraints.get("minimum", "0.000001")
+        meeting_users = self.datastore.execute_custom_select(
+            sql.SQL(
+                """mu.id FROM meeting_user AS mu JOIN "user" AS u ON u.id = mu.user_id
+                WHERE mu.meeting_id = %s
+                AND COALESCE(mu.vote_weight, u.default_vote_weight) < %s"""
+            ),
+            arguments=[meeting_id, vote_weight_min],
+        )
+        return {
+            meeting_user["id"]: {"vote_weight": vote_weight_min}
+            for meeting_user in meeting_users
+        }
 
     def _create_or_get_meeting_user(self, meeting_id: int, user_id: int) -> int:
         meeting_user = self.get_meeting_user(meeting_id, user_id, ["id"])
         if meeting_user:
             return meeting_user["id"]
         else:
-            meeting_user_id = self.create_meeting_user(meeting_id, user_id)
-            self.datastore.get_changed_model("meeting_user", meeting_user_id).pop(
-                "meta_new", None
-            )
-            return meeting_user_id
+            return self.create_meeting_user(meeting_id, user_id)
 
-    def _update_default_and_admin_group(
-        self,
-        group_in_instance: dict[str, Any],
-        meeting_users_in_instance: dict[str, Any],
-        additional_user_ids: list[int],
-        meeting_id: int,
-    ) -> None:
-        additional_meeting_user_ids = [
-            self._create_or_get_meeting_user(meeting_id, user_id)
-            for user_id in additional_user_ids
-        ]
-        meeting_user_ids = set(
-            group_in_instance.get("meeting_user_ids", set()) or set()
+    def duplicate_mediafiles(self, meeting_id: int) -> None:
+        mediafiles = self.datastore.filter(
+            "mediafile",
+            FilterOperator(
+                "owner_id", "=", fqid_from_collection_and_id("meeting", meeting_id)
+            ),
+            ["is_directory"],
+            lock_result=False,
+            use_changed_models=False,
         )
-        meeting_user_ids.update(additional_meeting_user_ids)
-        group_id = group_in_instance["id"]
-        for meeting_user_id in additional_meeting_user_ids:
-            meeting_user = cast(
-                dict[str, Any],
-                self.datastore.get_changed_model("meeting_user", meeting_user_id),
-            )
-            group_ids = meeting_user.get("group_ids", [])
-            if group_id not in group_ids:
-                group_ids.append(group_id)
-                meeting_user["group_ids"] = group_ids
-            meeting_users_in_instance[str(meeting_user_id)] = meeting_user
-        group_in_instance["meeting_user_ids"] = list(meeting_user_ids)
-
-    def duplicate_mediafiles(self, mediafiles: dict[str, Any]) -> None:
-        for mediafile in mediafiles.values():
-            if not mediafile.get("is_directory"):
-                self.media.duplicate_mediafile(
-                    mediafile["id"], self.replace_map["mediafile"][mediafile["id"]]
-                )
+        mediafile_map = self.datastore.get_clone_id_map("mediafile")
+        if id_pairs := [
+            (id_, mediafile_map[id_])
+            for id_, mediafile in mediafiles.items()
+            if not mediafile.get("is_directory")
+        ]:
+            self.media.duplicate_mediafiles(id_pairs)
 
-    def append_extra_events(
-        self, events: list[Event], json_data: dict[str, Any]
-    ) -> None:
-        meeting_id = self.get_meeting_from_json(json_data)["id"]
-        if organization_tag_ids := self.get_meeting_from_json(json_data).get(
-            "organization_tag_ids"
+    def create_events(
+        self, instance: dict[str, Any], pure_create_events: bool = False
+    ) -> Iterable[Event]:
+        meeting_fqid = fqid_from_collection_and_id("meeting", instance["id"])
+        yield self.build_event(
+            EventType.Update,
+            meeting_fqid,
+            {field: value for field, value in instance.items() if field != "id"},
+        )
+        for organization_tag_id in self.organization_tag_ids or []:
+            yield self.build_event(
+                EventType.Update,
+                fqid_from_collection_and_id("organization_tag", organization_tag_id),
+                list_fields={"add": {"tagged_ids": [meeting_fqid]}, "remove": {}},
+            )
+        for collection, updates in (
+            ("motion", self.motion_updates),
+            ("meeting_user", self.meeting_user_updates),
         ):
-            meeting_fqid = fqid_from_collection_and_id("meeting", meeting_id)
-            for organization_tag_id in organization_tag_ids:
-                events.append(
-                    self.build_event(
-                        EventType.Update,
-                        fqid_from_collection_and_id(
-                            "organization_tag", organization_tag_id
-                        ),
-                        list_fields={
-                            "add": {
-                                "tagged_ids": [meeting_fqid],
-                            },
-                            "remove": {},
-                        },
-                    ),
+            for id_, fields in updates.items():
+                yield self.build_event(
+                    EventType.Update,
+                    fqid_from_collection_and_id(collection, id_),
+                    fields,
                 )
+        for group_id, meeting_user_ids in self.group_additions.items():
+            yield self.build_event(
+                EventType.Update,
+                fqid_from_collection_and_id("group", group_id),
+                list_fields={
+                    "add": {"meeting_user_ids": meeting_user_ids},
+                    "remove": {},
+                },
+            )
+
+    def create_action_result_element(
+        self, instance: dict[str, Any]
+    ) -> ActionResultElement | None:
+        return {
+            "id": instance["id"],
+            "number_of_imported_users": self.number_of_imported_users,
+            "number_of_merged_users": self.number_of_merged_users,
+        }
 
     def get_committee_id(self, instance: dict[str, Any]) -> int:
         if instance.get("committee_id"):
@@ -353,3 +362,8 @@ class MeetingClone(MeetingImport):
                 use_changed_models=False,
             )
             return meeting["committee_id"]
+
+
+def get_clone_collections() -> set[str]:
+    """Returns the collections of the models which belong to a meeting, except users."""
+    return {field.get_target_collection() for field in get_relation_fields()} - {"user"}
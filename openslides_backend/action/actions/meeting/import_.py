@@ -1,4 +1,3 @@
-import re
 from collections import defaultdict
 from collections.abc import Iterable
 from datetime import datetime
@@ -13,12 +12,8 @@ from openslides_backend.models.checker import Checker, CheckException
 from openslides_backend.models.fields import (
     BaseGenericRelationField,
     BaseRelationField,
-    GenericRelationField,
-    GenericRelationListField,
     JSONField,
     OnDelete,
-    RelationField,
-    RelationListField,
     TimestampField,
 )
 from openslides_backend.models.models import Meeting
@@ -32,8 +27,6 @@ from openslides_backend.shared.filters import FilterOperator, Or
 from openslides_backend.shared.interfaces.event import EventType
 from openslides_backend.shared.interfaces.write_request import WriteRequest
 from openslides_backend.shared.patterns import (
-    KEYSEPARATOR,
-    collection_and_id_from_fqid,
     collection_from_fqid,
     fqid_from_collection_and_id,
     id_from_fqid,
@@ -50,10 +43,10 @@ from ....shared.util import (
 from ...mixins.singular_action_mixin import SingularActionMixin
 from ...util.crypto import get_random_password
 from ...util.default_schema import DefaultSchema
+from ...util.id_remap import get_relation_list_fields, remap_ids
 from ...util.register import register_action
 from ...util.typing import ActionData, ActionResultElement, ActionResults
 from ..meeting_user.helper_mixin import MeetingUserHelperMixin
-from ..motion.update import EXTENSION_REFERENCE_IDS_PATTERN
 from ..user.user_mixins import LimitOfUserMixin, UsernameMixin
 
 
@@ -171,7 +164,7 @@ class MeetingImport(
     def transform_timestamps(self, instance: dict[str, Any]) -> dict[str, Any]:
         for collection, collection_data in instance["meeting"].items():
             if model := model_registry.get(collection):
-                fields = list(model().get_fields())
+                fields = model.get_fields()
                 timestamp_field_names = [
                     field.own_field_name
                     for field in fields
@@ -187,7 +180,7 @@ class MeetingImport(
     def transform_json_fields(self, instance: dict[str, Any]) -> dict[str, Any]:
         for collection, collection_data in instance["meeting"].items():
             if model := model_registry.get(collection):
-                fields = list(model().get_fields())
+                fields = model.get_fields()
                 json_field_names = [
                     field.own_field_name
                     for field in fields
@@ -446,11 +439,19 @@ class MeetingImport(
         meeting["committee_id"] = instance["committee_id"]
         meeting["is_active_in_organization_id"] = ONE_ORGANIZATION_ID
 
-        # generate passwords
-        for entry in json_data.get("user", {}).values():
-            if entry["id"] not in self.merge_user_map:
-                entry["default_password"] = get_random_password()
-                entry["password"] = self.auth.hash(entry["default_password"])
+        # generate passwords and hash them at once
+        new_users = [
+            entry
+            for entry in json_data.get("user", {}).values()
+            if entry["id"] not in self.merge_user_map
+        ]
+        for entry in new_users:
+            entry["default_password"] = get_random_password()
+        for entry, hashed in zip(
+            new_users,
+            self.auth.hash_many([entry["default_password"] for entry in new_users]),
+        ):
+            entry["password"] = hashed
 
         # set enable_anonymous
         meeting["enable_anonymous"] = False
@@ -495,11 +496,11 @@ class MeetingImport(
         for collection in json_data:
             if collection.startswith("_"):
                 continue
+            entries = list(json_data[collection].values())
+            old_ids = [entry["id"] for entry in entries]
+            remap_ids(collection, entries, self.replace_map, self.allowed_collections)
             new_collection = {}
-            for entry in json_data[collection].values():
-                old_entry_id = entry["id"]
-                for field in list(entry.keys()):
-                    self.replace_field_ids(collection, entry, field)
+            for entry, old_entry_id in zip(entries, old_ids):
                 new_collection[str(entry["id"])] = entry
                 if collection != "user" or old_entry_id not in self.merge_user_map:
                     entry["meta_new"] = True
@@ -509,76 +510,6 @@ class MeetingImport(
             new_json_data[collection] = new_collection
         instance["meeting"] = new_json_data
 
-    def replace_field_ids(
-        self,
-        collection: str,
-        entry: dict[str, Any],
-        field: str,
-    ) -> None:
-        model_field = model_registry[collection].try_get_field(field)
-        if model_field is None:
-            raise ActionException(f"{collection}/{field} is not allowed.")
-        if isinstance(model_field, BaseRelationField):
-            if isinstance(model_field, BaseGenericRelationField):
-                content_list = (
-                    content
-                    if isinstance(content := entry.get(field), list)
-                    else [content]
-                )
-                target_collections = [
-                    item.split(KEYSEPARATOR)[0] for item in content_list if item
-                ]
-            else:
-                target_collections = list(model_field.to.keys())
-            if all(c not in self.allowed_collections for c in target_collections):
-                return
-        if field == "id":
-            entry["id"] = self.replace_map[collection][entry["id"]]
-        elif collection == "meeting" and field == "user_ids":
-            entry[field] = None
-        elif collection == "user" and field == "meeting_ids":
-            entry[field] = None
-        elif collection == "motion" and field in (
-            "recommendation_extension",
-            "state_extension",
-        ):
-            if entry[field]:
-
-                def replace_fn(match: re.Match[str]) -> str:
-                    # replace the reference patterns in the extension fields with the new ids
-                    collection, id = collection_and_id_from_fqid(match.group("fqid"))
-                    new_id = self.replace_map[collection][id]
-                    return f"[{fqid_from_collection_and_id(collection, new_id)}]"
-
-                entry[field] = EXTENSION_REFERENCE_IDS_PATTERN.sub(
-                    replace_fn, entry[field]
-                )
-        else:
-            if isinstance(model_field, RelationField):
-                target_collection = model_field.get_target_collection()
-                if entry[field]:
-                    entry[field] = self.replace_map[target_collection][entry[field]]
-            elif isinstance(model_field, RelationListField):
-                target_collection = model_field.get_target_collection()
-                entry[field] = [
-                    self.replace_map[target_collection][id_]
-                    for id_ in entry.get(field) or []
-                ]
-            elif isinstance(model_field, GenericRelationField):
-                if entry[field]:
-                    name, id_ = entry[field].split(KEYSEPARATOR)
-                    entry[field] = (
-                        name + KEYSEPARATOR + str(self.replace_map[name][int(id_)])
-                    )
-            elif isinstance(model_field, GenericRelationListField):
-                new_fqid_list = []
-                for fqid in entry[field]:
-                    name, id_ = fqid.split(KEYSEPARATOR)
-                    new_fqid_list.append(
-                        name + KEYSEPARATOR + str(self.replace_map[name][int(id_)])
-                    )
-                entry[field] = new_fqid_list
-
     def update_admin_group(self, data_json: dict[str, Any]) -> None:
         """adds the request user to the admin group of the imported meeting"""
         meeting = self.get_meeting_from_json(data_json)
@@ -649,14 +580,17 @@ class MeetingImport(
             ] = meeting_user_ids
 
     def upload_mediadata(self) -> None:
-        for blob, id_, mimetype in self.mediadata:
-            replaced_id = self.replace_map["mediafile"][id_]
-            self.media.upload_mediafile(blob, replaced_id, mimetype)
+        if self.mediadata:
+            self.media.upload_mediafiles(
+                [
+                    (blob, self.replace_map["mediafile"][id_], mimetype)
+                    for blob, id_, mimetype in self.mediadata
+                ]
+            )
 
     def create_events(
         self, instance: dict[str, Any], pure_create_events: bool = False
     ) -> Iterable[Event]:
-        """Be careful, this method is also used by meeting.clone!"""
         json_data = instance["meeting"]
         meeting = self.get_meeting_from_json(json_data)
         meeting_id = meeting["id"]
@@ -677,14 +611,11 @@ class MeetingImport(
                             entry,
                         )
                     )
-                elif collection in ["user", "gender"] or (
-                    collection == "mediafile"
-                    and getattr(self, "action_name", None) == "clone"
-                ):
+                elif collection in ["user", "gender"]:
                     list_fields: ListFields = {"add": {}, "remove": {}}
+                    relation_list_fields = get_relation_list_fields(collection)
                     for field, value in entry.items():
-                        model_field = model_registry[collection]().try_get_field(field)
-                        if isinstance(model_field, RelationListField):
+                        if field in relation_list_fields:
                             list_fields["add"][field] = value
                     if list_fields["add"]:
                         update_events.append(
@@ -802,7 +733,7 @@ class MeetingImport(
         models_to_remove.add((collection, model_id))
         for field_name in content:
             if isinstance(
-                (relation_field := model_registry[collection]().get_field(field_name)),
+                (relation_field := model_registry[collection].get_field(field_name)),
                 BaseRelationField,
             ) and (to_remove := content.get(field_name)):
                 if isinstance(to_remove, list):
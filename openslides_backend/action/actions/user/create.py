@@ -16,7 +16,7 @@ from ...mixins.send_email_mixin import EmailCheckMixin
 from ...util.crypto import get_random_password
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
-from ...util.typing import ActionResultElement
+from ...util.typing import ActionData, ActionResultElement
 from ..meeting_user.mixin import CheckLockOutPermissionMixin
 from .password_mixins import SetPasswordMixin
 from .user_mixins import LimitOfUserMixin, UserMixin, UsernameMixin, check_gender_exists
@@ -71,6 +71,19 @@ class UserCreate(
     history_information = "Account created"
     own_history_information_first = True
 
+    def prepare_action_data(self, action_data: ActionData) -> ActionData:
+        """
+        Generates the missing default passwords and hashes them at once.
+        """
+        passwords = []
+        for instance in action_data:
+            if not instance.get("saml_id"):
+                if not instance.get("default_password"):
+                    instance["default_password"] = get_random_password()
+                passwords.append(instance["default_password"])
+        self.prehash_passwords(passwords)
+        return super().prepare_action_data(action_data)
+
     def update_instance(self, instance: dict[str, Any]) -> dict[str, Any]:
         self.meeting_id: int | None = instance.get("meeting_id")
 
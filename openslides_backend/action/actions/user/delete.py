@@ -9,6 +9,7 @@ from ....shared.exceptions import ActionException
 from ....shared.filters import FilterOperator, Or
 from ....shared.mixins.user_scope_mixin import UserScopeMixin
 from ...generics.delete import DeleteAction
+from ...util.action_type import ActionType
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
 from .user_mixins import AdminIntegrityCheckMixin
@@ -30,6 +31,12 @@ class UserDelete(UserScopeMixin, DeleteAction, AdminIntegrityCheckMixin):
             raise ActionException("You cannot delete yourself.")
         return super().update_instance(instance)
 
+    def prefetch(self, action_data: ActionData) -> None:
+        if not self.internal and self.action_type != ActionType.BACKEND_INTERNAL:
+            self.prefetch_user_scopes(
+                [user_id for date in action_data if (user_id := date.get("id"))]
+            )
+
     def check_permissions(self, instance: dict[str, Any]) -> None:
         self.check_permissions_for_scope(instance["id"])
 
@@ -9,6 +9,7 @@ from ....shared.mixins.user_scope_mixin import UserScopeMixin
 from ...util.crypto import get_random_password
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ...util.typing import ActionData
 from .password_mixins import ClearSessionsMixin, SetPasswordMixin
 
 
@@ -29,11 +30,16 @@ class UserGenerateNewPassword(
             instance["id"], meeting_permission=Permissions.User.CAN_UPDATE
         )
 
-    def update_instance(self, instance: dict[str, Any]) -> dict[str, Any]:
+    def prepare_action_data(self, action_data: ActionData) -> ActionData:
         """
-        Generates new password and call the super code.
+        Generates the new passwords and hashes them at once.
         """
-        instance["password"] = get_random_password()
-        instance["set_as_default"] = True
+        for instance in action_data:
+            instance["password"] = get_random_password()
+            instance["set_as_default"] = True
+        self.prehash_passwords([instance["password"] for instance in action_data])
+        return super().prepare_action_data(action_data)
+
+    def update_instance(self, instance: dict[str, Any]) -> dict[str, Any]:
         self.set_password(instance)
         return instance
@@ -1,4 +1,4 @@
-from typing import Any, cast
+from typing import Any
 
 from psycopg.types.json import Jsonb
 
@@ -412,78 +412,83 @@ class UserMergeTogether(
         }
         option_poll_ids_per_user_id: dict[int, set[int]] = {}
         candidate_list_ids_per_user_id: dict[int, set[int]] = {}
-        meeting_user_ids: list[int] = []
+        meeting_user_ids: list[int] = [
+            meeting_user_id
+            for model in all_models
+            for meeting_user_id in model.get("meeting_user_ids", [])
+        ]
+        vote_ids_per_user_id: dict[int, set[int]] = {
+            model["id"]: {
+                *model.get("vote_ids", []),
+                *model.get("delegated_vote_ids", []),
+            }
+            for model in all_models
+        }
+        # the related models of all users are fetched at once
+        get_many_requests = [
+            GetManyRequest(collection, ids, [field])
+            for collection, ids, field in (
+                (
+                    "poll_candidate",
+                    [
+                        id_
+                        for model in all_models
+                        for id_ in model.get("poll_candidate_ids", [])
+                    ],
+                    "poll_candidate_list_id",
+                ),
+                (
+                    "option",
+                    [
+                        id_
+                        for model in all_models
+                        for id_ in model.get("option_ids", [])
+                    ],
+                    "poll_id",
+                ),
+                (
+                    "vote",
+                    list(set().union(*vote_ids_per_user_id.values())),
+                    "option_id",
+                ),
+            )
+            if ids
+        ]
+        many_models = (
+            self.datastore.get_many(get_many_requests) if get_many_requests else {}
+        )
+        poll_candidates = many_models.get("poll_candidate", {})
+        options = many_models.get("option", {})
+        votes = many_models.get("vote", {})
+        vote_options: dict[int, PartialModel] = {}
+        if vote_option_ids := {
+            option_id for vote in votes.values() if (option_id := vote.get("option_id"))
+        }:
+            vote_options = self.datastore.get_many(
+                [GetManyRequest("option", list(vote_option_ids), ["poll_id"])]
+            ).get("option", {})
         for model in all_models:
-            if len(
-                (pc_ids := model.get("poll_candidate_ids", []))
-                + (o_ids := model.get("option_ids", []))
-                + (
-                    v_ids := list(
-                        {
-                            id_
-                            for id_ in [
-                                *model.get("vote_ids", []),
-                                *model.get("delegated_vote_ids", []),
-                            ]
-                        }
+            if pc_ids := model.get("poll_candidate_ids", []):
+                candidate_list_ids_per_user_id[model["id"]] = {
+                    list_id
+                    for pc_id in pc_ids
+                    if (
+                        list_id := poll_candidates.get(pc_id, {}).get(
+                            "poll_candidate_list_id"
+                        )
                     )
-                )
-            ):
-                get_many_requests = [
-                    GetManyRequest(
-                        "poll_candidate", pc_ids, ["poll_candidate_list_id"]
-                    ),
-                    GetManyRequest(
-                        "option",
-                        o_ids,
-                        ["poll_id"],
-                    ),
-                    GetManyRequest(
-                        "vote",
-                        v_ids,
-                        ["option_id"],
-                    ),
-                ]
-                many_models = self.datastore.get_many(get_many_requests)
-                if pc_ids:
-                    candidate_list_ids_per_user_id[model["id"]] = {
-                        poll_candidate["poll_candidate_list_id"]
-                        for poll_candidate in many_models["poll_candidate"].values()
-                        if poll_candidate.get("poll_candidate_list_id")
-                    }
-                if o_ids:
-                    option_poll_ids_per_user_id[model["id"]] = {
-                        option["poll_id"]
-                        for option in many_models["option"].values()
-                        if option.get("poll_id")
-                    }
-                vote_data = many_models["vote"]
-                vote_poll_ids_per_user_id[model["id"]] = {
-                    *vote_poll_ids_per_user_id.get(model["id"], set()),
-                    *{
-                        cast(int, option["poll_id"])
-                        for option in self.datastore.get_many(
-                            [
-                                GetManyRequest(
-                                    "option",
-                                    list(
-                                        {
-                                            id_
-                                            for id_ in [
-                                                vote["option_id"]
-                                                for vote in vote_data.values()
-                                                if vote.get("option_id")
-                                            ]
-                                        }
-                                    ),
-                                    ["poll_id"],
-                                )
-                            ]
-                        )["option"].values()
-                        if option.get("poll_id")
-                    },
                 }
-            meeting_user_ids += model.get("meeting_user_ids", [])
+            if o_ids := model.get("option_ids", []):
+                option_poll_ids_per_user_id[model["id"]] = {
+                    poll_id
+                    for o_id in o_ids
+                    if (poll_id := options.get(o_id, {}).get("poll_id"))
+                }
+            for vote_id in vote_ids_per_user_id[model["id"]]:
+                if (option_id := votes.get(vote_id, {}).get("option_id")) and (
+                    poll_id := vote_options.get(option_id, {}).get("poll_id")
+                ):
+                    vote_poll_ids_per_user_id[model["id"]].add(poll_id)
         voting_conflicts = {
             poll_id
             for id1, poll_ids1 in vote_poll_ids_per_user_id.items()
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from collections.abc import Callable
 from typing import Any
 
@@ -9,6 +10,22 @@ from ...util.typing import ActionData
 
 
 class SetPasswordMixin(Action):
+    def prehash_passwords(self, passwords: list[str]) -> None:
+        """
+        Hashes all given passwords at once with `hash_many` of the auth service.
+        The hashes are used by the following calls of `hash_password`. Each hash is
+        only used once, so that equal passwords still get different salts.
+        """
+        if not hasattr(self, "password_hashes"):
+            self.password_hashes: dict[str, list[str]] = defaultdict(list)
+        for password, hashed in zip(passwords, self.auth.hash_many(passwords)):
+            self.password_hashes[password].append(hashed)
+
+    def hash_password(self, password: str) -> str:
+        if hashes := getattr(self, "password_hashes", {}).get(password):
+            return hashes.pop()
+        return self.auth.hash(password)
+
     def reset_password(self, instance: dict[str, Any]) -> None:
         instance["password"] = instance["default_password"]
         self.set_password(instance)
@@ -32,7 +49,7 @@ class SetPasswordMixin(Action):
             )
 
         password = instance.pop("password")
-        instance["password"] = self.auth.hash(password)
+        instance["password"] = self.hash_password(password)
         if instance.pop("set_as_default", False):
             instance["default_password"] = password
 
@@ -4,18 +4,43 @@ from ....action.mixins.archived_meeting_check_mixin import CheckForArchivedMeeti
 from ....models.models import User
 from ....permissions.management_levels import OrganizationManagementLevel
 from ....permissions.permissions import Permissions
+from ....services.database.commands import GetManyRequest
 from ....shared.exceptions import ActionException
 from ....shared.mixins.user_scope_mixin import UserScopeMixin
 from ....shared.patterns import fqid_from_collection_and_id
 from ...generics.update import UpdateAction
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
-from .password_mixins import ClearSessionsMixin
+from ...util.typing import ActionData
+from .password_mixins import ClearSessionsMixin, SetPasswordMixin
 
 
 class UserResetPasswordToDefaultMixin(
-    UpdateAction, CheckForArchivedMeetingMixin, ClearSessionsMixin
+    UpdateAction, CheckForArchivedMeetingMixin, ClearSessionsMixin, SetPasswordMixin
 ):
+    def prepare_action_data(self, action_data: ActionData) -> ActionData:
+        """
+        Hashes the default passwords of all users at once.
+        """
+        users = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    self.model.collection,
+                    [instance["id"] for instance in action_data],
+                    ["default_password", "saml_id"],
+                )
+            ],
+            lock_result=False,
+        ).get(self.model.collection, {})
+        self.prehash_passwords(
+            [
+                str(user.get("default_password"))
+                for user in users.values()
+                if not user.get("saml_id")
+            ]
+        )
+        return super().prepare_action_data(action_data)
+
     def update_instance(self, instance: dict[str, Any]) -> dict[str, Any]:
         """
         Gets the default_password and reset password.
@@ -30,7 +55,7 @@ class UserResetPasswordToDefaultMixin(
             raise ActionException(
                 f"user {user['saml_id']} is a Single Sign On user and has no local OpenSlides password."
             )
-        default_password = self.auth.hash(str(user.get("default_password")))
+        default_password = self.hash_password(str(user.get("default_password")))
         instance["password"] = default_password
         return instance
 
@@ -8,6 +8,7 @@ from ....permissions.permissions import Permissions
 from ....shared.mixins.user_scope_mixin import UserScopeMixin
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ...util.typing import ActionData
 from .password_mixins import ClearSessionsMixin, SetPasswordMixin
 
 
@@ -36,6 +37,10 @@ class UserSetPasswordAction(
             instance["id"], meeting_permission=Permissions.User.CAN_UPDATE
         )
 
+    def prepare_action_data(self, action_data: ActionData) -> ActionData:
+        self.prehash_passwords([instance["password"] for instance in action_data])
+        return super().prepare_action_data(action_data)
+
     def update_instance(self, instance: dict[str, Any]) -> dict[str, Any]:
         self.set_password(instance)
         return instance
@@ -1,11 +1,22 @@
+from collections import defaultdict
 from collections.abc import Iterable
+from functools import cache
 from typing import Any, cast
 
+from ...models.base import Model
 from ...models.fields import BaseRelationField, OnDelete
-from ...shared.exceptions import ActionException, ProtectedModelsException
+from ...services.database.commands import GetManyRequest
+from ...shared.exceptions import (
+    ActionException,
+    ModelDoesNotExist,
+    ProtectedModelsException,
+)
 from ...shared.interfaces.event import Event, EventType
 from ...shared.patterns import (
+    Collection,
     FullQualifiedId,
+    Id,
+    collection_and_id_from_fqid,
     collection_from_fqid,
     fqid_from_collection_and_id,
     id_from_fqid,
@@ -14,7 +25,26 @@ from ...shared.patterns import (
 from ...shared.typing import DeletedModel
 from ..action import Action
 from ..util.actions_map import actions_map
-from ..util.typing import ActionData
+
+# Methods which are run when a delete action is executed as a cascaded delete.
+# Delete actions which do not override any of them are executed in bulk.
+CASCADE_HOOKS = (
+    "perform",
+    "prefetch",
+    "validate_instance",
+    "validate_fields",
+    "check_for_archived_meeting",
+    "get_meeting_id",
+    "prepare_action_data",
+    "get_updated_instances",
+    "base_update_instance",
+    "update_instance",
+    "handle_relation_updates",
+    "create_events",
+    "build_write_request",
+    "get_full_history_information",
+    "get_history_information",
+)
 
 
 class DeleteAction(Action):
@@ -47,63 +77,207 @@ class DeleteAction(Action):
         instance = self.update_instance(instance)
 
         # Update instance and set relation fields to None.
-        # Gather all delete actions with action data and also all models to be deleted
-        delete_actions: list[tuple[FullQualifiedId, type[Action], ActionData]] = []
+        # Gather all models to be deleted
+        protected_fqids, cascade_fqids = self.handle_on_delete(
+            self.model, db_instance, instance
+        )
+        if protected_fqids := [
+            fqid
+            for fqid in protected_fqids
+            if not self.datastore.is_to_be_deleted_for_protected(fqid)
+        ]:
+            raise ProtectedModelsException(this_fqid, protected_fqids)
+
+        # Execute all previously gathered deletes and gather all protected fqids
+        if all_protected_fqids := self.cascade_delete(cascade_fqids):
+            raise ProtectedModelsException(this_fqid, all_protected_fqids)
+
+        self.datastore.apply_changed_model(this_fqid, DeletedModel())
+        return instance
+
+    def handle_on_delete(
+        self, model: Model, db_instance: dict[str, Any], instance: dict[str, Any]
+    ) -> tuple[list[FullQualifiedId], list[FullQualifiedId]]:
+        """
+        Sets the SET_NULL view fields of the instance to None and returns the fqids
+        of the PROTECT fields and the fqids which have to be deleted because of the
+        CASCADE fields. The latter are marked for deletion.
+        """
+        protected_fqids: list[FullQualifiedId] = []
+        cascade_fqids: list[FullQualifiedId] = []
         for field_name, value in sorted(db_instance.items()):
             if field_name == "id":
                 continue
-            field = cast(BaseRelationField, self.model.get_field(field_name))
+            field = cast(BaseRelationField, model.get_field(field_name))
             # Check on_delete.
             # Extract all foreign keys as fqids from the model
             foreign_fqids = transform_to_fqids(value, field.get_target_collection())
-            if field.on_delete != OnDelete.SET_NULL:
-                if field.on_delete == OnDelete.PROTECT:
-                    protected_fqids = [
-                        fqid
-                        for fqid in foreign_fqids
-                        if not self.datastore.is_to_be_deleted_for_protected(fqid)
-                    ]
-                    if protected_fqids:
-                        raise ProtectedModelsException(this_fqid, protected_fqids)
-                else:
-                    # case: field.on_delete == OnDelete.CASCADE
-                    # Execute the delete action for all fqids
-                    for fqid in foreign_fqids:
-                        if self.datastore.is_to_be_deleted(fqid):
-                            # Skip models that are already tracked for deletion
-                            continue
-                        delete_action_class = actions_map.get(
-                            f"{collection_from_fqid(fqid)}.delete"
-                        )
-                        if not delete_action_class:
-                            raise ActionException(
-                                f"Can't cascade the delete action to {collection_from_fqid(fqid)} "
-                                "since no delete action was found."
-                            )
-                        # Assume that the delete action uses the standard action data
-                        action_data = [{"id": id_from_fqid(fqid)}]
-                        delete_actions.append((fqid, delete_action_class, action_data))
-                        self.datastore.apply_to_be_deleted_for_protected(fqid)
+            if field.on_delete == OnDelete.PROTECT:
+                protected_fqids.extend(foreign_fqids)
+            elif field.on_delete == OnDelete.CASCADE:
+                for fqid in foreign_fqids:
+                    if self.datastore.is_to_be_deleted(fqid):
+                        # Skip models that are already tracked for deletion
+                        continue
+                    cascade_fqids.append(fqid)
+                    self.datastore.apply_to_be_deleted_for_protected(fqid)
             elif field.is_view_field:
                 # case: field.on_delete == OnDelete.SET_NULL
                 instance[field_name] = None
+        return protected_fqids, cascade_fqids
+
+    def cascade_delete(self, fqids: list[FullQualifiedId]) -> list[FullQualifiedId]:
+        """
+        Deletes the given models and everything they cascade to. Models whose
+        delete action does not override any of the CASCADE_HOOKS are deleted in
+        bulk: The delete closure is computed breadth-first with one read per
+        collection and wave, their PROTECT fields are validated together and their
+        events are built without sub-actions. All other models are deleted with
+        their delete action. Returns the protected fqids which prevent the
+        deletion.
+        """
+        custom_fqids: list[FullQualifiedId] = []
+        wave = self.split_cascade_fqids(fqids, custom_fqids)
+        bulk_instances: list[tuple[type[DeleteAction], dict[str, Any]]] = []
+        protected_fqids: list[FullQualifiedId] = []
+        while wave:
+            next_fqids: list[FullQualifiedId] = []
+            for collection, ids in wave.items():
+                ActionClass = cast(
+                    type[DeleteAction], actions_map[f"{collection}.delete"]
+                )
+                ids = [
+                    id_
+                    for id_ in dict.fromkeys(ids)
+                    if not self.datastore.is_to_be_deleted(
+                        fqid := fqid_from_collection_and_id(collection, id_)
+                    )
+                    and not self.datastore.is_deleted(fqid)
+                ]
+                db_instances = self.get_bulk_db_instances(ActionClass.model, ids)
+                for id_ in ids:
+                    fqid = fqid_from_collection_and_id(collection, id_)
+                    if id_ not in db_instances:
+                        raise ModelDoesNotExist(fqid)
+                    self.datastore.apply_to_be_deleted(fqid)
+                    instance = {"id": id_}
+                    protected, cascade = self.handle_on_delete(
+                        ActionClass.model, db_instances[id_], instance
+                    )
+                    protected_fqids.extend(protected)
+                    next_fqids.extend(cascade)
+                    bulk_instances.append((ActionClass, instance))
+            wave = self.split_cascade_fqids(next_fqids, custom_fqids)
 
-        # Add additional relation models and execute all previously gathered delete actions
         # catch all protected models exception to gather all protected fqids
         all_protected_fqids: list[FullQualifiedId] = []
-        for fqid, delete_action_class, delete_action_data in delete_actions:
+        for fqid in custom_fqids:
             try:
                 # Skip models that were deleted in the meantime
                 if not self.datastore.is_deleted(fqid):
-                    self.execute_other_action(delete_action_class, delete_action_data)
+                    self.execute_other_action(
+                        actions_map[f"{collection_from_fqid(fqid)}.delete"],
+                        [{"id": id_from_fqid(fqid)}],
+                    )
             except ProtectedModelsException as e:
                 all_protected_fqids.extend(e.fqids)
-
+        all_protected_fqids.extend(
+            fqid
+            for fqid in protected_fqids
+            if not self.datastore.is_to_be_deleted_for_protected(fqid)
+        )
         if all_protected_fqids:
-            raise ProtectedModelsException(this_fqid, all_protected_fqids)
+            return all_protected_fqids
 
-        self.datastore.apply_changed_model(this_fqid, DeletedModel())
-        return instance
+        # delete the models of later waves first, like the sub-actions would do
+        for ActionClass, instance in reversed(bulk_instances):
+            fqid = fqid_from_collection_and_id(
+                ActionClass.model.collection, instance["id"]
+            )
+            self.datastore.apply_changed_model(fqid, DeletedModel())
+            relation_updates = self.relation_manager.get_relation_updates(
+                ActionClass.model, instance, ActionClass.name
+            )
+            self.events.extend(self.handle_relation_updates_helper(relation_updates))
+            self.events.append(self.build_event(EventType.Delete, fqid))
+        return []
+
+    def split_cascade_fqids(
+        self, fqids: list[FullQualifiedId], custom_fqids: list[FullQualifiedId]
+    ) -> dict[Collection, list[Id]]:
+        """
+        Returns the ids of the fqids which can be deleted in bulk per collection and
+        appends all other fqids to custom_fqids.
+        """
+        bulk_ids: dict[Collection, list[Id]] = defaultdict(list)
+        for fqid in fqids:
+            collection, id_ = collection_and_id_from_fqid(fqid)
+            ActionClass = actions_map.get(f"{collection}.delete")
+            if not ActionClass:
+                raise ActionException(
+                    f"Can't cascade the delete action to {collection} "
+                    "since no delete action was found."
+                )
+            if self.can_delete_in_bulk(ActionClass):
+                bulk_ids[collection].append(id_)
+            else:
+                custom_fqids.append(fqid)
+        return bulk_ids
+
+    def can_delete_in_bulk(self, ActionClass: type[Action]) -> bool:
+        if not is_plain_delete_action(ActionClass):
+            return False
+        # the archived meeting check is done in bulk via the meeting_id field
+        return self.skip_archived_meeting_check or (
+            not ActionClass.use_meeting_ids_for_archived_meeting_check
+            and not ActionClass.permission_model
+            and not ActionClass.permission_id
+            and ActionClass.model.has_field("meeting_id")
+        )
+
+    def get_bulk_db_instances(
+        self, model: Model, ids: list[Id]
+    ) -> dict[Id, dict[str, Any]]:
+        """
+        Fetches the relation fields of all given models at once and checks that
+        their meetings are not archived.
+        """
+        if not ids:
+            return {}
+        db_instances = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    model.collection,
+                    ids,
+                    [
+                        field.get_own_field_name()
+                        for field in model.get_relation_fields()
+                    ],
+                )
+            ]
+        ).get(model.collection, {})
+        if not self.skip_archived_meeting_check:
+            meeting_ids = {
+                meeting_id
+                for db_instance in db_instances.values()
+                if (meeting_id := db_instance.get("meeting_id"))
+            }
+            meetings = self.datastore.get_many(
+                [
+                    GetManyRequest(
+                        "meeting",
+                        list(meeting_ids),
+                        ["id", "is_active_in_organization_id", "name"],
+                    )
+                ],
+                lock_result=False,
+            ).get("meeting", {})
+            for meeting in meetings.values():
+                if not meeting.get("is_active_in_organization_id"):
+                    raise ActionException(
+                        f'Meeting {meeting.get("name", "")}/{meeting["id"]} cannot be changed, because it is archived.'
+                    )
+        return db_instances
 
     def create_events(self, instance: dict[str, Any]) -> Iterable[Event]:
         fqid = fqid_from_collection_and_id(self.model.collection, instance["id"])
@@ -119,3 +293,19 @@ class DeleteAction(Action):
 
     def is_to_be_deleted(self, fqid: FullQualifiedId) -> bool:
         return self.datastore.is_to_be_deleted(fqid)
+
+
+@cache
+def is_plain_delete_action(ActionClass: type[Action]) -> bool:
+    """
+    Returns whether the action is a delete action without custom behaviour for
+    cascaded deletes.
+    """
+    return (
+        issubclass(ActionClass, DeleteAction)
+        and ActionClass.history_information is None
+        and all(
+            getattr(ActionClass, name) is getattr(DeleteAction, name)
+            for name in CASCADE_HOOKS
+        )
+    )
@@ -1,20 +1,22 @@
 import copy
 import csv
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum, StrEnum
 from typing import Any, TypedDict, Union, cast
 from zoneinfo import ZoneInfo
 
+from psycopg import sql
 from psycopg.types.json import Jsonb
 from typing_extensions import NotRequired
 
 from openslides_backend.action.action import Action
 
 from ...models.models import ImportPreview
-from ...shared.exceptions import ActionException
+from ...services.database.commands import GetManyRequest
+from ...shared.exceptions import ActionException, ModelDoesNotExist
 from ...shared.filters import And, Filter, FilterOperator, Or
 from ...shared.interfaces.event import Event, EventType
 from ...shared.interfaces.services import Database
@@ -81,28 +83,28 @@ class Lookup:
             else:
                 self.name_to_ids[name] = []
         self.id_to_name: dict[int, list[SearchFieldType]] = defaultdict(list)
-        or_filters: list[Filter] = []
         if "id" not in mapped_fields:
             mapped_fields.append("id")
         if type(field) is str:
             if field not in mapped_fields:
                 mapped_fields.append(field)
-            if name_entries:
-                or_filters = [
-                    FilterOperator(field, "=", name) for name, _ in name_entries
-                ]
         else:
             mapped_fields.extend(f for f in field if f not in mapped_fields)
-            if name_entries:
-                or_filters = [
-                    And(*[FilterOperator(field[i], "=", name_tpl[i]) for i in range(3)])
-                    for name_tpl, _ in name_entries
+        if name_entries:
+            # The names are sent as one array per field instead of one condition
+            # per entry. For tuples this selects all combinations of the values,
+            # so the exact tuples are filtered afterwards.
+            names = {name for name, _ in name_entries}
+            fields = [field] if type(field) is str else list(field)
+            columns = [names] if type(field) is str else list(zip(*names))
+            filter_: Filter = And(
+                *[
+                    self.get_in_filter(fieldname, set(field_values))
+                    for fieldname, field_values in zip(fields, columns)
                 ]
-        if or_filters:
+            )
             if global_and_filter:
-                filter_: Filter = And(global_and_filter, Or(*or_filters))
-            else:
-                filter_ = Or(*or_filters)
+                filter_ = And(global_and_filter, filter_)
 
             for entry in datastore.filter(
                 collection,
@@ -110,7 +112,10 @@ class Lookup:
                 mapped_fields,
                 lock_result=False,
             ).values():
-                self.add_item(entry)
+                if type(field) is str or (
+                    tuple(entry.get(f, "") for f in field) in names
+                ):
+                    self.add_item(entry)
 
         # Add action data items not found in database to lookup dict
         for name, entry in name_entries:
@@ -124,6 +129,14 @@ class Lookup:
                         obj["info"] = ImportState.ERROR
                 values.append(entry)
 
+    @staticmethod
+    def get_in_filter(field: str, values: set[Any]) -> Filter:
+        """Matches all given values, None has to be compared separately in SQL."""
+        filter_: Filter = FilterOperator(field, "in", list(values - {None}))
+        if None in values:
+            filter_ = Or(filter_, FilterOperator(field, "=", None))
+        return filter_
+
     def check_duplicate(self, name: SearchFieldType) -> ResultType:
         if len(values := self.name_to_ids.get(name, [])) == 1:
             if (entry := values[0]).get("id"):
@@ -161,6 +174,192 @@ class Lookup:
             self.name_to_ids[key].append(entry)
 
 
+class ImportPreviewStore:
+    """
+    Row-oriented access to an import_preview. The rows are stored in pages of at
+    most ROWS_PER_PAGE rows. The first page is the `result` of the import_preview
+    itself, the further pages are import_previews whose `result` references it by
+    `preview_id`. The rows of a page are unpacked in the database, so they can be
+    read in pages, streamed or updated without loading all of them at once.
+    """
+
+    ROWS_PER_PAGE = 1000
+
+    def __init__(self, datastore: Database, store_id: int) -> None:
+        self.datastore = datastore
+        self.store_id = store_id
+        self.header: dict[str, Any] | None = None
+
+    @classmethod
+    def create(
+        cls,
+        datastore: Database,
+        user_id: int,
+        name: str,
+        state: ImportState,
+        rows: list[dict[str, Any]],
+        meeting_id: int | None = None,
+    ) -> int:
+        """Writes the rows into a new import_preview and returns its id."""
+        pages = [
+            rows[index : index + cls.ROWS_PER_PAGE]
+            for index in range(0, len(rows), cls.ROWS_PER_PAGE)
+        ] or [[]]
+        store_id, *page_ids = datastore.reserve_ids("import_preview", len(pages))
+        result: dict[str, Any] = {"rows": pages[0]}
+        if meeting_id is not None:
+            result["meeting_id"] = meeting_id
+        if page_ids:
+            result["page_ids"] = page_ids
+            result["page_size"] = cls.ROWS_PER_PAGE
+            result["rows_count"] = len(rows)
+        fields = {
+            "name": name,
+            "state": state,
+            "created": datetime.now(ZoneInfo("UTC")),
+        }
+        datastore.write(
+            WriteRequest(
+                events=[
+                    Event(
+                        type=EventType.Create,
+                        fqid=fqid_from_collection_and_id("import_preview", id_),
+                        fields={"id": id_, **fields, "result": Jsonb(page_result)},
+                    )
+                    for id_, page_result in [
+                        (store_id, result),
+                        *(
+                            (page_id, {"rows": page, "preview_id": store_id})
+                            for page_id, page in zip(page_ids, pages[1:])
+                        ),
+                    ]
+                ],
+                user_id=user_id,
+                locked_fields={},
+            )
+        )
+        return store_id
+
+    def get_info(self) -> dict[str, Any]:
+        """Returns name, state, meeting_id and rows_count without the rows."""
+        header = self.get_header()
+        return {
+            field: header[field]
+            for field in ("name", "state", "meeting_id", "rows_count")
+        }
+
+    def get_header(self) -> dict[str, Any]:
+        if self.header is None:
+            result = self.datastore.execute_custom_select(
+                sql.SQL("""name, state, result->'meeting_id' AS meeting_id,
+                    COALESCE(
+                        (result->>'rows_count')::int,
+                        jsonb_array_length(COALESCE(result->'rows', '[]'))
+                    ) AS rows_count,
+                    COALESCE(result->'page_ids', '[]') AS page_ids,
+                    (result->>'page_size')::int AS page_size
+                    FROM import_preview
+                    WHERE id = %s AND result->'preview_id' IS NULL"""),
+                arguments=[self.store_id],
+            )
+            if not result:
+                raise ModelDoesNotExist(
+                    fqid_from_collection_and_id("import_preview", self.store_id)
+                )
+            self.header = result[0]
+        return self.header
+
+    def get_page_ids(self) -> list[int]:
+        return [self.store_id, *self.get_header()["page_ids"]]
+
+    def get_position(self, index: int) -> tuple[int, int]:
+        """Returns the index of the page of the row and its index in the page."""
+        if page_size := self.get_header()["page_size"]:
+            return divmod(index, page_size)
+        return 0, index
+
+    def get_rows(self, start: int, count: int) -> list[ImportRow]:
+        rows: list[ImportRow] = []
+        page_index, offset = self.get_position(start)
+        for page_id in self.get_page_ids()[page_index:]:
+            if len(rows) >= count:
+                break
+            rows.extend(
+                row["row_data"]
+                for row in self.datastore.execute_custom_select(
+                    self.get_rows_query() + sql.SQL(" LIMIT %s OFFSET %s"),
+                    arguments=[page_id, count - len(rows), offset],
+                )
+            )
+            offset = 0
+        return rows
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[list[ImportRow]]:
+        for page_id in self.get_page_ids():
+            for rows in self.datastore.stream_custom_select(
+                self.get_rows_query(), [page_id], batch_size
+            ):
+                yield [row["row_data"] for row in rows]
+
+    def update_rows(self, rows: dict[int, ImportRow], user_id: int) -> None:
+        """
+        Replaces the rows at the given indices. Only the pages of these rows are
+        read and written.
+        """
+        rows_per_page: dict[int, dict[int, ImportRow]] = defaultdict(dict)
+        page_ids = self.get_page_ids()
+        for index, row in rows.items():
+            if not 0 <= index < self.get_header()["rows_count"]:
+                raise ActionException(
+                    f"Row {index} does not exist in import_preview/{self.store_id}."
+                )
+            page_index, offset = self.get_position(index)
+            rows_per_page[page_ids[page_index]][offset] = row
+        results = self.datastore.get_many(
+            [GetManyRequest("import_preview", list(rows_per_page), ["result"])],
+            lock_result=False,
+            use_changed_models=False,
+        )["import_preview"]
+        events: list[Event] = []
+        for page_id, page_rows in rows_per_page.items():
+            result = results[page_id]["result"]
+            for offset, row in page_rows.items():
+                result["rows"][offset] = row
+            events.append(
+                Event(
+                    type=EventType.Update,
+                    fqid=fqid_from_collection_and_id("import_preview", page_id),
+                    fields={"result": Jsonb(result)},
+                )
+            )
+        self.datastore.write(
+            WriteRequest(events=events, user_id=user_id, locked_fields={})
+        )
+
+    def delete(self, user_id: int) -> None:
+        """Deletes the import_preview together with its pages."""
+        self.datastore.write(
+            WriteRequest(
+                events=[
+                    Event(
+                        type=EventType.Delete,
+                        fqid=fqid_from_collection_and_id("import_preview", page_id),
+                    )
+                    for page_id in self.get_page_ids()
+                ],
+                user_id=user_id,
+                locked_fields={},
+            )
+        )
+
+    @staticmethod
+    def get_rows_query() -> sql.Composed:
+        return sql.Composed([sql.SQL("""row_data FROM import_preview,
+                    jsonb_array_elements(result->'rows')
+                    WITH ORDINALITY AS elements(row_data, row_index)
+                    WHERE id = %s ORDER BY row_index""")])
+
+
 class BaseImportJsonUploadAction(SingularActionMixin, Action):
     import_name: str
 
@@ -203,16 +402,17 @@ class BaseImportAction(BaseImportJsonUploadAction):
     )
 
     rows: list[ImportRow]
-    result: dict[str, list]
+    result: dict[str, Any]
     import_state = ImportState.DONE
+    store: ImportPreviewStore
+    # if set, update_instance reads the rows in batches via iter_row_batches,
+    # otherwise all rows are loaded into self.rows before
+    read_rows_in_batches = False
 
     def prefetch(self, action_data: ActionData) -> None:
         store_id = cast(list[dict[str, Any]], action_data)[0]["id"]
-        import_preview = self.datastore.get(
-            fqid_from_collection_and_id("import_preview", store_id),
-            ["result", "state", "name"],
-            lock_result=False,
-        )
+        self.store = ImportPreviewStore(self.datastore, store_id)
+        import_preview = self.store.get_info()
         if import_preview.get("name") != self.import_name:
             raise ActionException(
                 f"Wrong id doesn't point on {self.import_name} import data."
@@ -223,14 +423,26 @@ class BaseImportAction(BaseImportJsonUploadAction):
             )
         if import_preview.get("state") == ImportState.ERROR:
             raise ActionException("Error in import. Data will not be imported.")
-        self.result = import_preview.get("result", {})
-        self.rows = self.result.get("rows", [])
+        self.result = {"meeting_id": import_preview["meeting_id"]}
+        self.rows = []
 
     def base_update_instance(self, instance: dict[str, Any]) -> dict[str, Any]:
+        if not (instance["import"] and self.read_rows_in_batches):
+            for _ in self.iter_row_batches():
+                pass
         if not instance["import"]:
             return {}
         return super().base_update_instance(instance)
 
+    def iter_row_batches(self) -> Iterator[list[ImportRow]]:
+        """
+        Yields the rows of the import preview in batches. The rows are collected
+        in self.rows, since they are returned in the action result.
+        """
+        for rows in self.store.iter_rows():
+            self.rows.extend(rows)
+            yield rows
+
     def handle_relation_updates(self, instance: dict[str, Any]) -> Any:
         return {}
 
@@ -317,16 +529,19 @@ class BaseImportAction(BaseImportJsonUploadAction):
     def flatten_copied_object_fields(
         self,
         hook_method: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+        rows: list[ImportRow] | None = None,
     ) -> list[ImportRow]:
-        """The self.rows will be deepcopied, flattened and returned, without
-        changes on the self.rows.
+        """The rows (default: self.rows) will be deepcopied, flattened and
+        returned, without changes on the given rows.
         This is necessary for using the data in the execution of actions.
         The requests response should be given with the unchanged self.rows.
         Parameter:
         hook_method:
            Method to get an entry dict[str,Any] and return it modified
+        rows:
+           A batch of the rows, see iter_row_batches
         """
-        rows = copy.deepcopy(self.rows)
+        rows = copy.deepcopy(self.rows if rows is None else rows)
         for row in rows:
             entry = row["data"]
             if hook_method:
@@ -354,20 +569,7 @@ class BaseImportAction(BaseImportJsonUploadAction):
                 store_id = instance["id"]
                 if self.import_state == ImportState.ERROR:
                     continue
-                self.datastore.write(
-                    WriteRequest(
-                        events=[
-                            Event(
-                                type=EventType.Delete,
-                                fqid=fqid_from_collection_and_id(
-                                    "import_preview", store_id
-                                ),
-                            )
-                        ],
-                        user_id=self.user_id,
-                        locked_fields={},
-                    )
-                )
+                ImportPreviewStore(self.datastore, store_id).delete(self.user_id)
 
         return on_success
 
@@ -407,30 +609,13 @@ class BaseJsonUploadAction(BaseImportJsonUploadAction):
             self.import_state = ImportState.DONE
 
     def store_rows_in_the_import_preview(self, import_name: str) -> None:
-        self.new_store_id = self.datastore.reserve_id(collection="import_preview")
-        fqid = fqid_from_collection_and_id("import_preview", self.new_store_id)
-        time_created = datetime.now(ZoneInfo("UTC"))
-        result: dict[str, list[dict[str, Any]] | int] = {"rows": self.rows}
-        if hasattr(self, "meeting_id"):
-            result["meeting_id"] = self.meeting_id
-        self.datastore.write(
-            WriteRequest(
-                events=[
-                    Event(
-                        type=EventType.Create,
-                        fqid=fqid,
-                        fields={
-                            "id": self.new_store_id,
-                            "name": import_name,
-                            "result": Jsonb(result),
-                            "created": time_created,
-                            "state": self.import_state,
-                        },
-                    )
-                ],
-                user_id=self.user_id,
-                locked_fields={},
-            )
+        self.new_store_id = ImportPreviewStore.create(
+            self.datastore,
+            self.user_id,
+            import_name,
+            self.import_state,
+            self.rows,
+            self.meeting_id if hasattr(self, "meeting_id") else None,
         )
 
     def handle_relation_updates(self, instance: dict[str, Any]) -> Any:
@@ -32,6 +32,7 @@ class RelationManager:
         assert "id" in instance
 
         relations: RelationUpdates = {}
+        handlers: list[SingleRelationHandler] = []
         for field_name in instance:
             if not model.has_field(field_name):
                 continue
@@ -41,13 +42,16 @@ class RelationManager:
             if not isinstance(field, BaseRelationField):
                 continue
 
-            handler = SingleRelationHandler(
-                self.datastore,
-                field,
-                field_name,
-                instance,
+            handlers.append(
+                SingleRelationHandler(
+                    self.datastore,
+                    field,
+                    field_name,
+                    instance,
+                )
             )
-            result = handler.perform()
+        # all relation fields of the instance are resolved with batched reads
+        for result in SingleRelationHandler.perform_batch(self.datastore, handlers):
             for fqfield, relations_element in result.items():
                 self.process_relation_element(fqfield, relations_element, relations)
 
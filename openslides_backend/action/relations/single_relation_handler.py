@@ -11,7 +11,7 @@ from ...models.fields import (
     RelationField,
     RelationListField,
 )
-from ...services.database.interface import Database, PartialModel
+from ...services.database.interface import Database, MappedFieldsPerFqid, PartialModel
 from ...shared.exceptions import ActionException
 from ...shared.patterns import (
     Collection,
@@ -51,13 +51,15 @@ class SingleRelationHandler:
         self.field_name = field_name
         self.instance = instance
         self.chained_fqids: list[FullQualifiedId] = []
+        self.add: set[FullQualifiedId] = set()
+        self.remove: set[FullQualifiedId] = set()
 
     def get_reverse_field(self, collection: Collection) -> BaseRelationField:
         """
         Returns the reverse field of this relation field for the given collection.
         """
         related_name = self.field.to[collection]
-        field = model_registry[collection]().get_field(related_name)
+        field = model_registry[collection].get_field(related_name)
         assert isinstance(field, BaseRelationField)
         return field
 
@@ -98,6 +100,70 @@ class SingleRelationHandler:
         Main method of this handler. It calculates which relation fields have to be updated
         according to the changes in self.field.
         """
+        return self.perform_batch(self.datastore, [self])[0]
+
+    @classmethod
+    def perform_batch(
+        cls, datastore: Database, handlers: list["SingleRelationHandler"]
+    ) -> list[RelationFieldUpdates]:
+        """
+        Performs all given handlers together and returns their results in the same
+        order. The current values of the own models and the related models of all
+        handlers are each read with one request per collection. The handlers of
+        chained fqids are resolved together in the next pass.
+        """
+        if not handlers:
+            return []
+        current_fields: MappedFieldsPerFqid = defaultdict(list)
+        for handler in handlers:
+            current_fields[handler.own_fqid].append(handler.field_name)
+        current_models = datastore.get_by_fqids(
+            current_fields, use_changed_models=False
+        )
+
+        related_fields: MappedFieldsPerFqid = defaultdict(list)
+        for handler in handlers:
+            related_names = handler.prepare(current_models.get(handler.own_fqid, {}))
+            for fqid, related_name in related_names.items():
+                if related_name not in related_fields[fqid]:
+                    related_fields[fqid].append(related_name)
+        related_models = (
+            datastore.get_by_fqids(related_fields) if related_fields else {}
+        )
+
+        results = [handler.calculate_updates(related_models) for handler in handlers]
+        chained_handlers = [
+            [
+                handler.build_handler_from_chained_fqid(fqid)
+                for fqid in handler.chained_fqids
+            ]
+            for handler in handlers
+        ]
+        chained_results = iter(
+            cls.perform_batch(
+                datastore,
+                [
+                    chained
+                    for chained_list in chained_handlers
+                    for chained in chained_list
+                ],
+            )
+        )
+        for result, chained_list in zip(results, chained_handlers):
+            for _ in chained_list:
+                result.update(next(chained_results))
+        return results
+
+    @property
+    def own_fqid(self) -> FullQualifiedId:
+        return fqid_from_collection_and_id(self.model.collection, self.id)
+
+    def prepare(self, current_obj: PartialModel) -> dict[FullQualifiedId, str]:
+        """
+        Calculates the fqids which have to be added/removed by comparing the new value
+        of our field with the current value from the given model. Returns the related
+        name to read for each changed fqid.
+        """
         # Prepare the new value of our field and the real field name of the reverse field.
         value = self.instance.get(self.field_name)
         rel_ids = transform_to_fqids(value, self.field.get_target_collection())
@@ -106,33 +172,41 @@ class SingleRelationHandler:
 
         # calculated the fqids which have to be added/remove and partition them by collection
         # since every collection might have a different related field
-        add, remove = self.relation_diffs(rel_ids)
-        changed_fqids = list(add | remove)
+        self.add, self.remove = self.relation_diffs(rel_ids, current_obj)
+        for collection in self.partition_by_collection(self.add | self.remove):
+            if collection not in self.field.to:
+                raise ActionException(
+                    f"The collection '{collection}' is not available for field '{self.field.own_field_name}' in collection '{self.field.own_collection}'."
+                )
+        return {
+            fqid: self.get_related_name(collection_from_fqid(fqid))
+            for fqid in self.add | self.remove
+        }
+
+    def calculate_updates(
+        self, related_models: dict[FullQualifiedId, PartialModel]
+    ) -> RelationFieldUpdates:
+        """
+        Calculates the updates of the related fields from the prepared add/remove sets
+        and the given related models.
+        """
+        changed_fqids = list(self.add | self.remove)
 
-        add_per_collection = self.partition_by_collection(add)
-        remove_per_collection = self.partition_by_collection(remove)
+        add_per_collection = self.partition_by_collection(self.add)
+        remove_per_collection = self.partition_by_collection(self.remove)
         changed_fqids_per_collection = self.partition_by_collection(changed_fqids)
 
         final = {}
         for collection in list(add_per_collection.keys()) + list(
             remove_per_collection.keys()
         ):
-            if collection not in self.field.to:
-                raise ActionException(
-                    f"The collection '{collection}' is not available for field '{self.field.own_field_name}' in collection '{self.field.own_collection}'."
-                )
-
             related_name = self.get_related_name(collection)
             related_field = self.get_reverse_field(collection)
 
-            # acquire all related models with the related fields
+            # take all related models with the related fields
             rels: dict[FullQualifiedId, PartialModel] = defaultdict(dict)
             for fqid in changed_fqids_per_collection[collection]:
-                related_model = self.datastore.get(
-                    fqid,
-                    [related_name],
-                    raise_exception=False,
-                )
+                related_model = related_models.get(fqid, {})
                 # again, we transform everything to lists of fqids
                 rels[fqid][related_name] = transform_to_fqids(
                     related_model.get(related_name), self.model.collection
@@ -168,26 +242,23 @@ class SingleRelationHandler:
                         rel_update["value"] = current_value[0]
 
             final.update(result)
-
-        for fqid in self.chained_fqids:
-            handler = self.build_handler_from_chained_fqid(fqid)
-            result = handler.perform()
-            final.update(result)
         return final
 
     def build_handler_from_chained_fqid(
         self, fqid: FullQualifiedId
     ) -> "SingleRelationHandler":
+        """
+        The chained model is taken from our relation, so its relation field is
+        removed. Its current value is read by the next pass of perform_batch.
+        """
         collection = collection_from_fqid(fqid)
         field_name = self.get_related_name(collection)
         field = self.get_reverse_field(collection)
-        instance = self.datastore.get(fqid, ["id", field_name])
-        instance[field_name] = None
         return SingleRelationHandler(
             self.datastore,
             field,
             field_name,
-            instance,
+            {"id": id_from_fqid(fqid), field_name: None},
         )
 
     def partition_by_collection(
@@ -205,23 +276,17 @@ class SingleRelationHandler:
         return self.field.to[collection]
 
     def relation_diffs(
-        self, rel_fqids: list[FullQualifiedId]
+        self, rel_fqids: list[FullQualifiedId], current_obj: PartialModel
     ) -> tuple[set[FullQualifiedId], set[FullQualifiedId]]:
         """
         Returns two sets of relation object ids. One with relation objects
         where object should be added and one with relation objects where it
         should be removed.
+        We have to compare with the current datastore state, which is given
+        as current_obj.
         """
         add: set[FullQualifiedId]
         remove: set[FullQualifiedId]
-        # We have to compare with the current datastore state.
-        # Retrieve current object from datastore
-        current_obj = self.datastore.get(
-            fqid_from_collection_and_id(self.model.collection, self.id),
-            [self.field_name],
-            use_changed_models=False,
-            raise_exception=False,
-        )
 
         # Get current ids from relation field
         current_value = current_obj.get(self.field_name)
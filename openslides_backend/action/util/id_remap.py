@@ -0,0 +1,180 @@
+import re
+from collections.abc import Callable, Iterable
+from enum import Enum
+from functools import cache
+from typing import Any
+
+from ...models.base import model_registry
+from ...models.fields import (
+    BaseGenericRelationField,
+    BaseRelationField,
+    GenericRelationField,
+    GenericRelationListField,
+    RelationField,
+    RelationListField,
+)
+from ...shared.exceptions import ActionException
+from ...shared.patterns import (
+    EXTENSION_REFERENCE_IDS_PATTERN,
+    KEYSEPARATOR,
+    Collection,
+    collection_and_id_from_fqid,
+    fqid_from_collection_and_id,
+)
+
+ReplaceMap = dict[Collection, dict[int, int]]
+
+# fields which are emptied instead of remapped, since they are calculated anew
+CLEARED_FIELDS = {"meeting": ["user_ids"], "user": ["meeting_ids"]}
+
+# fields which contain references to motions in their text
+EXTENSION_FIELDS = {"motion": ["recommendation_extension", "state_extension"]}
+
+
+class RemapKind(str, Enum):
+    PLAIN = "plain"
+    ID = "id"
+    CLEARED = "cleared"
+    EXTENSION = "extension"
+    RELATION = "relation"
+    RELATION_LIST = "relation_list"
+    GENERIC = "generic"
+    GENERIC_LIST = "generic_list"
+
+
+# kind and target collection per field
+RemapPlan = dict[str, tuple[RemapKind, Collection | None]]
+
+
+@cache
+def compile_remap_plan(
+    collection: Collection, allowed_collections: frozenset[Collection]
+) -> RemapPlan:
+    """
+    Returns how the ids in each field of the collection are replaced. Relations
+    which can only point to collections outside of the allowed collections are
+    kept as they are.
+    """
+    plan: RemapPlan = {}
+    for field in model_registry[collection].get_fields():
+        field_name = field.get_own_field_name()
+        kind = RemapKind.PLAIN
+        target: Collection | None = None
+        if isinstance(field, BaseRelationField) and not isinstance(
+            field, BaseGenericRelationField
+        ):
+            if all(c not in allowed_collections for c in field.to):
+                plan[field_name] = (kind, target)
+                continue
+        if field_name == "id":
+            kind = RemapKind.ID
+        elif field_name in CLEARED_FIELDS.get(collection, []):
+            kind = RemapKind.CLEARED
+        elif field_name in EXTENSION_FIELDS.get(collection, []):
+            kind = RemapKind.EXTENSION
+        elif isinstance(field, RelationField):
+            kind = RemapKind.RELATION
+            target = field.get_target_collection()
+        elif isinstance(field, RelationListField):
+            kind = RemapKind.RELATION_LIST
+            target = field.get_target_collection()
+        elif isinstance(field, GenericRelationField):
+            kind = RemapKind.GENERIC
+        elif isinstance(field, GenericRelationListField):
+            kind = RemapKind.GENERIC_LIST
+        plan[field_name] = (kind, target)
+    return plan
+
+
+@cache
+def get_relation_list_fields(collection: Collection) -> frozenset[str]:
+    return frozenset(
+        field.get_own_field_name()
+        for field in model_registry[collection].get_fields()
+        if isinstance(field, RelationListField)
+    )
+
+
+def remap_ids(
+    collection: Collection,
+    entries: Iterable[dict[str, Any]],
+    replace_map: ReplaceMap,
+    allowed_collections: Iterable[Collection],
+) -> None:
+    """
+    Replaces the ids of the entries and of all their relations to the allowed
+    collections with the ids of the replace map. The plan of the collection is
+    applied field by field over all entries.
+    """
+    allowed = frozenset(allowed_collections)
+    plan = compile_remap_plan(collection, allowed)
+    entries = list(entries)
+    fields: dict[str, None] = {}
+    for entry in entries:
+        fields.update(dict.fromkeys(entry))
+    for field in fields:
+        if field not in plan:
+            raise ActionException(f"{collection}/{field} is not allowed.")
+    for field in fields:
+        kind, target = plan[field]
+        if replace := get_replace_function(
+            kind, target or collection, replace_map, allowed
+        ):
+            for entry in entries:
+                if field in entry:
+                    entry[field] = replace(entry[field])
+
+
+def get_replace_function(
+    kind: RemapKind,
+    target: Collection,
+    replace_map: ReplaceMap,
+    allowed_collections: frozenset[Collection],
+) -> Callable[[Any], Any] | None:
+    """Returns the function which replaces the ids in a value of the given kind."""
+    ids = replace_map.get(target, {})
+
+    def replace_fqid(fqid: str) -> str:
+        collection, id_ = collection_and_id_from_fqid(fqid)
+        if collection not in allowed_collections:
+            return fqid
+        return collection + KEYSEPARATOR + str(replace_map[collection][id_])
+
+    def replace_reference(match: re.Match[str]) -> str:
+        collection, id_ = collection_and_id_from_fqid(match.group("fqid"))
+        new_id = replace_map[collection][id_]
+        return f"[{fqid_from_collection_and_id(collection, new_id)}]"
+
+    def replace_id(value: int) -> int:
+        return ids[value]
+
+    def clear(value: Any) -> None:
+        return None
+
+    def replace_extension(value: str | None) -> str | None:
+        if not value:
+            return value
+        return EXTENSION_REFERENCE_IDS_PATTERN.sub(replace_reference, value)
+
+    def replace_relation(value: int | None) -> int | None:
+        return ids[value] if value else value
+
+    def replace_relation_list(value: list[int] | None) -> list[int]:
+        return [ids[id_] for id_ in value or []]
+
+    def replace_generic(value: str | None) -> str | None:
+        return replace_fqid(value) if value else value
+
+    def replace_generic_list(value: list[str] | None) -> list[str]:
+        return [replace_fqid(fqid) for fqid in value or []]
+
+    return {
+        RemapKind.PLAIN: None,
+        RemapKind.ID: replace_id,
+        RemapKind.CLEARED: clear,
+        RemapKind.EXTENSION: replace_extension,
+        RemapKind.RELATION: replace_relation,
+        RemapKind.RELATION_LIST: replace_relation_list,
+        RemapKind.GENERIC: replace_generic,
+        RemapKind.GENERIC_LIST: replace_generic_list,
+    }[kind]
@@ -1,5 +1,7 @@
-from collections.abc import Iterable
+import logging
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 import simplejson as json
 from werkzeug.wrappers import Response
@@ -15,6 +17,7 @@ from ..services.auth.interface import AUTHENTICATION_HEADER
 from ..shared.env import is_truthy
 from ..shared.exceptions import ActionException, ViewException
 from ..shared.interfaces.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
+from ..shared.json_stream import StreamedObject, get_json_response_body
 from .http_exceptions import (
     BadRequest,
     Forbidden,
@@ -101,6 +104,13 @@ class OpenSlidesBackendWSGIApplication(WSGIApplication):
         view_instance = self.view(self.env, self.logging, self.services)
         try:
             response_body, access_token = view_instance.dispatch(request)
+            try:
+                # encodes the first chunk of streamed results, so that their
+                # errors are answered like the ones of the other results
+                body = get_json_response_body(response_body)
+            except BaseException:
+                self.close_streamed_results(response_body)
+                raise
         except ViewException as exception:
             env_var = self.env.OPENSLIDES_BACKEND_RAISE_4XX
             if is_truthy(env_var):
@@ -131,18 +141,47 @@ class OpenSlidesBackendWSGIApplication(WSGIApplication):
         else:
             raise ViewException(f"Unknown type of response_body: {response_body}.")
 
-        self.logger.debug(
-            f"All done. Application sends HTTP {status_code} with body {response_body}."
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            if isinstance(body, bytes):
+                # streamed results are already encoded into the body here
+                self.logger.debug(
+                    f"All done. Application sends HTTP {status_code} with body {body.decode()}."
+                )
+            else:
+                self.logger.debug(
+                    f"All done. Application streams HTTP {status_code} response body."
+                )
+        # large bodies, e.g. of an exported meeting, are streamed in chunks
         response = Response(
-            json.dumps(response_body),
+            body if isinstance(body, bytes) else self.abort_on_error(body),
             status=status_code,
             content_type="application/json",
         )
+        # release the resources of streamed results if sending is aborted
+        response.call_on_close(lambda: self.close_streamed_results(response_body))
         if access_token is not None:
             response.headers[AUTHENTICATION_HEADER] = access_token
         return response
 
+    def close_streamed_results(self, response_body: Any) -> None:
+        if isinstance(response_body, list):
+            for result in response_body:
+                if isinstance(result, StreamedObject):
+                    result.close()
+
+    def abort_on_error(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """
+        Errors while streaming the rest of a response body cannot be answered
+        anymore, since the status was already sent. They are raised to the WSGI
+        server, which aborts the connection instead of ending the body properly.
+        """
+        try:
+            yield from chunks
+        except Exception as e:
+            self.logger.error("Streaming of the response body failed.")
+            self.logger.exception(e)
+            raise
+
     def wsgi_application(
         self, environ: WSGIEnvironment, start_response: StartResponse
     ) -> Iterable[bytes]:
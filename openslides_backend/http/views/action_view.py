@@ -8,7 +8,8 @@ from ...i18n.translator import Translator
 from ...migrations.migration_helper import MigrationHelper
 from ...migrations.migration_manager import MigrationManager
 from ...services.auth.interface import AUTHENTICATION_HEADER, COOKIE_NAME
-from ...services.postgresql.db_connection_handling import get_new_os_conn
+from ...services.database.write_scheduler import write_scheduler
+from ...services.postgresql.preflight_cache import preflight_cache
 from ...shared.env import DEV_PASSWORD
 from ...shared.exceptions import AuthenticationException, ServerError
 from ...shared.interfaces.wsgi import RouteResponse
@@ -32,11 +33,8 @@ class ActionView(BaseView):
     def action_route(self, request: Request) -> RouteResponse:
         self.logger.debug("Start dispatching action request.")
 
-        with get_new_os_conn() as conn:
-            with conn.cursor() as curs:
-                MigrationHelper.assert_migration_index(curs)
-                curs.execute("SELECT default_language FROM organization_t WHERE id = 1")
-                lang: str | None = (curs.fetchone() or {}).get("default_language")
+        MigrationHelper.assert_cached_migration_index()
+        lang = preflight_cache.get_default_language()
         # Get user id.
         user_id, access_token = self.get_user_id_from_headers(
             request.headers, request.cookies
@@ -62,9 +60,7 @@ class ActionView(BaseView):
     def internal_action_route(self, request: Request) -> RouteResponse:
         self.logger.debug("Start dispatching internal action request.")
 
-        with get_new_os_conn() as conn:
-            with conn.cursor() as curs:
-                MigrationHelper.assert_migration_index(curs)
+        MigrationHelper.assert_cached_migration_index()
         self.check_internal_auth_password(request)
 
         handler = ActionHandler(self.env, self.services, self.logging)
@@ -92,6 +88,10 @@ class ActionView(BaseView):
     def info_route(self, request: Request) -> RouteResponse:
         return {"healthinfo": {"actions": dict(ActionHandler.get_health_info())}}, None
 
+    @route("metrics", method="GET", json=False)
+    def metrics_route(self, request: Request) -> RouteResponse:
+        return {"metrics": {"write": write_scheduler.get_metrics()}}, None
+
     @route("version", method="GET", json=False)
     def version_route(self, _: Request) -> RouteResponse:
         with open(VERSION_PATH) as file:
@@ -268,7 +268,7 @@ class MigrationHandler(BaseHandler):
                     result["max"],
                 )
             # update sequential_numbers.
-            if model_registry[collection]().try_get_field("sequential_number"):
+            if model_registry[collection].try_get_field("sequential_number"):
                 results = self.cursor.execute(
                     sql.SQL(
                         "SELECT MAX(sequential_number), meeting_id FROM {table} GROUP BY meeting_id;"
@@ -15,6 +15,10 @@ from openslides_backend.models.base import model_registry
 from openslides_backend.services.postgresql.db_connection_handling import (
     get_new_os_conn,
 )
+from openslides_backend.services.postgresql.preflight_cache import (
+    notify_preflight_change,
+    preflight_cache,
+)
 
 from ..shared.exceptions import ActionException
 
@@ -217,7 +221,20 @@ class MigrationHelper:
         """
         Asserts that backend and database migration indices are identical.
         """
-        database_migration_index = MigrationHelper.get_database_migration_index(curs)
+        MigrationHelper.check_migration_index(
+            MigrationHelper.get_database_migration_index(curs)
+        )
+
+    @staticmethod
+    def assert_cached_migration_index() -> None:
+        """
+        Asserts that the backend migration index is identical to the database
+        migration index of the preflight cache.
+        """
+        MigrationHelper.check_migration_index(preflight_cache.get_migration_index())
+
+    @staticmethod
+    def check_migration_index(database_migration_index: int) -> None:
         backend_migration_index = MigrationHelper.get_backend_migration_index()
 
         if backend_migration_index > database_migration_index:
@@ -260,6 +277,7 @@ class MigrationHelper:
             updates=sql.SQL(", ").join(updates),
         )
         curs.execute(statement, tuple(params.values()))
+        notify_preflight_change(curs.connection)
         curs.connection.commit()
 
     @staticmethod
@@ -358,7 +376,7 @@ class MigrationHelper:
                 "view": col + "vm",
                 "im_tables": [
                     field.write_fields[0]
-                    for field in model_registry[col]().get_relation_fields()
+                    for field in model_registry[col].get_relation_fields()
                     if field.write_fields
                 ],
             }
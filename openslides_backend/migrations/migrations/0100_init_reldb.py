@@ -1,8 +1,10 @@
 import os
+import resource
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
 from json import dumps as json_dumps
-from math import ceil
+from time import time
 from typing import Any, cast
 from zoneinfo import ZoneInfo
 
@@ -90,51 +92,73 @@ class Sql_helper:
         Helper class containing multiple functions to make sql handling easier.
     """
 
-    offset: int = 0
-    LIMIT: int = 100
+    last_fqid: str = ""
+    LIMIT: int = 1000
+    INTERMEDIATE_BATCH_SIZE: int = 10000
     cursor: Cursor[DictRow]
 
     @staticmethod
     def get_row_count() -> int:
         """
         Purpose:
-            Returns the number of rows in the DB table models.
+            Returns the number of not deleted rows in the DB table models.
         Returns:
         - integer : number of fqid in sql models table
         """
-        Sql_helper.cursor.execute("SELECT COUNT(fqid) FROM models;")
+        Sql_helper.cursor.execute("SELECT COUNT(fqid) FROM models WHERE deleted='f';")
         result = Sql_helper.cursor.fetchone()
         return (result.get("count", 0)) if result else 0
 
     # END OF FUNCTION
 
     @staticmethod
-    def raise_offset() -> None:
+    def get_next_data_row_chunk() -> list[dict[str, Any]]:
         """
         Purpose:
-            Raises Sql_helper.offset by LIMIT
+            Fetches the next data chunk from sql models table depending on Sql_helper.LIMIT.
+            Uses keyset pagination on the fqid, so every chunk is read via the primary key
+            index instead of skipping all previous rows.
+            Also remembers the last fqid of the chunk as start of the next one.
+        Returns:
+            - data_rows: fetched sql table data rows, empty if all rows were read
         """
-        Sql_helper.offset += Sql_helper.LIMIT
+
+        Sql_helper.cursor.execute(
+            "SELECT fqid, data FROM models WHERE deleted='f' AND fqid > %s ORDER BY fqid LIMIT %s;",
+            (Sql_helper.last_fqid, Sql_helper.LIMIT),
+        )
+        data_rows = Sql_helper.cursor.fetchall()
+        if data_rows:
+            Sql_helper.last_fqid = data_rows[-1]["fqid"]
+        return data_rows
 
     # END OF FUNCTION
 
     @staticmethod
-    def get_next_data_row_chunk() -> list[dict[str, Any]]:
+    def copy_rows(table_name: str, columns: tuple[str, ...], rows: list[Any]) -> None:
         """
         Purpose:
-            Fetches the next data chunk from sql models table depending on Sql_helper.limit and Sql_helper.offset.
-            Also raises the offset after getting the chunk.
-        Returns:
-            - data_rows: fetched sql table data rows as tuple
+            Writes the rows into the table with a single COPY FROM STDIN.
+        Input:
+            - table_name: name of the target table
+            - columns: names of the columns in the order of the row values
+            - rows: list of rows, each one a sequence of psycopg friendly values
         """
+        with Sql_helper.cursor.copy(
+            f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+        ) as copy:
+            for row in rows:
+                copy.write_row(row)
 
-        Sql_helper.cursor.execute(
-            f"SELECT fqid, data FROM models WHERE deleted='f' ORDER BY fqid LIMIT {str(Sql_helper.LIMIT)} OFFSET {str(Sql_helper.offset)};"
-        )
-        data_rows = Sql_helper.cursor.fetchall()
-        assert data_rows is not None, "No data was found in sql table models"
-        Sql_helper.raise_offset()
-        return data_rows
+    # END OF FUNCTION
+
+    @staticmethod
+    def get_max_memory_usage() -> float:
+        """
+        Purpose:
+            Returns the peak memory usage of this process in MiB.
+        """
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
 
     # END OF FUNCTION
 
@@ -186,19 +210,19 @@ class Sql_helper:
     # END OF FUNCTION
 
     @staticmethod
-    def get_insert_intermediate_t_commands(
+    def get_intermediate_t_rows(
         field: Field, data: dict[str, Any]
-    ) -> list[tuple[str, list[Any]]]:
+    ) -> tuple[tuple[str, str, str], list[tuple[Any, Any]]]:
         """
         Purpose:
-            Parses the dictionary data into a sql friendly string format.
+            Collects the rows of the intermediate table for the relation list field.
         Input:
             - field: field that will be checked for relational dependencies
             - data: dictionary containing the data of the collection
         Returns:
-            - insert_intermediate_t_commands: list containing one or several insert_intermediate_t_commands built during the method
+            - target: tuple of the intermediate table name and its two column names
+            - rows: list containing one row per related id
         """
-        insert_intermediate_t_commands: list = []
         values: Any
         collection_id: str
         intermediate_table: str
@@ -216,16 +240,25 @@ class Sql_helper:
 
         intermediate_table = HelperGetNames.get_table_name(intermediate_table, True)
 
-        # 1) Add sql command
-        for data_item in values:
-            insert_intermediate_t_commands.append(
-                (
-                    f"INSERT INTO {intermediate_table} ({field1}, {field2}) VALUES (%s, %s);",
-                    [collection_id, data_item],
-                )
-            )
+        return (intermediate_table, field1, field2), [
+            (collection_id, data_item) for data_item in values
+        ]
 
-        return insert_intermediate_t_commands
+    # END OF FUNCTION
+
+    @staticmethod
+    def flush_intermediate_t_rows(
+        intermediate_t_rows: dict[tuple[str, str, str], list[tuple[Any, Any]]],
+    ) -> None:
+        """
+        Purpose:
+            Writes all collected intermediate table rows and empties the collection.
+        Input:
+            - intermediate_t_rows: rows per intermediate table and its column names
+        """
+        for (table_name, field1, field2), rows in intermediate_t_rows.items():
+            Sql_helper.copy_rows(table_name, (field1, field2), rows)
+        intermediate_t_rows.clear()
 
     # END OF FUNCTION
 
@@ -286,32 +319,36 @@ class Migration(BaseMigration):
     def data_manipulation(curs: Cursor[DictRow]) -> None:
         """
         Purpose:
-            Iterates over chunks of the DB table models and writes the data into the respective DB tables
+            Iterates over chunks of the DB table models and writes the data into the respective DB tables.
+            Each chunk is written with one COPY per table and column set. The rows of the
+            intermediate tables are collected and written in batches of bounded size.
         """
         Sql_helper.cursor = curs
+        Sql_helper.last_fqid = ""
 
         data_chunk: list[dict[str, Any]]
         collection: str
         table_name: str
         data: dict[str, Any]
-        model: Model
-        insert_intermediate_t_commands: list
-        sql_fields: str
+        model: type[Model]
+        chunk_rows: dict[tuple[str, tuple[str, ...]], list[list[Any]]]
+        intermediate_t_rows: dict[tuple[str, str, str], list[tuple[Any, Any]]]
+        sql_fields: list[str]
         sql_values: list
 
-        insert_intermediate_t_commands = []
+        intermediate_t_rows = defaultdict(list)
+        intermediate_t_row_count = 0
+        pending_intermediate_t_rows = 0
+        written_models = 0
 
-        result = curs.execute("SELECT COUNT(*) FROM models;").fetchone()
-        assert result
-        models_count = result["count"]
-        found_collections = set()
+        models_count = Sql_helper.get_row_count()
+        start_time = time()
         # 1) Chunkwise loop trough all data_rows for the models table
-        for _ in range(0, ceil(Sql_helper.get_row_count() / Sql_helper.LIMIT)):
-            data_chunk = Sql_helper.get_next_data_row_chunk()
+        while data_chunk := Sql_helper.get_next_data_row_chunk():
+            chunk_rows = defaultdict(list)
 
             for data_row in data_chunk:
                 collection = data_row["fqid"].split("/")[0]
-                found_collections.add(collection)
                 table_name = HelperGetNames.get_table_name(collection, True)
                 data = data_row["data"]
 
@@ -324,9 +361,8 @@ class Migration(BaseMigration):
                     case "organization" | "meeting":
                         data["time_zone"] = os.environ["MIG0100_TIMEZONE"]
 
-                model = model_registry[collection]()
-                sql_fields = ""
-                sql_placeholder = ""
+                model = model_registry[collection]
+                sql_fields = []
                 sql_values = []
 
                 # 2) Iterate over any field found in the data_row
@@ -334,46 +370,59 @@ class Migration(BaseMigration):
                     # 3) Check wether field exists in models.py too
                     if field := model.try_get_field(field_name):
 
-                        # 3.1) If field is RelationListField write the other tables
+                        # 3.1) If field is RelationListField collect the rows of the other tables
                         if (
                             isinstance(field, tuple(RELATION_LIST_FIELD_CLASSES))
                             and cast(Field, field).is_primary
                             and cast(Field, field).write_fields is not None
                         ):
-                            insert_intermediate_t_commands.extend(
-                                Sql_helper.get_insert_intermediate_t_commands(
-                                    cast(Field, field), data
-                                )
+                            target, rows = Sql_helper.get_intermediate_t_rows(
+                                cast(Field, field), data
                             )
+                            intermediate_t_rows[target].extend(rows)
+                            pending_intermediate_t_rows += len(rows)
 
                         # 3.2) If field is non writable skip
                         if Sql_helper.is_non_writable_sql_field(field):
                             continue
 
                         # 3.3) If field is non relational simply write
-                        value = Sql_helper.transform_data(data[field_name], field)
-                        if len(sql_fields) == 0:
-                            sql_fields = field_name
-                            sql_placeholder = "%s"
-                            sql_values = [value]
-                        else:
-                            sql_fields += f", {field_name}"
-                            sql_placeholder += ", %s"
-                            sql_values.append(value)
+                        sql_fields.append(field_name)
+                        sql_values.append(
+                            Sql_helper.transform_data(data[field_name], field)
+                        )
                 # END LOOP data.keys()
-                curs.execute(
-                    f"INSERT INTO {table_name} ({sql_fields}) VALUES ({sql_placeholder})",
-                    sql_values,
-                )
+                # Models of one table with the same fields share a COPY, missing
+                # fields must not be written so that they get the default values.
+                chunk_rows[(table_name, tuple(sql_fields))].append(sql_values)
             # END LOOP data_rows
+
+            # 4) COPY the chunk into the tables
+            for (table_name, columns), table_rows in chunk_rows.items():
+                Sql_helper.copy_rows(table_name, columns, table_rows)
+
+            # 5) COPY the intermediate tables once the batch is full
+            if pending_intermediate_t_rows >= Sql_helper.INTERMEDIATE_BATCH_SIZE:
+                Sql_helper.flush_intermediate_t_rows(intermediate_t_rows)
+                intermediate_t_row_count += pending_intermediate_t_rows
+                pending_intermediate_t_rows = 0
+
+            written_models += len(data_chunk)
             MigrationHelper.write_line(
-                f"{min(Sql_helper.offset, models_count)} of {models_count} models written to tables."
+                f"{written_models} of {models_count} models written to tables"
+                f" ({written_models / max(time() - start_time, 1e-6):.0f} models/s,"
+                f" max memory {Sql_helper.get_max_memory_usage():.1f} MiB)."
             )
         # END LOOP data chunks
 
-        # 4) INSERT intermediate tables
-        for command, values in insert_intermediate_t_commands:
-            curs.execute(command, values)
+        # 6) COPY the remaining rows of the intermediate tables
+        Sql_helper.flush_intermediate_t_rows(intermediate_t_rows)
+        intermediate_t_row_count += pending_intermediate_t_rows
+        MigrationHelper.write_line(
+            f"{intermediate_t_row_count} rows written to intermediate tables"
+            f" in {time() - start_time:.2f} seconds"
+            f" (max memory {Sql_helper.get_max_memory_usage():.1f} MiB)."
+        )
 
         # clear replace tables as this migration writes the tables directly
         MigrationHelper.set_database_migration_info(
@@ -1,6 +1,8 @@
-from collections.abc import Iterable
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any
 
 from psycopg.types.json import Jsonb
@@ -38,6 +40,66 @@ def json_dict_to_non_json_data_types(json: dict[str, Any]) -> None:
                     )
 
 
+@dataclass(frozen=True)
+class ModelFieldMetadata:
+    """
+    Precomputed field metadata of a model class. All field tuples are ordered by
+    field name.
+    """
+
+    all_fields: tuple[fields.Field, ...]
+    fields_by_name: Mapping[str, fields.Field]
+    relation_fields: tuple[fields.BaseRelationField, ...]
+    writable_fields: tuple[fields.Field, ...]
+    required_fields: tuple[fields.Field, ...]
+    enum_array_fields: tuple[fields.Field, ...]
+    primary_nm_relation_fields: tuple[fields.Field, ...]
+    view_fields: tuple[fields.Field, ...]
+
+    @classmethod
+    def from_model_class(cls, model_class: type) -> "ModelFieldMetadata":
+        fields_by_name = {
+            attr_name: attr
+            for attr_name in dir(model_class)
+            if isinstance(attr := getattr(model_class, attr_name), fields.Field)
+        }
+        model_fields = tuple(fields_by_name.values())
+        return cls(
+            all_fields=model_fields,
+            fields_by_name=MappingProxyType(fields_by_name),
+            relation_fields=tuple(
+                field
+                for field in model_fields
+                if isinstance(field, fields.BaseRelationField)
+            ),
+            writable_fields=tuple(
+                field
+                for field in model_fields
+                if not (
+                    isinstance(field, fields.RelationListField)
+                    and field.is_view_field
+                    and not field.write_fields
+                )
+            ),
+            required_fields=tuple(field for field in model_fields if field.required),
+            enum_array_fields=tuple(
+                field
+                for field in model_fields
+                if getattr(field, "enum_name", None) is not None
+            ),
+            primary_nm_relation_fields=tuple(
+                field
+                for field in model_fields
+                if field.is_primary
+                and field.write_fields
+                and isinstance(
+                    field, (fields.RelationListField, fields.GenericRelationListField)
+                )
+            ),
+            view_fields=tuple(field for field in model_fields if field.is_view_field),
+        )
+
+
 class ModelMetaClass(type):
     """
     Metaclass for Model base class (see below).
@@ -45,7 +107,8 @@ class ModelMetaClass(type):
     This metaclass ensures that all fields get attributes set so that they
     know its own collection and its own field name.
 
-    It also creates the registry for models and collections.
+    It also creates the registry for models and collections and the field
+    metadata of each model.
     """
 
     def __new__(metaclass, class_name, class_parents, class_attributes):  # type: ignore
@@ -58,9 +121,26 @@ class ModelMetaClass(type):
                 if isinstance(attr, fields.Field):
                     attr.own_collection = new_class.collection
                     attr.own_field_name = attr_name
+            new_class.field_metadata = ModelFieldMetadata.from_model_class(new_class)
             model_registry[new_class.collection] = new_class
         return new_class
 
+    def __setattr__(cls, attr_name: str, attr: Any) -> None:
+        super().__setattr__(attr_name, attr)
+        # fields added after class creation have to be part of the metadata, too
+        if isinstance(attr, fields.Field) and hasattr(cls, "field_metadata"):
+            super().__setattr__(
+                "field_metadata", ModelFieldMetadata.from_model_class(cls)
+            )
+
+    def __delattr__(cls, attr_name: str) -> None:
+        is_field = isinstance(cls.__dict__.get(attr_name), fields.Field)
+        super().__delattr__(attr_name)
+        if is_field and hasattr(cls, "field_metadata"):
+            super().__setattr__(
+                "field_metadata", ModelFieldMetadata.from_model_class(cls)
+            )
+
 
 class Model(metaclass=ModelMetaClass):
     """
@@ -69,63 +149,55 @@ class Model(metaclass=ModelMetaClass):
 
     collection: Collection
     verbose_name: str
+    field_metadata: ModelFieldMetadata
 
     def __str__(self) -> str:
         return self.verbose_name
 
-    def get_field(self, field_name: str) -> fields.Field:
+    @classmethod
+    def get_field(cls, field_name: str) -> fields.Field:
         """
         Returns the requested model field.
         """
-        field = self.try_get_field(field_name)
+        field = cls.try_get_field(field_name)
         if not field:
-            raise ValueError(f"Model {self} has no field {field_name}.")
+            raise ValueError(f"Model {cls.verbose_name} has no field {field_name}.")
         return field
 
-    def has_field(self, field_name: str) -> bool:
+    @classmethod
+    def has_field(cls, field_name: str) -> bool:
         """
         Returns True if the model has such a field.
         """
-        return bool(self.try_get_field(field_name))
+        return field_name in cls.field_metadata.fields_by_name
 
     @classmethod
     def try_get_field(cls, field_name: str) -> fields.Field | None:
         """
         Returns the field for the given field name or None if field is not found.
         """
-        field = getattr(cls, field_name, None)
-        if isinstance(field, fields.Field):
-            return field
-        return None
+        return cls.field_metadata.fields_by_name.get(field_name)
 
-    def get_fields(self) -> Iterable[fields.Field]:
+    @classmethod
+    def get_fields(cls) -> tuple[fields.Field, ...]:
         """
-        Yields all fields of this model.
+        Returns all fields of this model.
         """
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, fields.Field):
-                yield attr
+        return cls.field_metadata.all_fields
 
-    def get_relation_fields(self) -> Iterable[fields.BaseRelationField]:
+    @classmethod
+    def get_relation_fields(cls) -> tuple[fields.BaseRelationField, ...]:
         """
-        Yields all relation fields (using BaseRelationField).
+        Returns all relation fields (using BaseRelationField).
         """
-        for model_field in self.get_fields():
-            if isinstance(model_field, fields.BaseRelationField):
-                yield model_field
+        return cls.field_metadata.relation_fields
 
-    def get_writable_fields(self) -> Iterable[fields.Field]:
+    @classmethod
+    def get_writable_fields(cls) -> tuple[fields.Field, ...]:
         """
-        Yields all writable fields of this model.
+        Returns all writable fields of this model.
         """
-        for model_field in self.get_fields():
-            if not (
-                isinstance(model_field, fields.RelationListField)
-                and model_field.is_view_field
-                and not model_field.write_fields
-            ):
-                yield model_field
+        return cls.field_metadata.writable_fields
 
     def get_property(self, field_name: str) -> fields.Schema:
         """
@@ -148,15 +220,13 @@ class Model(metaclass=ModelMetaClass):
             properties.update(self.get_property(field))
         return properties
 
-    def get_required_fields(self) -> Iterable[fields.Field]:
+    @classmethod
+    def get_required_fields(cls) -> tuple[fields.Field, ...]:
         """
-        Yields all required fields
+        Returns all required fields
         """
-        for model_field in self.get_fields():
-            if model_field.required:
-                yield model_field
+        return cls.field_metadata.required_fields
 
-    def get_enum_array_fields(self) -> Iterable[fields.Field]:
-        for model_field in self.get_fields():
-            if getattr(model_field, "enum_name", None) is not None:
-                yield model_field
+    @classmethod
+    def get_enum_array_fields(cls) -> tuple[fields.Field, ...]:
+        return cls.field_metadata.enum_array_fields
@@ -1,6 +1,8 @@
-from collections.abc import Callable, Iterable
+from collections import defaultdict
+from collections.abc import Callable, Container, Iterable
 from datetime import datetime
 from decimal import Decimal
+from functools import cache
 from math import floor
 from typing import Any, cast
 
@@ -182,6 +184,44 @@ checker_map: dict[type[Field], Callable[..., bool]] = {
 }
 
 
+def get_type_checker(field_class: type[Field]) -> Callable[..., bool] | None:
+    if field_class not in _type_checkers:
+        _type_checkers[field_class] = next(
+            (checker_map[_type] for _type in field_class.mro() if _type in checker_map),
+            None,
+        )
+    return _type_checkers[field_class]
+
+
+_type_checkers: dict[type[Field], Callable[..., bool] | None] = {}
+
+
+@cache
+def get_field_names(collection: str) -> frozenset[str]:
+    return frozenset(
+        field.get_own_field_name() for field in model_registry[collection].get_fields()
+    )
+
+
+@cache
+def get_required_or_default_field_names(collection: str) -> frozenset[str]:
+    return frozenset(
+        field.get_own_field_name()
+        for field in model_registry[collection].get_fields()
+        if (field.required or field.default is not None)
+        and field.get_own_field_name() != "sequential_number"
+    )
+
+
+@cache
+def get_relation_target(collection: str, field: str) -> tuple[str, str | None]:
+    field_type = cast(BaseRelationField, model_registry[collection].get_field(field))
+    return (
+        field_type.get_target_collection(),
+        field_type.to.get(field_type.get_target_collection()),
+    )
+
+
 # All meeting internal collection have the field `meeting_id` except for meeting and mediafile.
 # Users are needed for working relations.
 MEETING_COLLECTIONS = {
@@ -201,6 +241,7 @@ class Checker:
         migration_mode: str = "strict",
         repair: bool = False,
         fields_to_remove: dict[str, list] = {},
+        referenced_data: dict[str, dict[str, Any]] = {},
     ) -> None:
         """
         The checker checks the data without access to datastore.
@@ -233,6 +274,11 @@ class Checker:
             First use case: meeting.clone and meeting.import need to remove the fields
             origin_id and derived_motion_id, because in the copy they are not forwarded.
 
+        referenced_data:
+            Models which are not checked themselves, but are used to check the
+            relations of the models in data. Allows to check the data in parts, see
+            get_missing_references.
+
         Not all collections must be given and missing fields are ignored, but
         required fields and fields with a default value must be present.
         """
@@ -241,11 +287,16 @@ class Checker:
         self.migration_mode = migration_mode
         self.repair = repair
         self.fields_to_remove = fields_to_remove
+        self.referenced_data = referenced_data
         self.allowed_collections = (
             set(model_registry.keys()) if self.mode == "all" else MEETING_COLLECTIONS
         )
         # TODO: mediafile blob handling.
         self.errors: list[str] = []
+        # values of the relation list fields as sets, by collection, field and id
+        self.relation_values: dict[tuple[str, str], dict[int, Container | None]] = (
+            defaultdict(dict)
+        )
 
     def check_migration_index(self) -> None:
         # Unfortunately, TypedDict does not support any kind of generic or pattern property to
@@ -261,26 +312,56 @@ class Checker:
                 f"The given migration index ({migration_index}) is lower than the backend ({backend_mi})."
             )
 
-    def get_model(self, collection: str) -> Model:
-        ModelClass = model_registry[collection]
-        return ModelClass()
+    def get_model(self, collection: str) -> type[Model]:
+        return model_registry[collection]
 
     def get_fields(self, collection: str) -> Iterable[Field]:
         return self.get_model(collection).get_fields()
 
     def run_check(self) -> None:
+        """
+        Checks the data in two phases: First all models are repaired and their
+        fields are validated, then the models without errors are checked against
+        the others. The errors are reported in the order of the models.
+        """
         self.check_json()
         self.check_migration_index()
         self.check_collections()
+        checked_models: list[tuple[str, dict[str, Any], list[str], bool]] = []
         for collection, models in self.data.items():
             if collection.startswith("_"):
                 continue
             for id_, model in models.items():
+                start = len(self.errors)
                 if model["id"] != int(id_):
                     self.errors.append(
                         f"{collection}/{id_}: Id must be the same as model['id']"
                     )
-                self.check_model(collection, model)
+                has_errors = self.prepare_model(collection, model)
+                checked_models.append(
+                    (collection, model, self.errors[start:], has_errors)
+                )
+                del self.errors[start:]
+        for collection, model, errors, has_errors in checked_models:
+            self.errors.extend(errors)
+            if not has_errors:
+                self.check_model_relations(collection, model)
+        self.raise_errors()
+
+    def run_special_check(self) -> None:
+        """
+        Checks only the special fields of the models, e.g. for data which was read
+        from the database and whose other fields are guaranteed by its
+        constraints.
+        """
+        for collection, models in self.data.items():
+            if collection.startswith("_"):
+                continue
+            for model in models.values():
+                self.check_special_fields(model, collection)
+        self.raise_errors()
+
+    def raise_errors(self) -> None:
         if self.errors:
             errors = [f"\t{error}" for error in self.errors]
             raise CheckException("\n".join(errors))
@@ -301,31 +382,27 @@ class Checker:
             err = f"Collections in file do not match with models.py. Invalid collections: {', '.join(diff)}."
             raise CheckException(err)
 
-    def check_model(self, collection: str, model: dict[str, Any]) -> None:
+    def prepare_model(self, collection: str, model: dict[str, Any]) -> bool:
+        """Repairs the model and validates its fields. Returns whether errors occurred."""
         if self.repair and collection in self.fields_to_remove:
             [model.pop(field, None) for field in self.fields_to_remove[collection]]
+        return self.check_normal_fields(model, collection)
 
-        errors = self.check_normal_fields(model, collection)
-
-        if not errors:
-            self.check_types(model, collection)
-            self.check_special_fields(model, collection)
-            self.check_relations(model, collection)
-            self.check_calculated_fields(model, collection)
+    def check_model_relations(self, collection: str, model: dict[str, Any]) -> None:
+        self.check_types(model, collection)
+        self.check_special_fields(model, collection)
+        self.check_relations(model, collection)
+        self.check_calculated_fields(model, collection)
 
     def check_normal_fields(self, model: dict[str, Any], collection: str) -> bool:
         model_fields = model.keys()
-        all_collection_fields = {
-            field.get_own_field_name() for field in self.get_fields(collection)
-        }
-        required_or_default_collection_fields = {
-            field.get_own_field_name()
-            for field in self.get_fields(collection)
-            if (field.required or field.default is not None)
-            and field.get_own_field_name() != "sequential_number"
-        }
+        all_collection_fields = get_field_names(collection)
+        required_or_default_collection_fields = get_required_or_default_field_names(
+            collection
+        )
 
         errors = False
+        diff: Iterable[str]
         if diff := required_or_default_collection_fields - model_fields:
             if self.repair:
                 diff = self.fix_missing_default_values(model, collection, diff)
@@ -349,7 +426,7 @@ class Checker:
         return errors
 
     def fix_missing_default_values(
-        self, model: dict[str, Any], collection: str, fieldnames: set[str]
+        self, model: dict[str, Any], collection: str, fieldnames: Iterable[str]
     ) -> set[str]:
         remaining_fields = set()
         for fieldname in fieldnames:
@@ -363,14 +440,10 @@ class Checker:
     def check_types(self, model: dict[str, Any], collection: str) -> None:
         for field in model.keys():
             field_type = self.get_type_from_collection(field, collection)
-            enum = self.get_enum_from_collection_field(field, collection)
+            enum = field_type.constraints.get("enum")
 
-            checker: Callable[..., bool] | None = None
-            for _type in type(field_type).mro():
-                if _type in checker_map:
-                    checker = checker_map[_type]
-                    break
-            else:
+            checker = get_type_checker(type(field_type))
+            if checker is None:
                 raise NotImplementedError(
                     f"TODO implement check for field type {field_type}"
                 )
@@ -407,12 +480,6 @@ class Checker:
     def get_type_from_collection(self, field: str, collection: str) -> Field:
         return self.get_model(collection).get_field(field)
 
-    def get_enum_from_collection_field(
-        self, field: str, collection: str
-    ) -> set[str] | None:
-        field_type = self.get_model(collection).get_field(field)
-        return field_type.constraints.get("enum")
-
     def check_special_fields(self, model: dict[str, Any], collection: str) -> None:
         if collection != "motion":
             return
@@ -551,13 +618,7 @@ class Checker:
                     )
 
     def get_to(self, field: str, collection: str) -> tuple[str, str | None]:
-        field_type = cast(
-            BaseRelationField, self.get_model(collection).get_field(field)
-        )
-        return (
-            field_type.get_target_collection(),
-            field_type.to.get(field_type.get_target_collection()),
-        )
+        return get_relation_target(collection, field)
 
     def check_calculated_fields(
         self,
@@ -622,7 +683,62 @@ class Checker:
             )
 
     def find_model(self, collection: str, id: int) -> dict[str, Any]:
-        return self.data.get(collection, {}).get(str(id), {})
+        return self.data.get(collection, {}).get(str(id)) or self.referenced_data.get(
+            collection, {}
+        ).get(str(id), {})
+
+    def get_missing_references(self) -> dict[str, set[int]]:
+        """
+        Returns the ids per collection of all models which are needed to check the
+        models in data, but are neither part of data nor of referenced_data. Since
+        the calculated fields also depend on the referenced models, this has to be
+        repeated until nothing is missing anymore.
+        """
+        missing: dict[str, set[int]] = defaultdict(set)
+
+        def add(collection: str, id_: Any) -> None:
+            if (
+                collection in self.allowed_collections
+                and isinstance(id_, int)
+                and not self.find_model(collection, id_)
+            ):
+                missing[collection].add(id_)
+
+        def add_fqid(fqid: Any) -> None:
+            if isinstance(fqid, str) and is_fqid(fqid):
+                add(*collection_and_id_from_fqid(fqid))
+
+        for collection, models in self.data.items():
+            if collection.startswith("_"):
+                continue
+            model_class = self.get_model(collection)
+            for model in models.values():
+                for field_name, value in model.items():
+                    field = model_class.try_get_field(field_name)
+                    if not value or not isinstance(field, BaseRelationField):
+                        continue
+                    if isinstance(field, RelationField):
+                        add(field.get_target_collection(), value)
+                    elif isinstance(field, RelationListField):
+                        if isinstance(value, list):
+                            for id_ in value:
+                                add(field.get_target_collection(), id_)
+                    elif isinstance(field, GenericRelationField):
+                        add_fqid(value)
+                    elif isinstance(value, list):
+                        for fqid in value:
+                            add_fqid(fqid)
+                if collection == "motion":
+                    for field_name in ["state_extension", "recommendation_extension"]:
+                        if isinstance(value := model.get(field_name), str):
+                            for fqid in EXTENSION_REFERENCE_IDS_PATTERN.findall(value):
+                                add_fqid(fqid)
+                elif collection == "meeting_mediafile":
+                    source_model = self.find_model(
+                        "mediafile", model.get("mediafile_id", 0)
+                    )
+                    add("mediafile", source_model.get("parent_id"))
+        return missing
 
     def check_reverse_relation(
         self,
@@ -639,22 +755,25 @@ class Checker:
             foreign_field, foreign_collection
         )
         actual_foreign_field = foreign_field
-        foreign_model = self.find_model(foreign_collection, foreign_id)
-        foreign_value = (
-            foreign_model.get(actual_foreign_field)
-            if foreign_model is not None
-            else None
-        )
         fqid = f"{collection}/{id}"
         error = False
-        if isinstance(foreign_field_type, RelationField):
-            error = foreign_value != id
-        elif isinstance(foreign_field_type, RelationListField):
-            error = not foreign_value or id not in foreign_value
-        elif isinstance(foreign_field_type, GenericRelationField):
-            error = foreign_value != fqid
-        elif isinstance(foreign_field_type, GenericRelationListField):
-            error = not foreign_value or fqid not in foreign_value
+        if isinstance(
+            foreign_field_type, (RelationListField, GenericRelationListField)
+        ):
+            foreign_values = self.get_relation_values(
+                foreign_collection, foreign_id, actual_foreign_field
+            )
+            value = (
+                fqid if isinstance(foreign_field_type, GenericRelationListField) else id
+            )
+            error = not foreign_values or value not in foreign_values
+        elif isinstance(foreign_field_type, (RelationField, GenericRelationField)):
+            foreign_value = self.find_model(foreign_collection, foreign_id).get(
+                actual_foreign_field
+            )
+            error = foreign_value != (
+                fqid if isinstance(foreign_field_type, GenericRelationField) else id
+            )
         else:
             raise NotImplementedError()
 
@@ -664,6 +783,23 @@ class Checker:
                 " but the reverse relation for it is corrupt."
             )
 
+    def get_relation_values(
+        self, collection: str, id_: int, field: str
+    ) -> Container | None:
+        """
+        Returns the value of the list field of the model as set, which is built
+        once per model and field, so that the reverse relations of all models
+        pointing to it are checked in constant time.
+        """
+        values = self.relation_values[(collection, field)]
+        if id_ not in values:
+            value = self.find_model(collection, id_).get(field)
+            try:
+                values[id_] = set(value) if isinstance(value, list) else value
+            except TypeError:
+                values[id_] = value
+        return values[id_]
+
     def split_fqid(self, fqid: str) -> tuple[str, int]:
         try:
             collection, _id = collection_and_id_from_fqid(fqid)
@@ -18,6 +18,7 @@ from ..shared.schema import (
     required_fqid_schema,
     required_id_schema,
 )
+from ..shared.schema_validator import LazySchemaValidator
 from ..shared.typing import Schema
 from ..shared.util import (
     ALLOWED_HTML_TAGS_PERMISSIVE,
@@ -74,7 +75,7 @@ class Field:
         self.is_view_field = is_view_field
         self.is_primary = is_primary
         self.write_fields = write_fields
-        self.schema_validator = fastjsonschema.compile(self.get_schema())
+        self.schema_validator = LazySchemaValidator(self.get_schema())
 
     def get_schema(self) -> Schema:
         """
@@ -1,93 +1,137 @@
-from openslides_backend.action.mixins.meeting_user_helper import (
-    get_groups_from_meeting_user,
-    get_meeting_user,
-)
+from functools import cached_property
+
+from openslides_backend.action.mixins.meeting_user_helper import get_meeting_user
 
 from ..services.database.commands import GetManyRequest
 from ..services.database.interface import Database
 from ..shared.exceptions import ActionException, PermissionDenied
 from ..shared.patterns import fqid_from_collection_and_id
+from ..shared.typing import PartialModel
 from .management_levels import OrganizationManagementLevel
-from .permissions import Permission, Permissions, permission_parents
+from .permissions import Permission, Permissions, implied_permissions
+
+# changes to models of these collections invalidate the cached permission data
+PERMISSION_COLLECTIONS = ("meeting", "meeting_user", "group", "user", "committee")
+
+
+class PermissionContext:
+    """
+    Permission relevant data of a user in a meeting. All data is read lazily on first
+    access. The context is cached in the datastore for the rest of the request, see
+    get_permission_context.
+    """
+
+    def __init__(self, datastore: Database, user_id: int, meeting_id: int) -> None:
+        self.datastore = datastore
+        self.user_id = user_id
+        self.meeting_id = meeting_id
+
+    @cached_property
+    def meeting(self) -> PartialModel:
+        return self.datastore.get(
+            fqid_from_collection_and_id("meeting", self.meeting_id),
+            [
+                "admin_group_id",
+                "anonymous_group_id",
+                "enable_anonymous",
+                "locked_from_inside",
+                "committee_id",
+            ],
+            lock_result=False,
+        )
+
+    @cached_property
+    def is_committee_manager(self) -> bool:
+        return has_committee_management_level(
+            self.datastore, self.user_id, self.meeting["committee_id"]
+        )
+
+    @cached_property
+    def meeting_user(self) -> PartialModel | None:
+        # anonymous cannot be fetched from db
+        if self.user_id <= 0:
+            return None
+        return get_meeting_user(
+            self.datastore, self.meeting_id, self.user_id, ["group_ids", "locked_out"]
+        )
+
+    @cached_property
+    def groups(self) -> dict[int, PartialModel]:
+        if self.user_id == 0:
+            # anonymous users are in the anonymous group
+            anonymous_group_id = self.meeting.get("anonymous_group_id")
+            group_ids = [anonymous_group_id] if anonymous_group_id else []
+        elif self.meeting_user:
+            group_ids = self.meeting_user.get("group_ids") or []
+        else:
+            group_ids = []
+        if not group_ids:
+            return {}
+        gmr = GetManyRequest(
+            "group",
+            group_ids,
+            ["permissions", "admin_group_for_meeting_id"],
+        )
+        return self.datastore.get_many([gmr], lock_result=False)["group"]
+
+    @cached_property
+    def is_in_admin_group(self) -> bool:
+        return any(
+            group.get("admin_group_for_meeting_id") == self.meeting_id
+            for group in self.groups.values()
+        )
+
+    @cached_property
+    def permissions(self) -> frozenset[Permission]:
+        """
+        All permissions of the groups including the implied ones.
+        """
+        return frozenset(
+            implied
+            for group in self.groups.values()
+            for group_permission in group.get("permissions", [])
+            for implied in implied_permissions[group_permission]
+        )
+
+
+def get_permission_context(
+    datastore: Database, user_id: int, meeting_id: int
+) -> PermissionContext:
+    return datastore.get_cached(
+        ("permission_context", user_id, meeting_id),
+        PERMISSION_COLLECTIONS,
+        lambda: PermissionContext(datastore, user_id, meeting_id),
+    )
 
 
 def has_perm(
     datastore: Database, user_id: int, permission: Permission, meeting_id: int
 ) -> bool:
-    meeting = datastore.get(
-        fqid_from_collection_and_id("meeting", meeting_id),
-        [
-            "anonymous_group_id",
-            "enable_anonymous",
-            "locked_from_inside",
-            "committee_id",
-        ],
-        lock_result=False,
-    )
-    not_locked_from_editing = not meeting.get("locked_from_inside")
-    # anonymous cannot be fetched from db
+    context = get_permission_context(datastore, user_id, meeting_id)
+    not_locked_from_editing = not context.meeting.get("locked_from_inside")
     if user_id > 0:
         # committeeadmins, orgaadmins and superadmins have all permissions if the meeting isn't locked from the inside
-        if not_locked_from_editing and has_committee_management_level(
-            datastore,
-            user_id,
-            meeting["committee_id"],
-        ):
+        if not_locked_from_editing and context.is_committee_manager:
             return True
-
-        meeting_user = get_meeting_user(
-            datastore, meeting_id, user_id, ["group_ids", "locked_out"]
-        )
-        if not meeting_user:
-            group_ids = []
-        elif meeting_user.get("locked_out"):
-            return False
-        else:
-            group_ids = meeting_user.get("group_ids", [])
-        if not group_ids:
+        if context.meeting_user and context.meeting_user.get("locked_out"):
             return False
     elif user_id == 0:
-        # anonymous users are in the anonymous group
         # check if anonymous is allowed
-        if not meeting.get("enable_anonymous"):
+        if not context.meeting.get("enable_anonymous"):
             raise PermissionDenied(f"Anonymous is not enabled for meeting {meeting_id}")
-        if anonymous_group_id := meeting.get("anonymous_group_id"):
-            group_ids = [anonymous_group_id]
-        else:
-            return False
     else:
         return False
 
-    gmr = GetManyRequest(
-        "group",
-        group_ids,
-        ["permissions", "admin_group_for_meeting_id"],
-    )
-    result = datastore.get_many([gmr], lock_result=False)
-    for group in result["group"].values():
-        # admins implicitly have all permissions
-        if group.get("admin_group_for_meeting_id") == meeting_id:
-            return True
-        # check if the current group has the needed permission (or a higher one)
-        for group_permission in group.get("permissions", []):
-            if is_child_permission(permission, group_permission):
-                return True
-    return False
+    # admins implicitly have all permissions
+    return context.is_in_admin_group or permission in context.permissions
 
 
 def is_child_permission(child: Permission, parent: Permission) -> bool:
     """
-    Iterate the permission tree (represented in the permissions object) from child to
-    parent or until there are no parents anymore
+    Checks whether the child permission is implied by the parent permission, i.e. if
+    it is reachable in the permission tree from child to parent.
     """
-    queue: list[Permission] = [child]
-    while queue:
-        current = queue.pop()
-        if current == parent:
-            return True
-        parents = permission_parents[current]
-        queue.extend(parents)
-    return False
+    return child in implied_permissions[parent]
 
 
 def has_organization_management_level(
@@ -155,28 +199,39 @@ def has_committee_management_level(
     Checks whether a user is committee manager in the given committee.
     """
     if user_id > 0:
-        user = datastore.get(
-            fqid_from_collection_and_id("user", user_id),
-            ["organization_management_level", "committee_management_ids"],
-            lock_result=False,
-            use_changed_models=False,
+        return datastore.get_cached(
+            ("committee_management_level", user_id, committee_id),
+            ("user", "committee"),
+            lambda: _has_committee_management_level(datastore, user_id, committee_id),
         )
-        if user.get("organization_management_level") in (
-            OrganizationManagementLevel.SUPERADMIN,
-            OrganizationManagementLevel.CAN_MANAGE_ORGANIZATION,
-        ):
-            return True
-        if committee_id in user.get("committee_management_ids", []) or any(
-            parent_id in user.get("committee_management_ids", [])
-            for parent_id in datastore.get(
-                fqid_from_collection_and_id("committee", committee_id),
-                ["all_parent_ids"],
-            ).get("all_parent_ids", [])
-        ):
-            return True
     return False
 
 
+def _has_committee_management_level(
+    datastore: Database,
+    user_id: int,
+    committee_id: int,
+) -> bool:
+    user = datastore.get(
+        fqid_from_collection_and_id("user", user_id),
+        ["organization_management_level", "committee_management_ids"],
+        lock_result=False,
+        use_changed_models=False,
+    )
+    if user.get("organization_management_level") in (
+        OrganizationManagementLevel.SUPERADMIN,
+        OrganizationManagementLevel.CAN_MANAGE_ORGANIZATION,
+    ):
+        return True
+    return committee_id in user.get("committee_management_ids", []) or any(
+        parent_id in user.get("committee_management_ids", [])
+        for parent_id in datastore.get(
+            fqid_from_collection_and_id("committee", committee_id),
+            ["all_parent_ids"],
+        ).get("all_parent_ids", [])
+    )
+
+
 def get_shared_committee_management_levels(
     datastore: Database,
     user_id: int,
@@ -211,13 +266,15 @@ def get_shared_committee_management_levels(
 
 
 def filter_surplus_permissions(permission_list: list[Permission]) -> list[Permission]:
+    surplus_permissions = {
+        implied
+        for permission in set(permission_list)
+        for implied in implied_permissions[permission]
+        if implied != permission
+    }
     reduced_permissions: list[Permission] = []
     for permission in permission_list:
-        if any(
-            is_child_permission(permission, possible_parent)
-            for possible_parent in permission_list
-            if possible_parent != permission
-        ):
+        if permission in surplus_permissions:
             continue
         elif permission in reduced_permissions:
             continue
@@ -226,18 +283,12 @@ def filter_surplus_permissions(permission_list: list[Permission]) -> list[Permis
 
 
 def is_admin(datastore: Database, user_id: int, meeting_id: int) -> bool:
-    meeting = datastore.get(
-        fqid_from_collection_and_id("meeting", meeting_id),
-        ["admin_group_id", "locked_from_inside", "committee_id"],
-        lock_result=False,
-    )
-    if not meeting.get("locked_from_inside") and has_committee_management_level(
-        datastore, user_id, meeting["committee_id"]
-    ):
+    context = get_permission_context(datastore, user_id, meeting_id)
+    if not context.meeting.get("locked_from_inside") and context.is_committee_manager:
         return True
 
-    group_ids = get_groups_from_meeting_user(datastore, meeting_id, user_id)
-    return bool(group_ids) and meeting["admin_group_id"] in group_ids
+    group_ids = (context.meeting_user or {}).get("group_ids") or []
+    return bool(group_ids) and context.meeting["admin_group_id"] in group_ids
 
 
 anonymous_perms_whitelist: set[Permission] = {
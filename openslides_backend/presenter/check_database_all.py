@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Any
 
 import fastjsonschema
@@ -6,12 +7,17 @@ from openslides_backend.migrations.migration_helper import MigrationHelper
 from openslides_backend.shared.export_helper import get_fields_for_export
 from openslides_backend.shared.patterns import is_reserved_field
 
+from ..models.base import model_registry
 from ..models.checker import Checker, CheckException
 from ..permissions.management_levels import OrganizationManagementLevel
 from ..permissions.permission_helper import has_organization_management_level
+from ..services.database.commands import GetManyRequest
 from ..services.database.interface import Database
 from ..shared.exceptions import PermissionDenied
+from ..shared.filters import FilterOperator
+from ..shared.patterns import Collection, Id
 from ..shared.schema import schema_version
+from ..shared.typing import PartialModel
 from .base import BasePresenter
 from .presenter import register_presenter
 
@@ -21,28 +27,36 @@ check_database_schema = fastjsonschema.compile(
         "type": "object",
         "title": "check database",
         "description": "check database",
-        "properties": {},
+        "properties": {
+            "streaming": {"type": "boolean"},
+        },
     }
 )
 
+EXCLUDED_COLLECTIONS = ["action_worker", "import_preview"]
+STREAM_BATCH_SIZE = 1000
+
+
+def prepare_models(
+    collection: Collection, models: dict[Id, PartialModel]
+) -> dict[str, PartialModel]:
+    fields = get_fields_for_export(collection)
+    return {
+        str(id): {
+            field: value
+            for field, value in model.items()
+            if (field in fields and not is_reserved_field(field) and value is not None)
+        }
+        for id, model in models.items()
+    }
+
 
 def check_everything(datastore: Database) -> None:
     result = datastore.get_everything()
     data: dict[str, Any] = {
-        collection: {
-            str(id): {
-                field: value
-                for field, value in model.items()
-                if (
-                    field in get_fields_for_export(collection)
-                    and not is_reserved_field(field)
-                    and value is not None
-                )
-            }
-            for id, model in models.items()
-        }
+        collection: prepare_models(collection, models)
         for collection, models in result.items()
-        if collection not in ["action_worker", "import_preview"]
+        if collection not in EXCLUDED_COLLECTIONS
     }
     data["_migration_index"] = MigrationHelper.get_backend_migration_index()
     Checker(
@@ -51,10 +65,107 @@ def check_everything(datastore: Database) -> None:
     ).run_check()
 
 
+def check_everything_streaming(
+    datastore: Database,
+    progress: Callable[[str], None] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> None:
+    """
+    Checks the same as check_everything, but only holds one meeting with all its
+    models or one batch of the other models in memory at a time, together with the
+    models referenced by them.
+    """
+    migration_index = MigrationHelper.get_backend_migration_index()
+    collections = [
+        collection
+        for collection in model_registry
+        if collection not in EXCLUDED_COLLECTIONS
+    ]
+    meeting_collections = [
+        collection
+        for collection in collections
+        if (field := model_registry[collection].try_get_field("meeting_id"))
+        and field.required
+    ]
+    errors: list[str] = []
+
+    def check_part(part: dict[Collection, dict[Id, PartialModel]]) -> None:
+        data: dict[str, Any] = {
+            collection: prepare_models(collection, models)
+            for collection, models in part.items()
+        }
+        data["_migration_index"] = migration_index
+        referenced_data: dict[str, dict[str, Any]] = {}
+        requested: dict[Collection, set[Id]] = {}
+        checker = Checker(data=data, mode="all", referenced_data=referenced_data)
+        while missing := {
+            collection: new_ids
+            for collection, ids in checker.get_missing_references().items()
+            if (new_ids := ids - requested.setdefault(collection, set()))
+        }:
+            result = datastore.get_many(
+                [
+                    GetManyRequest(
+                        collection, list(ids), list(get_fields_for_export(collection))
+                    )
+                    for collection, ids in missing.items()
+                ],
+                lock_result=False,
+                use_changed_models=False,
+            )
+            for collection, ids in missing.items():
+                requested[collection].update(ids)
+                referenced_data.setdefault(collection, {}).update(
+                    prepare_models(collection, result.get(collection, {}))
+                )
+        try:
+            checker.run_check()
+        except CheckException as e:
+            errors.append(str(e))
+
+    def report(message: str) -> None:
+        if progress:
+            progress(message)
+
+    meeting_count = 0
+    for meetings in datastore.stream(
+        "meeting", None, list(get_fields_for_export("meeting")), batch_size
+    ):
+        for meeting_id, meeting in meetings.items():
+            part = {"meeting": {meeting_id: meeting}}
+            for collection in meeting_collections:
+                if models := datastore.filter(
+                    collection,
+                    FilterOperator("meeting_id", "=", meeting_id),
+                    list(get_fields_for_export(collection)),
+                    lock_result=False,
+                    use_changed_models=False,
+                ):
+                    part[collection] = models
+            check_part(part)
+            meeting_count += 1
+            report(f"Checked meeting/{meeting_id} ({meeting_count} meetings checked).")
+
+    for collection in collections:
+        if collection == "meeting" or collection in meeting_collections:
+            continue
+        model_count = 0
+        for models in datastore.stream(
+            collection, None, list(get_fields_for_export(collection)), batch_size
+        ):
+            check_part({collection: models})
+            model_count += len(models)
+        report(f"Checked {model_count} models of collection {collection}.")
+
+    if errors:
+        raise CheckException("\n".join(errors))
+
+
 @register_presenter("check_database_all")
 class CheckDatabaseAll(BasePresenter):
     """Check Database All gets all non-deleted meetings, exports them,
-    and check them with the checker."""
+    and check them with the checker. With streaming set, the database is
+    checked in parts to limit the memory usage."""
 
     schema = check_database_schema
 
@@ -68,7 +179,10 @@ class CheckDatabaseAll(BasePresenter):
             raise PermissionDenied(msg)
 
         try:
-            check_everything(self.datastore)
+            if self.data.get("streaming"):
+                check_everything_streaming(self.datastore, self.logger.info)
+            else:
+                check_everything(self.datastore)
             return {"ok": True}
         except CheckException as ce:
             return {"ok": False, "errors": str(ce)}
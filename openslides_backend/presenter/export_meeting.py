@@ -1,3 +1,5 @@
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from typing import Any
 
 import fastjsonschema
@@ -5,7 +7,8 @@ import fastjsonschema
 from ..permissions.management_levels import OrganizationManagementLevel
 from ..permissions.permission_helper import has_organization_management_level
 from ..shared.exceptions import PermissionDenied, PresenterException
-from ..shared.export_helper import export_meeting
+from ..shared.export_helper import iter_export_meeting
+from ..shared.json_stream import StreamedObject
 from ..shared.schema import required_id_schema, schema_version
 from .base import BasePresenter
 from .presenter import register_presenter
@@ -29,6 +32,7 @@ class Export(BasePresenter):
     """
     Export meeting presenter.
     It calls the export meeting function and should be used by the superadmin.
+    The export is streamed collection by collection while the response is sent.
     """
 
     schema = export_meeting_schema
@@ -41,43 +45,45 @@ class Export(BasePresenter):
             msg = "You are not allowed to perform presenter export_meeting."
             msg += f" Missing permission: {OrganizationManagementLevel.SUPERADMIN}"
             raise PermissionDenied(msg)
-        export_data = export_meeting(
+        collections = iter_export_meeting(
             self.datastore,
             self.data["meeting_id"],
             transform_datetime_decimal=True,
             datetime_to_unix=self.data.get("old_db_compatibility"),
         )
-        if id_ := next(
-            (
-                id_
-                for id_, meeting in export_data["meeting"].items()
-                if meeting.get("locked_from_inside")
-            ),
-            None,
-        ):
-            raise PresenterException(f"Cannot export: meeting {id_} is locked.")
-        self.exclude_organization_tags_and_default_meeting_for_committee(export_data)
-        if self.data.get("old_db_compatibility"):
-            self.add_missing_mm_inherited_access_group_ids(export_data)
-        return export_data
+        # the meeting is yielded first and checked before the export is streamed
+        _, meetings = next(collections)
+        meeting_id, meeting = next(meetings)
+        if meeting.get("locked_from_inside"):
+            raise PresenterException(f"Cannot export: meeting {meeting_id} is locked.")
+        self.exclude_organization_tags_and_default_meeting_for_committee(meeting)
+        return StreamedObject(
+            chain(
+                [("meeting", {meeting_id: meeting})],
+                (
+                    (collection, self.stream_models(collection, models))
+                    for collection, models in collections
+                ),
+            )
+        )
+
+    def stream_models(self, collection: str, models: Any) -> Any:
+        if collection == "_migration_index":
+            return models
+        if collection == "meeting_mediafile" and self.data.get("old_db_compatibility"):
+            models = self.add_missing_mm_inherited_access_group_ids(models)
+        return StreamedObject(models)
 
     def exclude_organization_tags_and_default_meeting_for_committee(
-        self, export_data: dict[str, Any]
+        self, meeting: dict[str, Any]
     ) -> None:
-        self.get_meeting_from_json(export_data).pop("organization_tag_ids", None)
-        self.get_meeting_from_json(export_data).pop(
-            "default_meeting_for_committee_id", None
-        )
+        meeting.pop("organization_tag_ids", None)
+        meeting.pop("default_meeting_for_committee_id", None)
 
     def add_missing_mm_inherited_access_group_ids(
-        self, export_data: dict[str, Any]
-    ) -> None:
-        if "meeting_mediafile" not in export_data:
-            return
-        for meeting_mediafile_data in export_data["meeting_mediafile"].values():
+        self, meeting_mediafiles: Iterable[tuple[str, dict[str, Any]]]
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        for id_, meeting_mediafile_data in meeting_mediafiles:
             if "inherited_access_group_ids" not in meeting_mediafile_data:
                 meeting_mediafile_data["inherited_access_group_ids"] = []
-
-    def get_meeting_from_json(self, export_data: Any) -> Any:
-        key = next(iter(export_data["meeting"]))
-        return export_data["meeting"][key]
+            yield id_, meeting_mediafile_data
@@ -62,6 +62,7 @@ class GetUserEditable(CreateUpdatePermissionsMixin, BasePresenter):
             if field_name in group_fields
         }
         result: defaultdict[str, dict[str, tuple[bool, str]]] = defaultdict(dict)
+        self.prefetch_user_scopes(self.data["user_ids"])
         for user_id in self.data["user_ids"]:
             result[str(user_id)] = {}
             groups_editable = {}
@@ -49,6 +49,7 @@ class GetUserRelatedModels(UserScopeMixin, BasePresenter):
             ],
         )
         users = self.datastore.get_many([gmr]).get("user", {})
+        self.prefetch_user_scopes(list(users))
         for user_id, user in users.items():
             result[user_id] = {}
             self.check_permissions_for_scope(user_id)
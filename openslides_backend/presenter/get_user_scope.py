@@ -34,16 +34,15 @@ class GetUserScope(UserScopeMixin, BasePresenter):
 
     def get_result(self) -> Any:
         result: dict[str, Any] = {}
-        user_ids = self.data["user_ids"]
-        for user_id in user_ids:
-            (
-                scope,
-                scope_id,
-                user_oml,
-                committee_meeting_ids,
-                user_in_archived_meetings_only,
-                home_committee_id,
-            ) = self.get_user_scope(user_id)
+        user_scopes = self.get_user_scopes(self.data["user_ids"])
+        for user_id, (
+            scope,
+            scope_id,
+            user_oml,
+            committee_meeting_ids,
+            user_in_archived_meetings_only,
+            home_committee_id,
+        ) in user_scopes.items():
             committee_ids = [ci for ci in committee_meeting_ids.keys()]
             result[str(user_id)] = {
                 "collection": scope,
@@ -1,7 +1,7 @@
-from operator import itemgetter
 from typing import Any
 
 import fastjsonschema
+from psycopg import sql
 
 from ..permissions.management_levels import OrganizationManagementLevel
 from ..permissions.permission_helper import has_organization_management_level
@@ -25,6 +25,9 @@ ALLOWED = {
     "vote_weight": "",
 }
 
+# fields which are searched for the filter keyword
+FILTER_FIELDS = ("username", "first_name", "last_name")
+
 get_users_schema = fastjsonschema.compile(
     {
         "$schema": schema_version,
@@ -54,6 +57,8 @@ get_users_schema = fastjsonschema.compile(
 class GetUsers(BasePresenter):
     """
     Gets all users and return some user_ids.
+    Filtering, sorting and pagination are done by the database, so that only the
+    ids of the requested page are transferred.
     """
 
     schema = get_users_schema
@@ -61,10 +66,19 @@ class GetUsers(BasePresenter):
     def get_result(self) -> Any:
         self.check_permissions()
         criteria = self.get_criteria()
-        users = self.get_all_users(criteria)
-        users = self.filter_keyword(users)
-        users = self.sort_users(users, criteria)
-        users = self.paginate_users(users)
+        where, arguments = self.get_filter_condition()
+        limit, offset = self.get_limit_and_offset(where, arguments)
+        if limit == 0:
+            return {"users": []}
+        query = sql.SQL("id FROM {table}{where} ORDER BY {order} LIMIT {limit}").format(
+            table=sql.Identifier("user"),
+            where=where,
+            order=self.get_order(criteria),
+            limit=sql.Literal(limit),
+        )
+        if offset:
+            query += sql.SQL(" OFFSET {offset}").format(offset=sql.Literal(offset))
+        users = self.datastore.execute_custom_select(query, arguments=arguments)
         return {"users": [user["id"] for user in users]}
 
     def check_permissions(self) -> None:
@@ -78,46 +92,58 @@ class GetUsers(BasePresenter):
         criteria = self.data.get("sort_criteria", default_criteria)
         return criteria
 
-    def get_all_users(self, criteria: list[str]) -> list[dict[str, Any]]:
-        fields = criteria[:]
-        for name in ("username", "first_name", "last_name", "id"):
-            if name not in fields:
-                fields.append(name)
-
-        return list(
-            self.datastore.get_all(
-                "user",
-                fields,
-            ).values()
+    def get_filter_condition(self) -> tuple[sql.Composable, list[Any]]:
+        """
+        Returns the condition for the case sensitive substring search of the
+        filter in the username, first_name and last_name.
+        """
+        if not (keyword := self.data.get("filter")):
+            return sql.SQL(""), []
+        pattern = "%{}%".format(
+            keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
         )
-
-    def _check_name(self, user: dict[str, Any], name: str) -> bool:
-        return user.get(name) is not None and self.data["filter"] in user[name]
-
-    def filter_keyword(self, users: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        if self.data.get("filter"):
-            users = [
-                user
-                for user in users
-                if self._check_name(user, "username")
-                or self._check_name(user, "first_name")
-                or self._check_name(user, "last_name")
-            ]
-        return users
-
-    def sort_users(
-        self, users: list[dict[str, Any]], criteria: list[str]
-    ) -> list[dict[str, Any]]:
-        for user in users:
-            for crit in criteria:
-                if user.get(crit) is None:
-                    user[crit] = ALLOWED[crit]
-
-        users.sort(key=itemgetter(*criteria), reverse=self.data.get("reverse", False))
-        return users
-
-    def paginate_users(self, users: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        condition = sql.SQL(" OR ").join(
+            sql.SQL("{} LIKE %s").format(sql.Identifier(name)) for name in FILTER_FIELDS
+        )
+        return sql.SQL(" WHERE ") + condition, [pattern] * len(FILTER_FIELDS)
+
+    def get_order(self, criteria: list[str]) -> sql.Composable:
+        """
+        Orders by the criteria with the defaults of ALLOWED for None. Strings are
+        compared by code points as in python. Equal users keep the order by id,
+        also if the order is reversed.
+        """
+        direction = sql.SQL(" DESC" if self.data.get("reverse", False) else "")
+        order: list[sql.Composable] = []
+        for crit in criteria:
+            if isinstance(default := ALLOWED[crit], str):
+                expression = sql.SQL('COALESCE({}, {}) COLLATE "C"')
+            else:
+                expression = sql.SQL("COALESCE({}, {})")
+            order.append(
+                expression.format(sql.Identifier(crit), sql.Literal(default))
+                + direction
+            )
+        order.append(sql.Identifier("id"))
+        return sql.SQL(", ").join(order)
+
+    def get_limit_and_offset(
+        self, where: sql.Composable, arguments: list[Any]
+    ) -> tuple[int, int]:
+        """
+        Returns the limit and offset for the slice of the sorted users. Negative
+        indices are resolved like python slices with the number of users.
+        """
         start_index = self.data.get("start_index", 0)
         end_index = start_index + self.data.get("entries", 100)
-        users = users[start_index:end_index]
-        return users
+        if start_index < 0 or end_index < 0:
+            result = self.datastore.execute_custom_select(
+                sql.SQL("COUNT(*) AS count FROM {table}{where}").format(
+                    table=sql.Identifier("user"), where=where
+                ),
+                arguments=arguments,
+            )
+            start_index, end_index, _ = slice(start_index, end_index).indices(
+                result[0]["count"]
+            )
+        return max(end_index - start_index, 0), start_index
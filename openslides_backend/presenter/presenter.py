@@ -1,17 +1,19 @@
 from collections.abc import Callable
+from contextlib import ExitStack
 
 import fastjsonschema
 from fastjsonschema import JsonSchemaException
 from osauthlib import AUTHENTICATION_HEADER, COOKIE_NAME
 
-from openslides_backend.services.database.extended_database import ExtendedDatabase
+from openslides_backend.services.database.read_only_database import ReadOnlyDatabase
 from openslides_backend.services.postgresql.db_connection_handling import (
-    get_new_os_conn,
+    get_new_read_only_os_conn,
 )
 
 from ..http.request import Request
 from ..shared.exceptions import PresenterException
 from ..shared.handlers.base_handler import BaseHandler
+from ..shared.json_stream import StreamedObject
 from ..shared.schema import schema_version
 from .base import BasePresenter
 from .presenter_interface import Payload, PresenterResponse
@@ -75,10 +77,17 @@ class PresenterHandler(BaseHandler):
         except JsonSchemaException as exception:
             raise PresenterException(exception.message)
 
-        # Parse presentations and creates response
-        with get_new_os_conn() as conn:
-            self.datastore = ExtendedDatabase(conn, self.logging, self.env)
+        # Parse presentations and creates response in a read-only transaction
+        with ExitStack() as stack:
+            conn = stack.enter_context(get_new_read_only_os_conn())
+            self.datastore = ReadOnlyDatabase(conn, self.logging, self.env)
             response, access_token = self.parse_presenters(request)
+            if streamed := [
+                result for result in response if isinstance(result, StreamedObject)
+            ]:
+                # streamed results are read while the response is sent, so the
+                # transaction is ended after the last of them
+                streamed[-1].on_close = stack.pop_all().close
         self.logger.debug("Request was successful. Send response now.")
         return response, access_token
 
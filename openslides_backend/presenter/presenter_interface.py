@@ -9,7 +9,8 @@ class PresenterBlob(TypedDict, total=False):
 
 
 Payload = list[PresenterBlob]
-PresenterResponse = list[dict[Any, Any]]
+# the results are dicts or objects which are streamed while they are sent
+PresenterResponse = list[Any]
 
 
 class Presenter(Protocol):
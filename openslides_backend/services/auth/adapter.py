@@ -12,6 +12,7 @@ from osauthlib import (
 from ...shared.exceptions import AuthenticationException
 from ...shared.interfaces.logging import LoggingModule
 from ..shared.authenticated_service import AuthenticatedService
+from . import hash_pool
 from .interface import AuthenticationService
 
 
@@ -44,6 +45,9 @@ class AuthenticationHTTPAdapter(AuthenticationService, AuthenticatedService):
     def hash(self, toHash: str) -> str:
         return self.auth_handler.hash(toHash)
 
+    def hash_many(self, values: list[str]) -> list[str]:
+        return hash_pool.hash_many(values, self.hash)
+
     def is_equal(self, toHash: str, toCompare: str) -> bool:
         return self.auth_handler.is_equal(toHash, toCompare)
 
@@ -0,0 +1,68 @@
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from ...shared.env import Environment
+
+env = Environment(os.environ)
+logger = logging.getLogger(__name__)
+
+# lists with fewer values are hashed in the calling process
+MIN_POOL_BATCH_SIZE = 4
+
+_pool: ProcessPoolExecutor | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+# hash function of the pool processes, created on first use in each process
+_worker_hash: Callable[[str], str] | None = None
+
+
+def hash_in_worker(value: str) -> str:
+    global _worker_hash
+    if _worker_hash is None:
+        from osauthlib import AuthHandler
+
+        _worker_hash = AuthHandler(logger.debug).hash
+    return _worker_hash(value)
+
+
+def get_pool() -> ProcessPoolExecutor | None:
+    """
+    Returns the process pool of this worker or None if the pool is disabled. The
+    pool processes are spawned instead of forked since the workers are
+    multithreaded.
+    """
+    global _pool, _pool_pid
+    if (processes := int(env.PASSWORD_HASH_PROCESSES)) <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def hash_many(values: list[str], hash_: Callable[[str], str]) -> list[str]:
+    """
+    Hashes the values with the bounded process pool of this worker, so that bulk
+    operations scale with the available cores. Small lists and all lists while
+    the pool is disabled or broken are hashed with the given function.
+    """
+    global _pool
+    if len(values) >= MIN_POOL_BATCH_SIZE and (pool := get_pool()):
+        chunksize = max(1, len(values) // (int(env.PASSWORD_HASH_PROCESSES) * 4))
+        try:
+            return list(pool.map(hash_in_worker, values, chunksize=chunksize))
+        except BrokenProcessPool as e:
+            logger.warning(f"Password hash pool broken, hashing serially: {e}")
+            with _pool_lock:
+                if _pool is pool:
+                    _pool = None
+    return [hash_(value) for value in values]
@@ -30,6 +30,12 @@ class AuthenticationService(AuthenticatedServiceInterface, Protocol):
         Returns the hashed value. The hashed value is structured as follows: [salt + hash].
         """
 
+    def hash_many(self, values: list[str]) -> list[str]:
+        """
+        Hashes the given values like `hash` in the same order. Larger lists are
+        hashed in parallel by a bounded pool of processes per worker.
+        """
+
     def is_equal(self, toHash: str, toCompare: str) -> bool:
         """
         Compares a given value with an given hash.
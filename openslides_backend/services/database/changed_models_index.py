@@ -0,0 +1,231 @@
+from collections import defaultdict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from openslides_backend.models.base import model_registry
+from openslides_backend.models.fields import GenericRelationField, RelationField
+from openslides_backend.shared.filters import (
+    And,
+    Filter,
+    FilterOperator,
+    filter_visitor,
+)
+from openslides_backend.shared.patterns import Collection, Id
+from openslides_backend.shared.typing import DeletedModel, PartialModel
+
+MISSING = object()
+
+# maximum number of cached aggregates per collection
+MAX_AGGREGATES_PER_COLLECTION = 64
+
+
+class FieldIndex:
+    """
+    Hash index from the values of a single field to the ids of the changed models
+    of a collection. Changed models of existing models which do not contain the field
+    are collected in `missing`, since their value is only known to the database. New
+    models without the field are indexed with None, deleted models are not indexed.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self.ids_by_value: dict[Hashable, set[Id]] = defaultdict(set)
+        self.value_by_id: dict[Id, Hashable] = {}
+        self.missing: set[Id] = set()
+
+    def update(self, id_: Id, model: PartialModel) -> None:
+        if (old_value := self.value_by_id.pop(id_, MISSING)) is not MISSING:
+            ids = self.ids_by_value[old_value]
+            ids.discard(id_)
+            if not ids:
+                del self.ids_by_value[old_value]
+        self.missing.discard(id_)
+        if isinstance(model, DeletedModel):
+            return
+        if self.field in model:
+            value = model[self.field]
+        elif model.get("meta_new"):
+            value = None
+        else:
+            self.missing.add(id_)
+            return
+        self.value_by_id[id_] = value
+        self.ids_by_value[value].add(id_)
+
+    def get_candidates(self, value: Hashable) -> set[Id]:
+        """
+        Returns the ids of all changed models which may have the given value.
+        """
+        return self.ids_by_value.get(value, set()) | self.missing
+
+    def excludes(self, id_: Id, value: Hashable) -> bool:
+        """
+        Returns True if the changed model is known to have another value.
+        """
+        return (
+            own_value := self.value_by_id.get(id_, MISSING)
+        ) is not MISSING and not (own_value is value or own_value == value)
+
+
+@dataclass
+class AggregateEntry:
+    method: str
+    filter_: Filter
+    field: str
+    fields: frozenset[str]
+    value: int | None
+
+    def add(self, value: Any) -> None:
+        if self.method == "count":
+            self.value = (self.value or 0) + 1
+        elif value is not None:
+            if self.value is None:
+                self.value = value
+            elif self.method == "max":
+                self.value = max(self.value, value)
+            else:
+                self.value = min(self.value, value)
+
+
+class ChangedModelsIndex:
+    """
+    Secondary indexes over the changed models of an ExtendedDatabase which are
+    maintained incrementally while the models are applied.
+
+    * Hash indexes on the values of relation fields (e.g. `meeting_id` or
+      `list_of_speakers_id`), which are created on the first filter on the field.
+      They allow to only look at the changed models which may match an equality
+      condition of a filter instead of all changed models of the collection.
+    * The results of min/max/count aggregates. Adding a new model which fits the
+      filter updates the result, e.g. the running maximum of the weight; every other
+      change to the fields of the filter or the aggregated field drops it.
+
+    As the changed models themselves, the indexes rely on the models only being
+    changed via `apply_changed_model`.
+    """
+
+    def __init__(self, fits_filter: Callable[[PartialModel, Filter], bool]) -> None:
+        self.fits_filter = fits_filter
+        self.field_indexes: dict[Collection, dict[str, FieldIndex]] = defaultdict(dict)
+        self.aggregates: dict[Collection, dict[Hashable, AggregateEntry]] = defaultdict(
+            dict
+        )
+
+    def get_field_index(
+        self,
+        collection: Collection,
+        filter_: Filter,
+        changed_models: dict[Id, PartialModel],
+    ) -> tuple[FieldIndex, Hashable] | tuple[None, None]:
+        """
+        Returns the index of a relation field which the filter requires to equal a
+        value, together with the value. Builds the index on first use.
+        """
+        parts = filter_.and_filter if isinstance(filter_, And) else [filter_]
+        for part in parts:
+            if (
+                isinstance(part, FilterOperator)
+                and part.operator == "="
+                and isinstance(part.value, Hashable)
+                and (model := model_registry.get(collection))
+                and isinstance(
+                    model.try_get_field(part.field),
+                    (RelationField, GenericRelationField),
+                )
+            ):
+                if not (index := self.field_indexes[collection].get(part.field)):
+                    index = self.field_indexes[collection][part.field] = FieldIndex(
+                        part.field
+                    )
+                    for id_, changed_model in changed_models.items():
+                        index.update(id_, changed_model)
+                return index, part.value
+        return None, None
+
+    def get_aggregate(
+        self, collection: Collection, key: Hashable
+    ) -> AggregateEntry | None:
+        return self.aggregates.get(collection, {}).get(key)
+
+    def set_aggregate(
+        self,
+        collection: Collection,
+        key: Hashable,
+        method: str,
+        filter_: Filter,
+        field: str,
+        value: int | None,
+    ) -> None:
+        fields = set()
+        filter_visitor(filter_, lambda fo: fields.add(fo.field))
+        if field != "*":
+            fields.add(field)
+        entries = self.aggregates[collection]
+        if len(entries) >= MAX_AGGREGATES_PER_COLLECTION:
+            del entries[next(iter(entries))]
+        entries[key] = AggregateEntry(method, filter_, field, frozenset(fields), value)
+
+    def get_snapshot(
+        self, collection: Collection, model: PartialModel | None
+    ) -> PartialModel | None:
+        """
+        Returns the values needed to update the aggregates of the collection once the
+        model has changed, or None if there are no aggregates.
+        """
+        if not (entries := self.aggregates.get(collection)) or model is None:
+            return None
+        fields = set().union(*(entry.fields for entry in entries.values()))
+        return {
+            **{field: model[field] for field in fields if field in model},
+            "meta_new": model.get("meta_new") is True,
+            "meta_exists": bool(model),
+            "meta_deleted": isinstance(model, DeletedModel),
+        }
+
+    def update(
+        self,
+        collection: Collection,
+        id_: Id,
+        model: PartialModel,
+        snapshot: PartialModel | None,
+    ) -> None:
+        """
+        Updates the indexes of the collection after the model has changed. The
+        snapshot must have been taken from the model before the change.
+        """
+        for index in self.field_indexes.get(collection, {}).values():
+            index.update(id_, model)
+        if not (entries := self.aggregates.get(collection)):
+            return
+        if snapshot is None:
+            snapshot = {"meta_new": False, "meta_exists": False, "meta_deleted": False}
+        deleted = snapshot["meta_deleted"] or isinstance(model, DeletedModel)
+        is_new = not deleted and model.get("meta_new") is True
+        for key, entry in list(entries.items()):
+            if (
+                not deleted
+                and snapshot["meta_new"] == is_new
+                and all(
+                    snapshot.get(field, MISSING) == model.get(field, MISSING)
+                    for field in entry.fields
+                )
+            ):
+                continue
+            # a new model only adds to the result if it did not contribute before
+            if is_new and (
+                not snapshot["meta_exists"]
+                or snapshot["meta_new"]
+                and not self.fits_filter(snapshot, entry.filter_)
+            ):
+                if self.fits_filter(model, entry.filter_):
+                    entry.add(model.get(entry.field))
+            else:
+                del entries[key]
+
+    def clear_aggregates(self) -> None:
+        self.aggregates.clear()
+
+    def clear(self) -> None:
+        self.field_indexes.clear()
+        self.aggregates.clear()
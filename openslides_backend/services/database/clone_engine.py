@@ -0,0 +1,318 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from psycopg import Connection, rows, sql
+
+from openslides_backend.models.base import Model, model_registry
+from openslides_backend.models.fields import (
+    Field,
+    GenericRelationField,
+    GenericRelationListField,
+    RelationField,
+    RelationListField,
+)
+from openslides_backend.shared.exceptions import BadCodingException
+from openslides_backend.shared.otel import make_span
+from openslides_backend.shared.patterns import (
+    KEYSEPARATOR,
+    Collection,
+    Id,
+    fqid_from_collection_and_id,
+)
+
+from ...shared.interfaces.env import Env
+from ...shared.interfaces.logging import LoggingModule
+
+# temporary table with the old and new ids of the cloned models
+ID_MAP_TABLE = "clone_id_map"
+
+# organization-wide mediafiles are referenced by the clone instead of being cloned
+SHARED_COLLECTIONS = ("mediafile",)
+
+
+class MeetingCloneEngine:
+    """
+    Clones the rows of a meeting within the database. The ids of the clones are
+    reserved per collection with the id sequences and stored in a temporary
+    mapping table. The rows are copied with one `INSERT ... SELECT` per
+    collection and n:m table, which rewrites all relations to cloned models
+    through the mapping table. Relations to models which are not cloned, e.g.
+    users or organization-wide mediafiles, are kept. Relations to models of the
+    cloned collections outside of the meeting, e.g. the origin of a forwarded
+    motion, are removed.
+    """
+
+    def __init__(
+        self, connection: Connection[rows.DictRow], logging: LoggingModule, env: Env
+    ) -> None:
+        self.env = env
+        self.logger = logging.getLogger(__name__)
+        self.connection = connection
+
+    def clone(
+        self,
+        meeting_id: Id,
+        collections: Iterable[Collection],
+        cleared_fields: dict[Collection, list[str]] = {},
+    ) -> Id:
+        """
+        Clones the meeting with all models of the given collections which belong
+        to it and returns the id of the new meeting. The cleared fields are not
+        copied. The id maps stay available until the end of the transaction, see
+        `get_id_map`.
+        """
+        collections = list(dict.fromkeys(["meeting", *collections]))
+        with make_span(self.env, "clone meeting"):
+            with self.savepoint(), self.connection.cursor() as curs:
+                curs.execute(sql.SQL("""
+                        CREATE TEMPORARY TABLE IF NOT EXISTS {table} (
+                            collection varchar(32) NOT NULL,
+                            old_id integer NOT NULL,
+                            new_id integer NOT NULL,
+                            PRIMARY KEY (collection, old_id)
+                        ) ON COMMIT DROP
+                        """).format(table=sql.Identifier(ID_MAP_TABLE)))
+                curs.execute(
+                    sql.SQL("TRUNCATE {table}").format(
+                        table=sql.Identifier(ID_MAP_TABLE)
+                    )
+                )
+                for collection in collections:
+                    curs.execute(
+                        self.get_reserve_ids_statement(collection),
+                        [self.get_meeting_reference(collection, meeting_id)],
+                    )
+                curs.execute(
+                    sql.SQL("ANALYZE {table}").format(
+                        table=sql.Identifier(ID_MAP_TABLE)
+                    )
+                )
+                for collection in collections:
+                    cleared = cleared_fields.get(collection, [])
+                    curs.execute(
+                        self.get_copy_rows_statement(collection, collections, cleared)
+                    )
+                    for field in model_registry[collection].get_fields():
+                        if (
+                            self.is_primary_nm_relation(field)
+                            and field.get_own_field_name() not in cleared
+                        ):
+                            curs.execute(
+                                self.get_copy_intermediate_rows_statement(
+                                    collection, field, collections
+                                )
+                            )
+        new_meeting_id = self.get_id_map("meeting")[meeting_id]
+        self.logger.debug(f"Meeting {meeting_id} cloned to {new_meeting_id}")
+        return new_meeting_id
+
+    def get_id_map(self, collection: Collection) -> dict[Id, Id]:
+        """Returns the new ids of the models of the last clone by their old ids."""
+        with self.connection.cursor() as curs:
+            result = curs.execute(
+                sql.SQL(
+                    "SELECT old_id, new_id FROM {table} WHERE collection = %s"
+                ).format(table=sql.Identifier(ID_MAP_TABLE)),
+                [collection],
+            ).fetchall()
+        return {row["old_id"]: row["new_id"] for row in result}
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """
+        Rolls back a failed clone without aborting the running transaction, see
+        `DatabaseWriter.savepoint`.
+        """
+        with self.connection.cursor() as curs:
+            curs.execute(sql.SQL("SAVEPOINT clone_meeting"), [])
+        try:
+            yield
+        except BaseException:
+            with self.connection.cursor() as curs:
+                curs.execute(sql.SQL("ROLLBACK TO SAVEPOINT clone_meeting"), [])
+            raise
+        finally:
+            with self.connection.cursor() as curs:
+                curs.execute(sql.SQL("RELEASE SAVEPOINT clone_meeting"), [])
+
+    def get_meeting_reference(self, collection: Collection, meeting_id: Id) -> Id | str:
+        if collection == "mediafile":
+            return fqid_from_collection_and_id("meeting", meeting_id)
+        return meeting_id
+
+    def get_meeting_filter(self, collection: Collection) -> sql.Composable:
+        """Returns the condition for the rows of a meeting with the meeting as argument."""
+        if collection == "meeting":
+            return sql.SQL("id = %s")
+        elif collection == "mediafile":
+            return sql.SQL("owner_id = %s")
+        elif model_registry[collection].has_field("meeting_id"):
+            return sql.SQL("meeting_id = %s")
+        raise BadCodingException(f"Can't clone the {collection} of a meeting.")
+
+    def get_reserve_ids_statement(self, collection: Collection) -> sql.Composed:
+        # ordered beforehand, so that the new ids are in the order of the old ones
+        return sql.SQL("""
+            INSERT INTO {map_table} (collection, old_id, new_id)
+            SELECT {collection}, id, nextval({sequence})
+            FROM (SELECT id FROM {table} WHERE {filter} ORDER BY id) AS source
+            """).format(
+            map_table=sql.Identifier(ID_MAP_TABLE),
+            collection=sql.Literal(collection),
+            sequence=sql.Literal(f"{collection}_t_id_seq"),
+            table=sql.Identifier(f"{collection}_t"),
+            filter=self.get_meeting_filter(collection),
+        )
+
+    def get_copy_rows_statement(
+        self,
+        collection: Collection,
+        collections: list[Collection],
+        cleared_fields: list[str],
+    ) -> sql.Composed:
+        model = model_registry[collection]
+        columns = [
+            field.get_own_field_name()
+            for field in model.get_fields()
+            if not field.is_view_field
+            and field.get_own_field_name() != "organization_id"
+        ]
+        return sql.SQL("""
+            INSERT INTO {table} ({columns})
+            SELECT {values}
+            FROM {table} AS t JOIN {map_table} AS m
+            ON m.collection = {collection} AND m.old_id = t.id
+            """).format(
+            table=sql.Identifier(f"{collection}_t"),
+            columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+            values=sql.SQL(", ").join(
+                (
+                    sql.SQL("NULL")
+                    if column in cleared_fields
+                    else self.get_value(model, column, collections)
+                )
+                for column in columns
+            ),
+            map_table=sql.Identifier(ID_MAP_TABLE),
+            collection=sql.Literal(collection),
+        )
+
+    def get_value(
+        self, model: type[Model], column: str, collections: list[Collection]
+    ) -> sql.Composable:
+        """Returns the value of the column for the clone of the row `t`."""
+        field = model.get_field(column)
+        value = sql.Identifier("t", column)
+        if column == "id":
+            return sql.Identifier("m", "new_id")
+        elif isinstance(field, RelationField):
+            if (target_collection := field.get_target_collection()) not in collections:
+                return value
+            new_id = self.get_new_id(sql.Literal(target_collection), value)
+            if target_collection in SHARED_COLLECTIONS:
+                return sql.SQL("COALESCE({new_id}, {value})").format(
+                    new_id=new_id, value=value
+                )
+            return new_id
+        elif isinstance(field, GenericRelationField):
+            # relations to models which are not cloned are kept
+            target, old_id = self.split_fqid(value)
+            return sql.SQL(
+                "COALESCE({target} || {separator} || {new_id}, {value})"
+            ).format(
+                target=target,
+                separator=sql.Literal(KEYSEPARATOR),
+                new_id=self.get_new_id(target, old_id),
+                value=value,
+            )
+        return value
+
+    def get_new_id(
+        self, collection: sql.Composable, old_id: sql.Composable
+    ) -> sql.Composed:
+        return sql.SQL(
+            "(SELECT new_id FROM {map_table} WHERE collection = {collection} AND old_id = {old_id})"
+        ).format(
+            map_table=sql.Identifier(ID_MAP_TABLE),
+            collection=collection,
+            old_id=old_id,
+        )
+
+    def split_fqid(self, value: sql.Composable) -> tuple[sql.Composed, sql.Composed]:
+        """Returns the collection and the id of an fqid column."""
+        return (
+            sql.SQL("split_part({value}, {separator}, 1)").format(
+                value=value, separator=sql.Literal(KEYSEPARATOR)
+            ),
+            sql.SQL("split_part({value}, {separator}, 2)::integer").format(
+                value=value, separator=sql.Literal(KEYSEPARATOR)
+            ),
+        )
+
+    def is_primary_nm_relation(self, field: Field) -> bool:
+        return bool(
+            field.is_primary
+            and field.write_fields
+            and isinstance(field, (RelationListField, GenericRelationListField))
+        )
+
+    def get_copy_intermediate_rows_statement(
+        self, collection: Collection, field: Field, collections: list[Collection]
+    ) -> sql.Composed:
+        """
+        Copies the rows of the n:m table of the field whose own side is cloned.
+        Rows whose other side belongs to a cloned collection are only copied if
+        that model is cloned, too.
+        """
+        assert field.write_fields
+        table, own_column, other_column, _ = field.write_fields
+        other_value = sql.Identifier("r", other_column)
+        if isinstance(field, GenericRelationListField):
+            target, old_id = self.split_fqid(other_value)
+            is_cloned = all(target_ in collections for target_ in field.to)
+            join = sql.SQL(
+                "{join} {map_table} AS o ON o.collection = {target} AND o.old_id = {old_id}"
+            ).format(
+                join=sql.SQL("JOIN" if is_cloned else "LEFT JOIN"),
+                map_table=sql.Identifier(ID_MAP_TABLE),
+                target=target,
+                old_id=old_id,
+            )
+            other: sql.Composable = sql.SQL(
+                "{target} || {separator} || o.new_id"
+            ).format(target=target, separator=sql.Literal(KEYSEPARATOR))
+            if not is_cloned:
+                other = sql.SQL("COALESCE({other}, {value})").format(
+                    other=other, value=other_value
+                )
+        elif (
+            isinstance(field, RelationListField)
+            and (target_collection := field.get_target_collection()) in collections
+        ):
+            join = sql.SQL(
+                "JOIN {map_table} AS o ON o.collection = {target} AND o.old_id = {old_id}"
+            ).format(
+                map_table=sql.Identifier(ID_MAP_TABLE),
+                target=sql.Literal(target_collection),
+                old_id=other_value,
+            )
+            other = sql.SQL("o.new_id")
+        else:
+            join = sql.Composed([])
+            other = other_value
+        return sql.SQL("""
+            INSERT INTO {table} ({own_column}, {other_column})
+            SELECT m.new_id, {other}
+            FROM {table} AS r JOIN {map_table} AS m
+            ON m.collection = {collection} AND m.old_id = {own_value}
+            {join}
+            """).format(
+            table=sql.Identifier(table),
+            own_column=sql.Identifier(own_column),
+            other_column=sql.Identifier(other_column),
+            other=other,
+            map_table=sql.Identifier(ID_MAP_TABLE),
+            collection=sql.Literal(collection),
+            own_value=sql.Identifier("r", own_column),
+            join=join,
+        )
@@ -1,12 +1,9 @@
+from collections.abc import Iterator
+from time import time
 from typing import Any
 
 from psycopg import Connection, rows, sql
-from psycopg.errors import (
-    SerializationFailure,
-    UndefinedColumn,
-    UndefinedFunction,
-    UndefinedTable,
-)
+from psycopg.errors import UndefinedColumn, UndefinedFunction, UndefinedTable
 
 from openslides_backend.services.postgresql.db_connection_handling import (
     retry_on_db_failure,
@@ -22,6 +19,7 @@ from ..database.commands import GetManyRequest
 from .interface import SqlArgumentsExtended
 from .mapped_fields import MappedFields
 from .query_helper import SqlQueryHelper
+from .write_scheduler import CONFLICT_ERRORS, write_scheduler
 
 
 class DatabaseReader(SqlQueryHelper):
@@ -119,6 +117,30 @@ class DatabaseReader(SqlQueryHelper):
                     e.message += "\nCheck filter fields."
             raise e
 
+    def stream(
+        self,
+        collection: Collection,
+        filter_: Filter | None,
+        mapped_fields: MappedFields,
+        batch_size: int,
+    ) -> Iterator[dict[Id, PartialModel]]:
+        """
+        Yields the matching models in batches of at most batch_size models. The
+        models are read with a server-side cursor, so only one batch is held in
+        memory at a time. Must be called inside of a transaction.
+        """
+        if "id" not in mapped_fields.unique_fields:
+            mapped_fields.unique_fields.append("id")
+        query, arguments = self.build_filter_query(collection, filter_, mapped_fields)
+        query += sql.SQL(" ORDER BY id")
+        try:
+            with self.connection.cursor(name=f"stream_{collection}") as curs:
+                curs.execute(query, arguments)
+                while rows := curs.fetchmany(batch_size):
+                    yield {row["id"]: row for row in rows}
+        except (UndefinedColumn, UndefinedTable, UndefinedFunction) as e:
+            raise InvalidFormat(f"Invalid stream of collection '{collection}': {e}")
+
     def is_field_in_filter(self, field: str, filter_: Filter) -> bool:
         if isinstance(filter_, Not):
             return self.is_field_in_filter(field, filter_.not_filter)
@@ -220,6 +242,28 @@ class DatabaseReader(SqlQueryHelper):
         query = sql.SQL("SELECT ") + query
         return self.execute_query("custom", query, lock_result, None, arguments)
 
+    def stream_custom_select(
+        self,
+        query: sql.Composed | sql.SQL,
+        arguments: SqlArgumentsExtended = [],
+        batch_size: int = 1000,
+    ) -> Iterator[list[PartialModel]]:
+        """
+        Like `execute_custom_select`, but yields the rows in batches of at most
+        batch_size rows which are read with a server-side cursor. Must be called
+        inside of a transaction.
+        """
+        if isinstance(query, sql.SQL):
+            query = sql.Composed([query])
+        query = sql.SQL("SELECT ") + query
+        try:
+            with self.connection.cursor(name="stream_custom") as curs:
+                curs.execute(query, arguments)
+                while rows := curs.fetchmany(batch_size):
+                    yield rows
+        except (UndefinedColumn, UndefinedTable, UndefinedFunction) as e:
+            raise InvalidFormat(f"Invalid custom stream: {e}")
+
     @retry_on_db_failure
     def execute_query(
         self,
@@ -232,9 +276,12 @@ class DatabaseReader(SqlQueryHelper):
     ) -> list[PartialModel]:
         if lock_result and not aggregate:
             query += sql.SQL(" FOR UPDATE")
+        start = time()
         try:
             with self.connection.cursor() as curs:
                 results = curs.execute(query, arguments).fetchall()
+            if lock_result and not aggregate:
+                write_scheduler.add_lock_wait_time(time() - start)
         except UndefinedColumn as e:
             column = e.args[0].split('"')[1]
             error_msg = (
@@ -249,7 +296,7 @@ class DatabaseReader(SqlQueryHelper):
             )
         except UndefinedFunction as e:
             raise InvalidFormat(e.diag.message_primary or "")
-        except SerializationFailure as e:
+        except CONFLICT_ERRORS as e:
             raise e
         except Exception as e:
             raise DatabaseException(f"Unexpected error reading from database: {e}")
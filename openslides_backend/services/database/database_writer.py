@@ -1,8 +1,10 @@
-import threading
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import time
 from typing import Any
 
-from psycopg import Connection, adapt, rows, sql
+from psycopg import Connection, Error, adapt, rows, sql
 from psycopg.errors import (
     CheckViolation,
     DatatypeMismatch,
@@ -27,6 +29,9 @@ from openslides_backend.models.fields import (
 from openslides_backend.services.postgresql.db_connection_handling import (
     retry_on_db_failure,
 )
+from openslides_backend.services.postgresql.preflight_cache import (
+    notify_preflight_change,
+)
 from openslides_backend.shared.exceptions import (
     BadCodingException,
     InvalidData,
@@ -52,18 +57,47 @@ from openslides_backend.shared.patterns import (
     fqid_from_collection_and_id,
 )
 from openslides_backend.shared.typing import JSON, PartialModel
+from openslides_backend.shared.util import ONE_ORGANIZATION_FQID
 
 from ...shared.interfaces.env import Env
 from ...shared.interfaces.logging import LoggingModule
 from .database_reader import DatabaseReader
 from .event_types import EVENT_TYPE
 from .query_helper import SqlQueryHelper
+from .write_scheduler import CONFLICT_ERRORS, write_scheduler
 
 EventData = tuple[FullQualifiedId, EVENT_TYPE, JSON, int]
 
+# postgres does not accept more parameters within one statement
+MAX_STATEMENT_PARAMETERS = 65535
+
+
+class WriteBatch:
+    """
+    Collects consecutive create or delete events with known ids, which can be
+    written together without changing the outcome of the event order.
+    """
+
+    def __init__(self) -> None:
+        self.event_type: EventType | None = None
+        self.events: list[tuple[Event, Collection, Id]] = []
+        self.fqids: set[FullQualifiedId] = set()
+
+    def accepts(self, event_type: EventType, collection: Collection, id_: Id) -> bool:
+        return (
+            self.event_type in (None, event_type)
+            and fqid_from_collection_and_id(collection, id_) not in self.fqids
+        )
+
+    def add(self, event: Event, collection: Collection, id_: Id) -> None:
+        self.event_type = event["type"]
+        self.events.append((event, collection, id_))
+        self.fqids.add(fqid_from_collection_and_id(collection, id_))
+
 
 class DatabaseWriter(SqlQueryHelper):
-    _lock = threading.Lock()
+    # maximum number of rows written by one batched statement
+    BATCH_SIZE = 1000
     database_reader: DatabaseReader
     env: Env
 
@@ -83,13 +117,19 @@ class DatabaseWriter(SqlQueryHelper):
         self.write_requests = write_requests
 
         modified_models: dict[FullQualifiedId, dict[str, Any]] = defaultdict(dict)
-        with self._lock:
+        start = time()
+        try:
             for write_request in self.write_requests:
                 with make_span(self.env, "write with database context"):
 
                     results = self.write_events(write_request.events)
                     for fqid, model in results.items():
                         modified_models[fqid].update(model)
+            if ONE_ORGANIZATION_FQID in modified_models:
+                # the default language of the organization is cached per worker
+                notify_preflight_change(self.connection)
+        finally:
+            write_scheduler.add_write_time(time() - start)
 
         return modified_models
 
@@ -100,12 +140,18 @@ class DatabaseWriter(SqlQueryHelper):
         self,
         events: list[Event],
     ) -> dict[FullQualifiedId, dict[str, Any]]:
+        """
+        Writes the events in their given order. Consecutive create events with a
+        known id and consecutive delete events are collected into batches and
+        written with multi-row statements, see `flush_batches`.
+        """
         if not events:
             raise BadCodingException("Events are needed.")
 
         models_created_or_updated: dict[FullQualifiedId, dict[str, Any]] = defaultdict(
             dict
         )
+        batch = WriteBatch()
         for event in events:
             if fqid := event.get("fqid"):
                 collection, id_ = collection_and_id_from_fqid(fqid)
@@ -124,6 +170,16 @@ class DatabaseWriter(SqlQueryHelper):
                 collection = event["collection"]
                 id_ = None
 
+            if id_ and event["type"] in (EventType.Create, EventType.Delete):
+                if not batch.accepts(event["type"], collection, id_):
+                    self.flush_batches(batch, models_created_or_updated)
+                    batch = WriteBatch()
+                batch.add(event, collection, id_)
+                continue
+            if batch.events:
+                self.flush_batches(batch, models_created_or_updated)
+                batch = WriteBatch()
+
             match event["type"]:
                 case EventType.Create:
                     fqid, data = self.insert_model(event, collection, id_)
@@ -137,9 +193,201 @@ class DatabaseWriter(SqlQueryHelper):
                     models_created_or_updated[
                         self.delete_model(event, collection, id_)
                     ] = {}
+        if batch.events:
+            self.flush_batches(batch, models_created_or_updated)
 
         return models_created_or_updated
 
+    def flush_batches(
+        self,
+        batch: "WriteBatch",
+        models_created_or_updated: dict[FullQualifiedId, dict[str, Any]],
+    ) -> None:
+        """
+        Writes the collected create or delete events of the batch. Single events
+        are written with the normal statements. If a batched statement fails,
+        the batch is rolled back to a savepoint and replayed event by event, so
+        that the errors are reported per fqid exactly as without batching.
+        """
+        if len(batch.events) == 1:
+            event, collection, id_ = batch.events[0]
+            if batch.event_type == EventType.Create:
+                fqid, data = self.insert_model(event, collection, id_)
+                models_created_or_updated[fqid] = data
+            else:
+                models_created_or_updated[self.delete_model(event, collection, id_)] = (
+                    {}
+                )
+            return
+
+        try:
+            with self.savepoint():
+                if batch.event_type == EventType.Create:
+                    results = self.insert_models(batch.events)
+                else:
+                    results = self.delete_models(batch.events)
+        except CONFLICT_ERRORS:
+            # conflicts with concurrent transactions are retried by the write scheduler
+            raise
+        except Error:
+            for event, collection, id_ in batch.events:
+                if batch.event_type == EventType.Create:
+                    fqid, data = self.insert_model(event, collection, id_)
+                    models_created_or_updated[fqid] = data
+                else:
+                    models_created_or_updated[
+                        self.delete_model(event, collection, id_)
+                    ] = {}
+            return
+        for fqid, data in results.items():
+            models_created_or_updated[fqid] = data
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """
+        Explicit savepoint within the running transaction. Used instead of
+        `connection.transaction()`, which would commit if no transaction was
+        started yet. Any exception rolls the changes back to the savepoint, the
+        savepoint is always released.
+        """
+        with self.connection.cursor() as curs:
+            curs.execute(sql.SQL("SAVEPOINT batch_write"), [])
+        try:
+            yield
+        except BaseException:
+            with self.connection.cursor() as curs:
+                curs.execute(sql.SQL("ROLLBACK TO SAVEPOINT batch_write"), [])
+            raise
+        finally:
+            with self.connection.cursor() as curs:
+                curs.execute(sql.SQL("RELEASE SAVEPOINT batch_write"), [])
+
+    def insert_models(
+        self, events: list[tuple[Event, Collection, Id]]
+    ) -> dict[FullQualifiedId, dict[str, Any]]:
+        """
+        Inserts the models of the create events with one multi-row statement per
+        collection, column set and return fields. The rows for the n:m
+        intermediate tables are collected and written per table afterwards.
+        """
+        groups: dict[
+            tuple[Collection, tuple[str, ...], tuple[str, ...]], list[list[Any]]
+        ] = defaultdict(list)
+        intermediate_rows: dict[tuple[str, str, str], list[tuple[Any, Any]]] = (
+            defaultdict(list)
+        )
+        for event, collection, id_ in events:
+            event_fields = event.get("fields", dict())
+            event_return_fields = event.get("return_fields", ["id"])
+            if "id" not in event_return_fields:
+                event_return_fields.append("id")
+            simple_fields, intermediate_tables = (
+                self.get_simple_fields_intermediate_table(event_fields, collection)
+            )
+            if not simple_fields.get("id"):
+                simple_fields["id"] = id_
+            groups[
+                (collection, tuple(simple_fields), tuple(event_return_fields))
+            ].append(list(simple_fields.values()))
+            for field_name, field in intermediate_tables.items():
+                if not field.write_fields:
+                    raise BadCodingException(
+                        f"The field {field_name} should be in an n:m relation and thus have the corresponding table information."
+                    )
+                intermediate_table, close_side, far_side, _ = field.write_fields
+                intermediate_rows[(intermediate_table, close_side, far_side)].extend(
+                    (id_, value) for value in event_fields.get(field_name) or []
+                )
+
+        results: dict[FullQualifiedId, dict[str, Any]] = {}
+        with self.connection.cursor() as curs:
+            for (collection, columns, return_fields), values in groups.items():
+                for chunk in self.get_batch_chunks(values, len(columns)):
+                    statement = sql.SQL("""
+                        INSERT INTO {table_name} ({columns})
+                        VALUES {rows}
+                        RETURNING {return_fields}
+                        """).format(
+                        table_name=sql.Identifier(f"{collection}_t"),
+                        columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+                        rows=self.get_rows_placeholder(len(chunk), len(columns)),
+                        return_fields=sql.SQL(", ").join(
+                            sql.SQL(field) for field in return_fields
+                        ),
+                    )
+                    curs.execute(statement, [value for row in chunk for value in row])
+                    for result in curs.fetchall():
+                        results[
+                            fqid_from_collection_and_id(collection, result["id"])
+                        ] = result
+            for (
+                table_name,
+                own_column,
+                other_column,
+            ), pairs in intermediate_rows.items():
+                for chunk in self.get_batch_chunks(pairs, 2):
+                    statement = sql.SQL("""
+                        INSERT INTO {table_name} ({columns})
+                        VALUES {rows}
+                        ON CONFLICT ({columns}) DO NOTHING
+                        """).format(
+                        table_name=sql.Identifier(table_name),
+                        columns=sql.Identifier(own_column)
+                        + sql.SQL(", ")
+                        + sql.Identifier(other_column),
+                        rows=self.get_rows_placeholder(len(chunk), 2),
+                    )
+                    curs.execute(statement, [value for pair in chunk for value in pair])
+        return results
+
+    def delete_models(
+        self, events: list[tuple[Event, Collection, Id]]
+    ) -> dict[FullQualifiedId, dict[str, Any]]:
+        """
+        Deletes the models of the delete events with one statement per collection.
+        Raises ModelDoesNotExist for the first fqid in event order that was not
+        deleted.
+        """
+        ids_per_collection: dict[Collection, list[Id]] = defaultdict(list)
+        for _, collection, id_ in events:
+            ids_per_collection[collection].append(id_)
+        deleted: set[FullQualifiedId] = set()
+        with self.connection.cursor() as curs:
+            for collection, ids in ids_per_collection.items():
+                statement = sql.SQL("""
+                    DELETE FROM {table_name} WHERE id = ANY(%s)
+                    RETURNING id
+                    """).format(table_name=sql.Identifier(f"{collection}_t"))
+                curs.execute(statement, [ids])
+                deleted.update(
+                    fqid_from_collection_and_id(collection, row["id"])
+                    for row in curs.fetchall()
+                )
+        results: dict[FullQualifiedId, dict[str, Any]] = {}
+        for _, collection, id_ in events:
+            fqid = fqid_from_collection_and_id(collection, id_)
+            if fqid not in deleted:
+                raise ModelDoesNotExist(fqid)
+            results[fqid] = {}
+        return results
+
+    def get_batch_chunks(self, rows: list[Any], row_length: int) -> Iterator[list[Any]]:
+        """
+        Splits the rows into chunks that stay within the batch size and within
+        the maximum number of parameters of a postgres statement.
+        """
+        chunk_size = max(
+            1, min(self.BATCH_SIZE, MAX_STATEMENT_PARAMETERS // max(row_length, 1))
+        )
+        for i in range(0, len(rows), chunk_size):
+            yield rows[i : i + chunk_size]
+
+    def get_rows_placeholder(self, row_count: int, row_length: int) -> sql.Composed:
+        row = sql.SQL("({})").format(
+            sql.SQL(", ").join(sql.Placeholder() for _ in range(row_length))
+        )
+        return sql.SQL(", ").join(row for _ in range(row_count))
+
     def insert_model(
         self, event: Event, collection: Collection, id_: Id | None
     ) -> tuple[FullQualifiedId, dict[str, Any]]:
@@ -289,7 +537,7 @@ class DatabaseWriter(SqlQueryHelper):
             * a dict of the fields that do not need special handling within an intermediate table.
             * a dict of the other fields with their field representation from the model_registry.
         """
-        collection_cls = model_registry[collection]()
+        collection_cls = model_registry[collection]
         return {
             field_name: value
             for field_name, value in event_fields.items()
@@ -315,7 +563,7 @@ class DatabaseWriter(SqlQueryHelper):
             * a dict of all fields that are just list fields with the field list type
             * a dict of all fields that are relation fields
         """
-        collection_cls = model_registry[collection]()
+        collection_cls = model_registry[collection]
         array_type_dict = dict()
         nm_relation_list_fields = dict()
         for dictionary in [add_dict, remove_dict]:
@@ -609,3 +857,4 @@ class DatabaseWriter(SqlQueryHelper):
             curs.execute("SELECT tablename from pg_tables WHERE schemaname = 'public'")
             table_names = ", ".join(table["tablename"] for table in curs.fetchall())
         self.connection.execute(f"TRUNCATE TABLE {table_names} RESTART IDENTITY;")
+        notify_preflight_change(self.connection)
@@ -1,6 +1,6 @@
 from collections import defaultdict
-from collections.abc import Sequence
-from typing import Any, cast
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from typing import Any, TypeVar, cast
 
 from psycopg import Connection, rows, sql
 
@@ -14,6 +14,7 @@ from openslides_backend.models.fields import (
 from openslides_backend.services.database.interface import (
     COLLECTION_MAX_LEN,
     FQID_MAX_LEN,
+    MappedFieldsPerFqid,
 )
 from openslides_backend.shared.exceptions import (
     BadCodingException,
@@ -48,6 +49,8 @@ from ...shared.patterns import (
 from ...shared.typing import DeletedModel, Model, ModelMap
 from ..database.commands import GetManyRequest
 from ..database.interface import Database
+from .changed_models_index import ChangedModelsIndex
+from .clone_engine import MeetingCloneEngine
 from .database_reader import DatabaseReader
 from .database_writer import DatabaseWriter
 from .interface import SqlArgumentsExtended
@@ -56,6 +59,8 @@ from .mapped_fields import MappedFields
 MappedFieldsPerCollectionAndId = dict[str, dict[Id, list[str]]]
 VALID_AGGREGATE_FUNCTIONS = ["min", "max", "count"]
 
+T = TypeVar("T")
+
 
 class ExtendedDatabase(Database):
     """
@@ -102,9 +107,13 @@ class ExtendedDatabase(Database):
         self._changed_models = defaultdict(lambda: defaultdict(dict))
         self._to_be_deleted: set[FullQualifiedId] = set()
         self._to_be_deleted_for_protected: set[FullQualifiedId] = set()
+        self._collection_versions: dict[Collection, int] = defaultdict(int)
+        self._cache: dict[Hashable, tuple[tuple[int, ...], Any]] = {}
+        self._index = ChangedModelsIndex(self._model_fits_filter)
         self.connection = connection
         self.database_reader = DatabaseReader(self.connection, logging, env)
         self.database_writer = DatabaseWriter(self.connection, logging, env)
+        self.clone_engine = MeetingCloneEngine(self.connection, logging, env)
 
     def apply_changed_model(
         self, fqid: FullQualifiedId, instance: PartialModel, replace: bool = False
@@ -114,12 +123,17 @@ class ExtendedDatabase(Database):
         Automatically adds missing id field.
         """
         collection, id_ = collection_and_id_from_fqid(fqid)
+        snapshot = self._index.get_snapshot(
+            collection, self._changed_models[collection].get(id_)
+        )
         if replace or isinstance(instance, DeletedModel):
             self._changed_models[collection][id_] = instance
         else:
             self._changed_models[collection][id_].update(instance)
-        if "id" not in self._changed_models[collection][id_]:
-            self._changed_models[collection][id_]["id"] = id_
+        if "id" not in (model := self._changed_models[collection][id_]):
+            model["id"] = id_
+        self._index.update(collection, id_, model, snapshot)
+        self._collection_versions[collection] += 1
 
     def apply_to_be_deleted(self, fqid: FullQualifiedId) -> None:
         """
@@ -269,16 +283,27 @@ class ExtendedDatabase(Database):
             )
             # fetch missing fields in the changed_models from the db and merge into the results
             if missing_fields_per_collection_and_id:
-                get_many_requests = [
-                    GetManyRequest(collection, [id_], fields)
-                    for collection, id_fields_dict in missing_fields_per_collection_and_id.items()
-                    for id_, fields in id_fields_dict.items()
-                ]
                 missing_results = self.database_reader.get_many(
-                    get_many_requests, lock_result
+                    self._plan_missing_field_requests(
+                        missing_fields_per_collection_and_id
+                    ),
+                    lock_result,
                 )
                 for collection, models in missing_results.items():
+                    missing_fields_per_id = missing_fields_per_collection_and_id[
+                        collection
+                    ]
                     for id_, model in models.items():
+                        if (missing_fields := missing_fields_per_id.get(id_)) is None:
+                            continue
+                        if missing_fields:
+                            # the request contains the fields missing for all ids of the
+                            # collection, so only take the ones missing for this id
+                            model = {
+                                field: model[field]
+                                for field in ("id", *missing_fields)
+                                if field in model
+                            }
                         # we can just update the model with the db fields since they must not have been
                         # present previously
                         results.setdefault(collection, {}).setdefault(id_, {}).update(
@@ -302,6 +327,107 @@ class ExtendedDatabase(Database):
             results = self.database_reader.get_many(get_many_requests, lock_result)
         return results
 
+    def get_by_fqids(
+        self,
+        mapped_fields_per_fqid: MappedFieldsPerFqid,
+        lock_result: LockResult = True,
+        use_changed_models: bool = True,
+    ) -> dict[FullQualifiedId, PartialModel]:
+        """
+        Returns the same models as calling `get` with `raise_exception=False` for
+        each fqid, but fetches everything missing in the changed_models with one
+        request per collection. Models which do not exist are returned as empty
+        dicts.
+        """
+        results: dict[FullQualifiedId, PartialModel] = {}
+        # collection -> id -> (missing fields, changed model copy)
+        to_fetch: dict[Collection, dict[Id, tuple[list[str], PartialModel]]] = (
+            defaultdict(dict)
+        )
+        for fqid, mapped_fields in mapped_fields_per_fqid.items():
+            if not mapped_fields:
+                raise BadCodingException("No mapped fields given.")
+            collection, id_ = collection_and_id_from_fqid(fqid)
+            changed_model_copy: PartialModel = {}
+            if use_changed_models and (
+                changed_model := self._changed_models[collection][id_]
+            ):
+                if self.is_deleted(fqid):
+                    raise ModelDoesNotExist(fqid)
+                changed_model_copy = {
+                    k: changed_model[k]
+                    for k in mapped_fields + ["id"]
+                    if k in changed_model
+                }
+                mapped_fields = [
+                    field for field in mapped_fields if field not in changed_model_copy
+                ]
+                if not mapped_fields:
+                    results[fqid] = changed_model_copy
+                    continue
+            if self.is_new(fqid):
+                results[fqid] = changed_model_copy
+            else:
+                to_fetch[collection][id_] = (mapped_fields, changed_model_copy)
+
+        for collection, fields_per_id in to_fetch.items():
+            all_fields = {
+                field for fields, _ in fields_per_id.values() for field in fields
+            }
+            try:
+                db_models = self.database_reader.get_many(
+                    [GetManyRequest(collection, list(fields_per_id), all_fields)],
+                    lock_result,
+                ).get(collection, {})
+            except DatabaseException:
+                # fall back to single requests to return the results of the
+                # models that can be read
+                for id_ in fields_per_id:
+                    fqid = fqid_from_collection_and_id(collection, id_)
+                    results[fqid] = self.get(
+                        fqid,
+                        mapped_fields_per_fqid[fqid],
+                        lock_result,
+                        use_changed_models,
+                        raise_exception=False,
+                    )
+                continue
+            for id_, (mapped_fields, changed_model_copy) in fields_per_id.items():
+                fqid = fqid_from_collection_and_id(collection, id_)
+                if not (db_model := db_models.get(id_)):
+                    results[fqid] = {}
+                    continue
+                result = {
+                    k: db_model[k] for k in mapped_fields + ["id"] if k in db_model
+                }
+                result.update(changed_model_copy)
+                results[fqid] = {k: v for k, v in result.items() if v is not None}
+        return results
+
+    def _plan_missing_field_requests(
+        self,
+        missing_fields_per_collection_and_id: MappedFieldsPerCollectionAndId,
+    ) -> list[GetManyRequest]:
+        """
+        Merges the missing fields of all ids of a collection into a single request
+        with the union of the fields, so that only one query per collection is needed.
+        An empty field list means that the whole model is needed.
+        """
+        get_many_requests = []
+        for collection, id_fields_dict in missing_fields_per_collection_and_id.items():
+            if not id_fields_dict:
+                continue
+            fields: dict[str, None] = {}
+            for id_fields in id_fields_dict.values():
+                if not id_fields:
+                    fields = {}
+                    break
+                fields.update(dict.fromkeys(id_fields))
+            get_many_requests.append(
+                GetManyRequest(collection, list(id_fields_dict), list(fields))
+            )
+        return get_many_requests
+
     def _get_many_from_changed_models(
         self,
         mapped_fields_per_collection_and_id: MappedFieldsPerCollectionAndId,
@@ -375,15 +501,28 @@ class ExtendedDatabase(Database):
             if use_changed_models and (
                 changed_models_collection := self._changed_models[collection]
             ):
-                fully_matched_ids = []
+                fully_matched_ids: set[Id] = set()
                 partially_matched_ids = []
                 except_by_changed_models = set()
                 # collect all relevant fields from the filter operators
                 filter_fields = set()
                 filter_visitor(filter_, lambda fo: filter_fields.add(fo.field))
+                # if the filter requires a relation field to equal a value, only the changed models
+                # which may have this value need to be looked at, all others are removed from the result
+                field_index, value = self._index.get_field_index(
+                    collection, filter_, changed_models_collection
+                )
+                candidates: Iterable[tuple[Id, PartialModel]]
+                if field_index:
+                    candidates = [
+                        (id_, changed_models_collection[id_])
+                        for id_ in field_index.get_candidates(value)
+                    ]
+                else:
+                    candidates = changed_models_collection.items()
                 # identify and get models that could lead to matches in conjunction with the database
                 # we are currently slightly overmatching but we filter again on the full model
-                for id_, changed_model in changed_models_collection.items():
+                for id_, changed_model in candidates:
                     if isinstance(
                         changed_model, DeletedModel
                     ) or self._model_fails_filter(
@@ -397,7 +536,7 @@ class ExtendedDatabase(Database):
                         filter_field in changed_model for filter_field in filter_fields
                     ):
                         if self._model_fits_filter(changed_model, filter_):
-                            fully_matched_ids.append(id_)
+                            fully_matched_ids.add(id_)
                     elif self._model_fits_subfilter(changed_model, filter_):
                         partially_matched_ids.append(id_)
                 if partially_matched_ids:
@@ -419,21 +558,39 @@ class ExtendedDatabase(Database):
                     else:
                         partially_matched_models[id_] = changed_models_collection[id_]
                     if self._model_fits_filter(partially_matched_models[id_], filter_):
-                        fully_matched_ids.append(id_)
+                        fully_matched_ids.add(id_)
                     # we can and should exclude here since the models are not wanted
                     # as they could fit without the changed models data
                     else:
                         except_by_changed_models.add(id_)
-                # update filter for fast query of mapped fields
+                # update filter for fast query of mapped fields, new models are not in the database
                 filter_ = And(
                     Not(FilterOperator("id", "in", list(except_by_changed_models))),
-                    Or(FilterOperator("id", "in", fully_matched_ids), filter_),
+                    Or(
+                        FilterOperator(
+                            "id",
+                            "in",
+                            [
+                                id_
+                                for id_ in fully_matched_ids
+                                if not changed_models_collection[id_].get("meta_new")
+                            ],
+                        ),
+                        filter_,
+                    ),
                 )
             result = self.database_reader.filter(
                 collection, filter_, MappedFields(mapped_fields), lock_result
             )
-            if use_changed_models:
-                for id_, changed_model in changed_models_collection.items():
+            if use_changed_models and changed_models_collection:
+                if field_index:
+                    for id_ in list(result):
+                        if id_ in changed_models_collection and (
+                            isinstance(changed_models_collection[id_], DeletedModel)
+                            or field_index.excludes(id_, value)
+                        ):
+                            del result[id_]
+                for id_, changed_model in candidates:
                     # new models will not be in the filter result. So we need to search them in the before matched ids and add a dict.
                     if changed_model.get("meta_new") and id_ in fully_matched_ids:
                         result[id_] = dict()
@@ -466,9 +623,18 @@ class ExtendedDatabase(Database):
         if method not in VALID_AGGREGATE_FUNCTIONS:
             raise BadCodingException(f"Invalid aggregate function: {method}")
         if use_changed_models and self._changed_models[collection]:
+            # the results are cached and kept up to date while new models are applied
+            key: Hashable | None = (method, filter_, field_or_star, lock_result)
+            try:
+                if entry := self._index.get_aggregate(collection, key):
+                    return entry.value
+            except TypeError:
+                # filter with unhashable values
+                key = None
+            value: int | None
             match method:
                 case "count":
-                    return len(self.filter(collection, filter_, [], lock_result))
+                    value = len(self.filter(collection, filter_, [], lock_result))
                 case "min" | "max":
                     response = self.filter(
                         collection,
@@ -484,13 +650,18 @@ class ExtendedDatabase(Database):
                         ]
                     ):
                         if method == "max":
-                            return max(response_values)
+                            value = max(response_values)
                         else:
-                            return min(response_values)
+                            value = min(response_values)
                     else:
-                        return None
+                        value = None
                 case _:
                     raise BadCodingException(f"Invalid aggregate function: {method}")
+            if key and filter_:
+                self._index.set_aggregate(
+                    collection, key, method, filter_, field_or_star, value
+                )
+            return value
         else:
             return self.database_reader.aggregate(
                 collection, filter_, method, field_or_star, lock_result
@@ -545,6 +716,23 @@ class ExtendedDatabase(Database):
     def reset(self, hard: bool = True) -> None:
         if hard:
             self._changed_models.clear()
+            self._cache.clear()
+            self._index.clear()
+
+    def get_cached(
+        self, key: Hashable, collections: Iterable[Collection], fn: Callable[[], T]
+    ) -> T:
+        """
+        Returns the result of fn which is cached for the rest of the request under the
+        given key. The cached result is invalidated as soon as a model of one of the
+        given collections is changed or anything is written to the database.
+        """
+        versions = tuple(self._collection_versions[c] for c in collections)
+        if (cached := self._cache.get(key)) is not None and cached[0] == versions:
+            return cached[1]
+        result = fn()
+        self._cache[key] = (versions, result)
+        return result
 
     def reserve_ids(self, collection: Collection, amount: int) -> Sequence[int]:
         self.logger.debug(
@@ -597,7 +785,7 @@ class ExtendedDatabase(Database):
                         raise InvalidFormat("No fields given.")
                 if list_fields := event.get("list_fields", ListFields()):
                     # TODO there should be a performance improvement by generating a tuple with the field that can then be used by the database_writer
-                    collection_cls = model_registry[collection]()
+                    collection_cls = model_registry[collection]
                     for add_or_remove_dict in list_fields.values():
                         for field_name in cast(dict, add_or_remove_dict):
                             field: Field = collection_cls.get_field(field_name)
@@ -613,6 +801,8 @@ class ExtendedDatabase(Database):
                                 raise InvalidFormat(
                                     f"'{field_name}' used for 'list_fields' 'remove' or 'add' is no array in database."
                                 )
+        self._cache.clear()
+        self._index.clear_aggregates()
         # TODO there should be an improvement by sending each event directly to the database_writers write_event
         fqids_to_models = self.database_writer.write(write_requests)
         self.logger.debug(
@@ -624,6 +814,27 @@ class ExtendedDatabase(Database):
     def truncate_db(self) -> None:
         self.database_writer.truncate_db()
 
+    def clone_meeting(
+        self,
+        meeting_id: Id,
+        collections: Iterable[Collection],
+        cleared_fields: dict[Collection, list[str]] = {},
+    ) -> Id:
+        """
+        Clones the meeting with all its models directly in the database and
+        returns the id of the new meeting. The changed_models are not applied.
+        """
+        self._cache.clear()
+        self._index.clear_aggregates()
+        return self.clone_engine.clone(meeting_id, collections, cleared_fields)
+
+    def get_clone_id_map(self, collection: Collection) -> dict[Id, Id]:
+        """
+        Returns the new ids of the models of the last cloned meeting by their old
+        ids.
+        """
+        return self.clone_engine.get_id_map(collection)
+
     def get_everything(self) -> dict[Collection, dict[int, Model]]:
         return {
             k: v
@@ -636,6 +847,21 @@ class ExtendedDatabase(Database):
             if v
         }
 
+    def stream(
+        self,
+        collection: Collection,
+        filter_: Filter | None,
+        mapped_fields: list[str],
+        batch_size: int = 1000,
+    ) -> Iterator[dict[Id, PartialModel]]:
+        """
+        Yields the matching models from the database in batches. The changed_models
+        are not applied.
+        """
+        return self.database_reader.stream(
+            collection, filter_, MappedFields(mapped_fields), batch_size
+        )
+
     def execute_custom_select(
         self,
         query: sql.Composed | sql.SQL,
@@ -644,6 +870,18 @@ class ExtendedDatabase(Database):
     ) -> list[PartialModel]:
         return self.database_reader.execute_custom_select(query, lock_result, arguments)
 
+    def stream_custom_select(
+        self,
+        query: sql.Composed | sql.SQL,
+        arguments: SqlArgumentsExtended = [],
+        batch_size: int = 1000,
+    ) -> Iterator[list[PartialModel]]:
+        """
+        Yields the results of the custom select in batches. The changed_models
+        are not applied.
+        """
+        return self.database_reader.stream_custom_select(query, arguments, batch_size)
+
     def _model_fits_subfilter(
         self, model: Model, filter_: Filter, negation: bool = False
     ) -> bool:
@@ -1,6 +1,6 @@
 from abc import abstractmethod
-from collections.abc import Sequence
-from typing import Any, Protocol
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from typing import Any, Protocol, TypeVar
 
 from psycopg import sql
 
@@ -28,6 +28,8 @@ COLLECTIONFIELD_MAX_LEN = 239  # collection + field
 SqlArguments = list[str | int]
 SqlArgumentsExtended = tuple[list[Id]] | SqlArguments
 
+T = TypeVar("T")
+
 
 class Database(Protocol):
     """
@@ -79,6 +81,14 @@ class Database(Protocol):
         use_changed_models: bool = True,
     ) -> dict[Collection, dict[int, PartialModel]]: ...
 
+    @abstractmethod
+    def get_by_fqids(
+        self,
+        mapped_fields_per_fqid: MappedFieldsPerFqid,
+        lock_result: LockResult = True,
+        use_changed_models: bool = True,
+    ) -> dict[FullQualifiedId, PartialModel]: ...
+
     @abstractmethod
     def get_all(
         self,
@@ -149,6 +159,17 @@ class Database(Protocol):
     @abstractmethod
     def truncate_db(self) -> None: ...
 
+    @abstractmethod
+    def clone_meeting(
+        self,
+        meeting_id: Id,
+        collections: Iterable[Collection],
+        cleared_fields: dict[Collection, list[str]] = {},
+    ) -> Id: ...
+
+    @abstractmethod
+    def get_clone_id_map(self, collection: Collection) -> dict[Id, Id]: ...
+
     @abstractmethod
     def is_deleted(self, fqid: FullQualifiedId) -> bool: ...
 
@@ -158,9 +179,23 @@ class Database(Protocol):
     @abstractmethod
     def reset(self, hard: bool = True) -> None: ...
 
+    @abstractmethod
+    def get_cached(
+        self, key: Hashable, collections: Iterable[Collection], fn: Callable[[], T]
+    ) -> T: ...
+
     @abstractmethod
     def get_everything(self) -> dict[Collection, dict[int, PartialModel]]: ...
 
+    @abstractmethod
+    def stream(
+        self,
+        collection: Collection,
+        filter_: Filter | None,
+        mapped_fields: list[str],
+        batch_size: int = 1000,
+    ) -> Iterator[dict[Id, PartialModel]]: ...
+
     @abstractmethod
     def execute_custom_select(
         self,
@@ -168,3 +203,11 @@ class Database(Protocol):
         lock_result: LockResult = False,
         arguments: SqlArgumentsExtended = [],
     ) -> list[PartialModel]: ...
+
+    @abstractmethod
+    def stream_custom_select(
+        self,
+        query: sql.Composed | sql.SQL,
+        arguments: SqlArgumentsExtended = [],
+        batch_size: int = 1000,
+    ) -> Iterator[list[PartialModel]]: ...
@@ -43,11 +43,11 @@ class SqlQueryHelper:
                     field.get_own_field_name(): create_sql_for_enum_array(
                         collection, field.get_own_field_name()
                     )
-                    for field in model().get_enum_array_fields()
+                    for field in model.get_enum_array_fields()
                 }
                 if enum_array_sql and not unique_fields:
                     unique_fields = [
-                        val.get_own_field_name() for val in model().get_fields()
+                        val.get_own_field_name() for val in model.get_fields()
                     ]
 
         if not unique_fields:
@@ -169,7 +169,7 @@ class SqlQueryHelper:
                 elif filter_.operator in ("=", "!=") and isinstance(
                     filter_.value, list
                 ):
-                    field = model_registry[collection]().get_field(filter_.field)
+                    field = model_registry[collection].get_field(filter_.field)
                     condition = sql.SQL(
                         "{table_column} {filter_operator} %s{type}"
                     ).format(
@@ -0,0 +1,137 @@
+from collections.abc import Iterable, Sequence
+from typing import Any, NoReturn
+
+from psycopg import Connection, rows, sql
+
+from openslides_backend.shared.exceptions import BadCodingException
+from openslides_backend.shared.filters import Filter
+from openslides_backend.shared.typing import LockResult, PartialModel
+
+from ...shared.interfaces.env import Env
+from ...shared.interfaces.logging import LoggingModule
+from ...shared.interfaces.write_request import WriteRequest
+from ...shared.patterns import Collection, FullQualifiedId, Id
+from ..database.commands import GetManyRequest
+from .database_reader import DatabaseReader
+from .extended_database import ExtendedDatabase
+from .interface import MappedFieldsPerFqid, SqlArgumentsExtended
+from .mapped_fields import MappedFields
+
+
+class ReadOnlyDatabaseReader(DatabaseReader):
+    """
+    Database reader which never locks the read rows.
+    """
+
+    def execute_query(
+        self,
+        collection: Collection,
+        query: sql.Composed,
+        lock_result: LockResult,
+        mapped_fields: MappedFields | None = None,
+        arguments: SqlArgumentsExtended = [],
+        aggregate: bool = False,
+    ) -> list[PartialModel]:
+        return super().execute_query(
+            collection, query, False, mapped_fields, arguments, aggregate
+        )
+
+
+class ReadOnlyDatabase(ExtendedDatabase):
+    """
+    Database facade for the presenters. It is meant to be used with a connection
+    of `get_new_read_only_os_conn`, i.e. in a read-only transaction on a stable
+    snapshot.
+
+    The read rows are never locked, independent of the passed `lock_result`, and
+    no changed models are kept: all reads go directly to the database. Every
+    attempt to change data raises a BadCodingException.
+    """
+
+    def __init__(
+        self, connection: Connection[rows.DictRow], logging: LoggingModule, env: Env
+    ) -> None:
+        super().__init__(connection, logging, env)
+        self.database_reader = ReadOnlyDatabaseReader(self.connection, logging, env)
+
+    def get(
+        self,
+        fqid: FullQualifiedId,
+        mapped_fields: list[str] | None = None,
+        lock_result: LockResult = False,
+        use_changed_models: bool = False,
+        raise_exception: bool = True,
+    ) -> PartialModel:
+        return super().get(fqid, mapped_fields, False, False, raise_exception)
+
+    def get_many(
+        self,
+        get_many_requests: list[GetManyRequest],
+        lock_result: LockResult = False,
+        use_changed_models: bool = False,
+    ) -> dict[Collection, dict[int, PartialModel]]:
+        return super().get_many(get_many_requests, False, False)
+
+    def get_by_fqids(
+        self,
+        mapped_fields_per_fqid: MappedFieldsPerFqid,
+        lock_result: LockResult = False,
+        use_changed_models: bool = False,
+    ) -> dict[FullQualifiedId, PartialModel]:
+        return super().get_by_fqids(mapped_fields_per_fqid, False, False)
+
+    def filter(
+        self,
+        collection: Collection,
+        filter_: Filter | None,
+        mapped_fields: list[str],
+        lock_result: bool = False,
+        use_changed_models: bool = False,
+    ) -> dict[int, PartialModel]:
+        return super().filter(collection, filter_, mapped_fields, False, False)
+
+    def aggregate(
+        self,
+        method: str,
+        collection: Collection,
+        filter_: Filter | None,
+        field_or_star: str,
+        lock_result: bool = False,
+        use_changed_models: bool = False,
+    ) -> int | None:
+        return super().aggregate(
+            method, collection, filter_, field_or_star, False, False
+        )
+
+    def apply_changed_model(
+        self, fqid: FullQualifiedId, instance: PartialModel, replace: bool = False
+    ) -> NoReturn:
+        self._raise_read_only()
+
+    def apply_to_be_deleted(self, fqid: FullQualifiedId) -> NoReturn:
+        self._raise_read_only()
+
+    def apply_to_be_deleted_for_protected(self, fqid: FullQualifiedId) -> NoReturn:
+        self._raise_read_only()
+
+    def reserve_ids(self, collection: Collection, amount: int) -> Sequence[Id]:
+        self._raise_read_only()
+
+    def write(
+        self, write_requests: list[WriteRequest] | WriteRequest
+    ) -> dict[FullQualifiedId, dict[str, Any]]:
+        self._raise_read_only()
+
+    def truncate_db(self) -> NoReturn:
+        self._raise_read_only()
+
+    def clone_meeting(
+        self,
+        meeting_id: Id,
+        collections: Iterable[Collection],
+        cleared_fields: dict[Collection, list[str]] = {},
+    ) -> NoReturn:
+        self._raise_read_only()
+
+    def _raise_read_only(self) -> NoReturn:
+        raise BadCodingException("The read-only database cannot change any data.")
@@ -0,0 +1,84 @@
+import threading
+from collections.abc import Callable
+from random import uniform
+from time import sleep
+from typing import TypeVar
+
+from psycopg.errors import DeadlockDetected, SerializationFailure
+
+from openslides_backend.shared.exceptions import BadCodingException, DatabaseException
+
+T = TypeVar("T")
+
+# errors by which postgres resolves conflicts between concurrent transactions
+CONFLICT_ERRORS = (SerializationFailure, DeadlockDetected)
+
+
+class WriteScheduler:
+    """
+    Schedules the write transactions of the worker threads. The transactions
+    are not serialized within the process: conflicts between concurrent
+    transactions are detected by postgres through row locks and the
+    serialization failures of REPEATABLE READ transactions and are resolved by
+    retrying the whole transaction.
+
+    The collected metrics are per worker process:
+    * transactions: number of successful write transactions
+    * retries: number of transactions that were retried after a conflict
+    * failed_transactions: number of transactions that gave up after the last retry
+    * lock_wait_time: seconds spent in statements acquiring row locks
+    * write_time: seconds spent in writing the events
+    """
+
+    def __init__(self) -> None:
+        self._metrics_lock = threading.Lock()
+        self.reset_metrics()
+
+    def run(self, fn: Callable[[], T], retry_count: int, retry_timeout: float) -> T:
+        """
+        Runs the transaction function and retries it up to retry_count times if
+        it conflicts with a concurrent transaction. The timeout between the
+        attempts is randomized so that conflicting retries are spread out.
+        """
+        for attempt in range(1, retry_count + 1):
+            try:
+                result = fn()
+            except CONFLICT_ERRORS:
+                if attempt == retry_count:
+                    self._add("failed_transactions", 1)
+                    raise DatabaseException(
+                        "Database operation failed due to concurrent conflicting actions. Please try again later."
+                    )
+                self._add("retries", 1)
+                sleep(retry_timeout * uniform(0.5, 1.5))
+            else:
+                self._add("transactions", 1)
+                return result
+        raise BadCodingException("This code should never execute")
+
+    def add_lock_wait_time(self, seconds: float) -> None:
+        self._add("lock_wait_time", seconds)
+
+    def add_write_time(self, seconds: float) -> None:
+        self._add("write_time", seconds)
+
+    def get_metrics(self) -> dict[str, int | float]:
+        with self._metrics_lock:
+            return dict(self.metrics)
+
+    def reset_metrics(self) -> None:
+        with self._metrics_lock:
+            self.metrics: dict[str, int | float] = {
+                "transactions": 0,
+                "retries": 0,
+                "failed_transactions": 0,
+                "lock_wait_time": 0.0,
+                "write_time": 0.0,
+            }
+
+    def _add(self, key: str, value: int | float) -> None:
+        with self._metrics_lock:
+            self.metrics[key] += value
+
+
+write_scheduler = WriteScheduler()
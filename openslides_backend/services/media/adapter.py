@@ -1,20 +1,34 @@
+from collections.abc import Iterator
 from typing import Any
 
 import requests
 
 from ...shared.exceptions import MediaServiceException
 from ...shared.interfaces.logging import LoggingModule
+from ..shared.http_client import HTTP_CLIENT_ERRORS, HTTPClient
 from .interface import MediaService
 
+# Maximum number of mediafiles which are sent in one bulk request.
+MEDIA_BATCH_SIZE = 100
+
+# Maximum size in bytes of the base64 encoded files which are uploaded in one
+# bulk request. A larger file is uploaded in a request of its own.
+MEDIA_BATCH_MAX_BYTES = 50 * 1024 * 1024
+
 
 class MediaServiceAdapter(MediaService):
     """
     Adapter to connect to media service.
     """
 
-    def __init__(self, media_url: str, logging: LoggingModule) -> None:
+    def __init__(
+        self, media_url: str, logging: LoggingModule, client: HTTPClient | None = None
+    ) -> None:
         self.logger = logging.getLogger(__name__)
         self.media_url = media_url + "/"
+        self.client = client or HTTPClient()
+        # Set to False if the media service does not know the bulk routes.
+        self.supports_bulk = True
 
     def _upload(self, file: str, id: int, mimetype: str, subpath: str) -> None:
         url = self.media_url + subpath + "/"
@@ -31,22 +45,110 @@ class MediaServiceAdapter(MediaService):
         subpath = "upload_resource"
         self._upload(file, id, mimetype, subpath)
 
+    def upload_mediafiles(self, mediafiles: list[tuple[str, int, str]]) -> None:
+        for batch in self._get_upload_batches(mediafiles):
+            payload = {
+                "mediafiles": [
+                    {"file": file, "id": id, "mimetype": mimetype}
+                    for file, id, mimetype in batch
+                ]
+            }
+            self.logger.debug(f"Starting upload of {len(batch)} mediafiles")
+            if not self._handle_bulk(
+                "upload_mediafiles", payload, description="Upload of files: "
+            ):
+                for file, id, mimetype in batch:
+                    self.upload_mediafile(file, id, mimetype)
+            self.logger.debug("Files successfully uploaded to the media service")
+
+    @staticmethod
+    def _get_upload_batches(
+        mediafiles: list[tuple[str, int, str]],
+    ) -> Iterator[list[tuple[str, int, str]]]:
+        """
+        Splits the mediafiles into batches of at most MEDIA_BATCH_SIZE files and
+        MEDIA_BATCH_MAX_BYTES bytes. A larger file forms a batch of its own.
+        """
+        batch: list[tuple[str, int, str]] = []
+        batch_bytes = 0
+        for mediafile in mediafiles:
+            size = len(mediafile[0])
+            if batch and (
+                len(batch) >= MEDIA_BATCH_SIZE
+                or batch_bytes + size > MEDIA_BATCH_MAX_BYTES
+            ):
+                yield batch
+                batch = []
+                batch_bytes = 0
+            batch.append(mediafile)
+            batch_bytes += size
+        if batch:
+            yield batch
+
     def duplicate_mediafile(self, source_id: int, target_id: int) -> None:
         url = self.media_url + "duplicate_mediafile/"
         payload = {"source_id": source_id, "target_id": target_id}
         self._handle_upload(url, payload, description="Duplicate of mediafile: ")
         self.logger.debug("File successfully duplicated on the media service")
 
+    def duplicate_mediafiles(self, id_pairs: list[tuple[int, int]]) -> None:
+        for i in range(0, len(id_pairs), MEDIA_BATCH_SIZE):
+            batch = id_pairs[i : i + MEDIA_BATCH_SIZE]
+            payload = {
+                "mediafiles": [
+                    {"source_id": source_id, "target_id": target_id}
+                    for source_id, target_id in batch
+                ]
+            }
+            if not self._handle_bulk(
+                "duplicate_mediafiles", payload, description="Duplicate of mediafiles: "
+            ):
+                for source_id, target_id in batch:
+                    self.duplicate_mediafile(source_id, target_id)
+            self.logger.debug("Files successfully duplicated on the media service")
+
+    def _handle_bulk(
+        self, subpath: str, payload: dict[str, Any], description: str
+    ) -> bool:
+        """
+        Sends the bulk request and returns False if the media service does not
+        provide the bulk route or rejects the request as too large, so that the
+        caller falls back to single requests.
+        """
+        if not self.supports_bulk:
+            return False
+        response = self._post(self.media_url + subpath + "/", payload, description)
+        if response.status_code == 404:
+            self.logger.debug(
+                f"{description}Mediaservice does not support {subpath}, sending single requests."
+            )
+            self.supports_bulk = False
+            return False
+        if response.status_code == 413:
+            self.logger.debug(
+                f"{description}Request to {subpath} is too large, sending single requests."
+            )
+            return False
+        self._check_response(response, description)
+        return True
+
     def _handle_upload(
         self, url: str, payload: dict[str, Any], description: str
     ) -> None:
+        response = self._post(url, payload, description)
+        self._check_response(response, description)
+
+    def _post(
+        self, url: str, payload: dict[str, Any], description: str
+    ) -> requests.Response:
         try:
-            response = requests.post(url, json=payload)
-        except requests.exceptions.ConnectionError as e:
+            return self.client.post(url, json=payload)
+        except HTTP_CLIENT_ERRORS as e:
             msg = f"Connect to mediaservice failed. {e}"
             self.logger.debug(description + msg)
             raise MediaServiceException(msg)
 
+    def _check_response(self, response: requests.Response, description: str) -> None:
         if response.status_code != 200:
             msg = f"Mediaservice Error: {str(response.content)}"
             self.logger.debug(description + msg)
@@ -30,3 +30,22 @@ class MediaService(Protocol):
         any Error reported from MediaService-Request
         """
         ...
+
+    @abstractmethod
+    def upload_mediafiles(self, mediafiles: list[tuple[str, int, str]]) -> None:
+        """
+        Uploads the given (file, id, mimetype) tuples with one request per batch.
+        Throws a MediaServiceException, if there is a ConnectionError or
+        any Error reported from MediaService-Request
+        """
+        ...
+
+    @abstractmethod
+    def duplicate_mediafiles(self, id_pairs: list[tuple[int, int]]) -> None:
+        """
+        Duplicates the mediafiles of the given (source_id, target_id) tuples with
+        one request per batch.
+        Throws a MediaServiceException, if there is a ConnectionError or
+        any Error reported from MediaService-Request
+        """
+        ...
@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 from collections.abc import Callable
 from contextlib import _GeneratorContextManager
 from functools import wraps
@@ -30,25 +31,76 @@ class ConnectionContext:
     Sets autocommit to False and transaction isolation to REPEATABLE_READ.
     """
 
+    isolation_level = IsolationLevel.REPEATABLE_READ
+    read_only = False
+    deferrable = False
+
     def __init__(self, context_manager: _GeneratorContextManager) -> None:
         self.connection_context = context_manager
 
     def __enter__(self) -> Connection[rows.DictRow]:
         self.connection = self.connection_context.__enter__()
         self.connection.autocommit = False
-        self.connection.set_isolation_level(IsolationLevel.REPEATABLE_READ)
+        # the connections of the pool are shared by both kinds of contexts
+        self.connection.set_isolation_level(self.isolation_level)
+        self.connection.set_read_only(self.read_only)
+        self.connection.set_deferrable(self.deferrable)
         return self.connection
 
     def __exit__(self, exception, exception_value, traceback) -> None:  # type: ignore
         self.connection_context.__exit__(exception, exception_value, traceback)
 
 
+class ReadOnlyConnectionContext(ConnectionContext):
+    """
+    Connection context for read-only transactions.
+    Uses a SERIALIZABLE READ ONLY DEFERRABLE transaction, which waits for a
+    snapshot on which it can not conflict with any concurrent transaction and
+    runs without any serialization overhead afterwards.
+    """
+
+    isolation_level = IsolationLevel.SERIALIZABLE
+    read_only = True
+    deferrable = True
+
+
+class ReplicaConnectionContext(ConnectionContext):
+    """
+    Connection context for read-only transactions on a streaming replica, which
+    does not support serializable transactions.
+    """
+
+    read_only = True
+
+
 def create_os_conn_pool(open: bool = True) -> ConnectionPool[Connection[rows.DictRow]]:
     global os_conn_pool
     if "os_conn_pool" in globals() and not os_conn_pool.closed:
         os_conn_pool.close()
-    os_conn_pool = ConnectionPool(
-        conninfo=conn_string_without_db + f"dbname='{env.DATABASE_NAME}'",
+    os_conn_pool = create_conn_pool(
+        conn_string_without_db + f"dbname='{env.DATABASE_NAME}'",
+        "ConnPool for openslides-db",
+        open,
+    )
+    return os_conn_pool
+
+
+def create_os_read_only_conn_pool() -> ConnectionPool[Connection[rows.DictRow]]:
+    global os_read_only_conn_pool
+    if os_read_only_conn_pool is not None and not os_read_only_conn_pool.closed:
+        os_read_only_conn_pool.close()
+    os_read_only_conn_pool = create_conn_pool(
+        f"host='{env.DATABASE_READ_ONLY_HOST}' port='{env.DATABASE_READ_ONLY_PORT}' user='{env.DATABASE_USER}' password='{env.PGPASSWORD}' dbname='{env.DATABASE_NAME}'",
+        "Read-only ConnPool for openslides-db",
+    )
+    return os_read_only_conn_pool
+
+
+def create_conn_pool(
+    conninfo: str, name: str, open: bool = True
+) -> ConnectionPool[Connection[rows.DictRow]]:
+    return ConnectionPool(
+        conninfo=conninfo,
         # provides type hinting
         connection_class=Connection[rows.DictRow],  # type: ignore
         # works at runtime
@@ -60,7 +112,7 @@ def create_os_conn_pool(open: bool = True) -> ConnectionPool[Connection[rows.Dic
         max_size=int(env.DB_POOL_MAX_SIZE),
         open=open,
         check=ConnectionPool.check_connection,
-        name="ConnPool for openslides-db",
+        name=name,
         timeout=float(env.DB_POOL_TIMEOUT),
         max_waiting=int(env.DB_POOL_MAX_WAITING),
         max_lifetime=float(env.DB_POOL_MAX_LIFETIME),
@@ -68,10 +120,13 @@ def create_os_conn_pool(open: bool = True) -> ConnectionPool[Connection[rows.Dic
         reconnect_timeout=float(env.DB_POOL_RECONNECT_TIMEOUT),
         num_workers=int(env.DB_POOL_NUM_WORKERS),
     )
-    return os_conn_pool
 
 
 os_conn_pool: ConnectionPool[Connection[rows.DictRow]] = create_os_conn_pool(open=False)
+# only created if DATABASE_READ_ONLY_HOST is set
+os_read_only_conn_pool: ConnectionPool[Connection[rows.DictRow]] | None = None
+# guards the creation of the read-only pool, which is shared by all threads
+os_read_only_conn_pool_lock = threading.Lock()
 
 
 def get_current_os_conn_pool() -> ConnectionPool[Connection[rows.DictRow]]:
@@ -86,11 +141,33 @@ def get_current_os_conn_pool() -> ConnectionPool[Connection[rows.DictRow]]:
 
 
 def get_new_os_conn() -> ConnectionContext:
+    """
+    Checks out a connection of the pool. The connection is checked by the pool
+    itself on checkout, so the other idle connections are left untouched.
+    """
     os_conn_pool = get_current_os_conn_pool()
-    os_conn_pool.check()
     return ConnectionContext(os_conn_pool.connection())
 
 
+def get_new_read_only_os_conn() -> ConnectionContext:
+    """
+    Checks out a connection for a read-only transaction. If
+    DATABASE_READ_ONLY_HOST is set, e.g. to a streaming replica, the connection
+    is taken from a separate pool for this host, so that long running reads do
+    not occupy the connections for the writing transactions.
+    """
+    if not env.DATABASE_READ_ONLY_HOST:
+        return ReadOnlyConnectionContext(get_current_os_conn_pool().connection())
+    pool = os_read_only_conn_pool
+    if pool is None or pool.closed:
+        with os_read_only_conn_pool_lock:
+            # another thread may have created the pool in the meantime
+            pool = os_read_only_conn_pool
+            if pool is None or pool.closed:
+                pool = create_os_read_only_conn_pool()
+    return ReplicaConnectionContext(pool.connection())
+
+
 def get_unpooled_db_connection(
     db_name: str,
     autocommit: bool = False,
@@ -0,0 +1,137 @@
+import logging
+import os
+import threading
+from time import monotonic, sleep
+from typing import Any
+
+from psycopg import Connection, OperationalError, rows, sql
+
+from openslides_backend.shared.env import Environment
+from openslides_backend.shared.exceptions import DatabaseException
+
+from .db_connection_handling import get_new_os_conn, get_unpooled_db_connection
+
+env = Environment(os.environ)
+logger = logging.getLogger("database")
+
+# channel on which changes of the cached values are announced to all workers
+PREFLIGHT_CACHE_CHANNEL = "openslides_backend_preflight"
+
+# lifetime of the cached values while no listener connection is established
+FALLBACK_TTL = 1.0
+
+# seconds to wait before the listener tries to reconnect
+LISTENER_RECONNECT_TIMEOUT = 5.0
+
+
+def notify_preflight_change(connection: Connection[rows.DictRow]) -> None:
+    """
+    Invalidates the preflight cache of this worker and announces the change to
+    all other workers. The notification is only delivered by postgres once the
+    current transaction is committed.
+    """
+    preflight_cache.invalidate()
+    connection.execute("SELECT pg_notify(%s, '')", (PREFLIGHT_CACHE_CHANNEL,))
+
+
+class PreflightCache:
+    """
+    Per worker cache of the values which are checked before every request: the
+    migration index of the database and the default language of the
+    organization.
+
+    A daemon thread listens on PREFLIGHT_CACHE_CHANNEL with its own unpooled
+    connection and drops the values on every notification, see
+    `notify_preflight_change`. As long as the listener is not connected, the
+    values are only cached for FALLBACK_TTL seconds.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._listening = False
+        self._generation = 0
+        self._values: dict[str, Any] | None = None
+        self._loaded_at = 0.0
+
+    def get_migration_index(self) -> int:
+        return self._get_values()["migration_index"]
+
+    def get_default_language(self) -> str | None:
+        return self._get_values()["default_language"]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._values = None
+
+    def _get_values(self) -> dict[str, Any]:
+        self._ensure_listener()
+        with self._lock:
+            values = self._values
+            generation = self._generation
+            if values is not None and (
+                self._listening or monotonic() - self._loaded_at < FALLBACK_TTL
+            ):
+                return values
+        values = self._load()
+        with self._lock:
+            # only store the values if they were not invalidated while loading
+            if generation == self._generation:
+                self._values = values
+                self._loaded_at = monotonic()
+        return values
+
+    def _load(self) -> dict[str, Any]:
+        # imported here to avoid a circular import
+        from openslides_backend.migrations.migration_helper import MigrationHelper
+
+        with get_new_os_conn() as conn:
+            with conn.cursor() as curs:
+                migration_index = MigrationHelper.get_database_migration_index(curs)
+                curs.execute("SELECT default_language FROM organization_t WHERE id = 1")
+                default_language = (curs.fetchone() or {}).get("default_language")
+        return {
+            "migration_index": migration_index,
+            "default_language": default_language,
+        }
+
+    def _ensure_listener(self) -> None:
+        # the listener has to be started again in forked worker processes
+        if self._pid == (pid := os.getpid()):
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            self._listening = False
+            self._values = None
+            thread = threading.Thread(
+                target=self._listen, name="PreflightCacheListener", daemon=True
+            )
+            thread.start()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                with get_unpooled_db_connection(
+                    env.DATABASE_NAME, autocommit=True
+                ) as conn:
+                    conn.execute(
+                        sql.SQL("LISTEN {}").format(
+                            sql.Identifier(PREFLIGHT_CACHE_CHANNEL)
+                        )
+                    )
+                    # changes before the LISTEN may have been missed
+                    self.invalidate()
+                    self._listening = True
+                    for _ in conn.notifies():
+                        self.invalidate()
+            except (DatabaseException, OperationalError) as e:
+                logger.debug(f"Preflight cache listener disconnected: {e}")
+            finally:
+                self._listening = False
+            sleep(LISTENER_RECONNECT_TIMEOUT)
+
+
+preflight_cache = PreflightCache()
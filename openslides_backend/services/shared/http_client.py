@@ -0,0 +1,70 @@
+import os
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ...shared.env import Environment
+
+env = Environment(os.environ)
+
+# Errors which are raised if the other service cannot be reached or does not
+# answer in time.
+HTTP_CLIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+class HTTPClient:
+    """
+    Pooled keep-alive HTTP connections to another service. The service adapters
+    are singletons per worker, so each worker reuses its connections for all
+    requests to the service instead of doing a new handshake for every call.
+
+    Only failed connection attempts are retried since the requests to the
+    services are not idempotent in general. No cookies are stored in the
+    session since it is shared by the requests of all users.
+
+    The timeout limits the wait for the response. It is not set by default,
+    since uploads and duplications of large files may take arbitrarily long.
+    """
+
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+        connect_timeout: float | None = None,
+    ) -> None:
+        if pool_size is None:
+            pool_size = int(env.HTTP_POOL_SIZE)
+        if timeout is None and env.HTTP_TIMEOUT:
+            timeout = float(env.HTTP_TIMEOUT)
+        if max_retries is None:
+            max_retries = int(env.HTTP_MAX_RETRIES)
+        if connect_timeout is None:
+            connect_timeout = float(env.HTTP_CONNECT_TIMEOUT)
+        self.timeout = (connect_timeout, timeout)
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=max_retries,
+                connect=max_retries,
+                read=0,
+                redirect=0,
+                status=0,
+                other=0,
+                backoff_factor=0.1,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.post(url, timeout=self.timeout, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
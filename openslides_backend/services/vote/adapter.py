@@ -1,11 +1,11 @@
 from typing import Any
 
-import requests
 import simplejson as json
 
 from ...shared.exceptions import VoteServiceException
 from ...shared.interfaces.logging import LoggingModule
 from ..shared.authenticated_service import AuthenticatedService
+from ..shared.http_client import HTTP_CLIENT_ERRORS, HTTPClient
 from .interface import VoteService
 
 
@@ -14,9 +14,12 @@ class VoteAdapter(VoteService, AuthenticatedService):
     Adapter to connect to the vote service.
     """
 
-    def __init__(self, vote_url: str, logging: LoggingModule) -> None:
+    def __init__(
+        self, vote_url: str, logging: LoggingModule, client: HTTPClient | None = None
+    ) -> None:
         self.url = vote_url
         self.logger = logging.getLogger(__name__)
+        self.client = client or HTTPClient()
 
     def retrieve(self, endpoint: str, payload: dict[str, Any] | None = None) -> Any:
         response = self.make_request(endpoint, payload)
@@ -39,8 +42,8 @@ class VoteAdapter(VoteService, AuthenticatedService):
             raise VoteServiceException("You must be logged in to vote")
         payload_json = json.dumps(payload, separators=(",", ":")) if payload else None
         try:
-            return requests.post(
-                url=endpoint,
+            return self.client.post(
+                endpoint,
                 data=payload_json,
                 headers={
                     "Content-Type": "application/json",
@@ -48,7 +51,7 @@ class VoteAdapter(VoteService, AuthenticatedService):
                 },
                 cookies=self.get_auth_cookie(),
             )
-        except requests.exceptions.ConnectionError as e:
+        except HTTP_CLIENT_ERRORS as e:
             self.logger.error(
                 f"Cannot reach the vote service on {endpoint}. Error: {e}"
             )
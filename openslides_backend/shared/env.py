@@ -59,6 +59,10 @@ class Environment(Env):
         "DATABASE_MAX_RETRIES": "10",
         "PGPASSWORD": "openslides",
         "DATABASE_PASSWORD_FILE": "",
+        # optional separate database host for the read-only transactions of the
+        # presenters, e.g. a streaming replica
+        "DATABASE_READ_ONLY_HOST": "",
+        "DATABASE_READ_ONLY_PORT": "5432",
         # psycopg.ConnectionPool attributes with DB_POOL-prefix
         "DB_POOL_MIN_SIZE": "4",
         "DB_POOL_MAX_SIZE": "4",
@@ -68,6 +72,14 @@ class Environment(Env):
         "DB_POOL_MAX_IDLE": "60",
         "DB_POOL_RECONNECT_TIMEOUT": "300",
         "DB_POOL_NUM_WORKERS": "2",
+        # connection pools of the HTTP clients for the media and vote service
+        "HTTP_POOL_SIZE": "10",
+        "HTTP_CONNECT_TIMEOUT": "10",
+        # empty: no timeout for the responses, e.g. of large uploads
+        "HTTP_TIMEOUT": "",
+        "HTTP_MAX_RETRIES": "3",
+        # processes per worker for hashing passwords in bulk, 1 disables the pool
+        "PASSWORD_HASH_PROCESSES": "4",
     }
 
     def __init__(self, os_env: Any, *args: Any, **kwargs: Any) -> None:
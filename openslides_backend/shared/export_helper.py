@@ -1,5 +1,6 @@
 import datetime
-from collections.abc import Iterable
+import heapq
+from collections.abc import Iterable, Iterator
 from decimal import Decimal
 from typing import Any
 
@@ -7,9 +8,8 @@ from openslides_backend.migrations.migration_helper import MigrationHelper
 from openslides_backend.shared.patterns import is_reserved_field
 from openslides_backend.shared.util import ONE_ORGANIZATION_FQID, ONE_ORGANIZATION_ID
 
-from ..models.base import model_registry
+from ..models.base import Model, model_registry
 from ..models.fields import (
-    BaseRelationField,
     GenericRelationField,
     OnDelete,
     RelationField,
@@ -18,6 +18,7 @@ from ..models.fields import (
 from ..models.models import Meeting
 from ..services.database.commands import GetManyRequest
 from ..services.database.interface import Database
+from .filters import FilterOperator
 from .patterns import collection_from_fqid, fqid_from_collection_and_id, id_from_fqid
 
 FORBIDDEN_FIELDS = ["forwarded_motion_ids"]
@@ -30,6 +31,16 @@ HISTORY_FIELDS_PER_COLLECTION = {
     **{collection: ["history_entry_ids"] for collection in ["motion", "assignment"]},
 }
 
+# user fields which are limited to the exported models of the collection
+USER_FIELDS_LIMITED_TO_EXPORT = [
+    ("meeting_user", "meeting_user_ids"),
+    ("poll", "poll_voted_ids"),
+    ("option", "option_ids"),
+    ("vote", "vote_ids"),
+    ("poll_candidate", "poll_candidate_ids"),
+    ("vote", "delegated_vote_ids"),
+]
+
 
 def export_meeting(
     datastore: Database,
@@ -39,207 +50,116 @@ def export_meeting(
     transform_datetime_decimal: bool = False,
     datetime_to_unix: bool = False,
 ) -> dict[str, Any]:
-    export: dict[str, Any] = {}
+    """
+    Returns the whole export of the meeting as a dict. Use `iter_export_meeting`
+    if the export does not have to be held in memory at once.
+    """
+    return {
+        collection: (models if collection == "_migration_index" else dict(models))
+        for collection, models in iter_export_meeting(
+            datastore,
+            meeting_id,
+            internal_target,
+            update_mediafiles,
+            transform_datetime_decimal,
+            datetime_to_unix,
+        )
+    }
 
-    # fetch meeting
+
+def iter_export_meeting(
+    datastore: Database,
+    meeting_id: int,
+    internal_target: bool = False,
+    update_mediafiles: bool = False,
+    transform_datetime_decimal: bool = False,
+    datetime_to_unix: bool = False,
+) -> Iterator[tuple[str, Any]]:
+    """
+    Yields the export of the meeting collection by collection as pairs of the
+    collection name and an iterator over the models of the collection as
+    (id, model) pairs sorted by id. The `_migration_index` is yielded with its
+    value. The models are streamed from the database in batches, so only a batch
+    of them is held in memory at a time. Each collection has to be iterated
+    before the next one is requested, since the users, which are yielded last,
+    are collected from the models while they are streamed. Must be called inside
+    of a transaction.
+    """
     meeting = datastore.get(
         fqid_from_collection_and_id("meeting", meeting_id),
         list(get_fields_for_export("meeting") - set(FORBIDDEN_FIELDS)),
         lock_result=False,
         use_changed_models=False,
     )
-    for forbidden_field in FORBIDDEN_FIELDS + HISTORY_FIELDS_PER_COLLECTION["meeting"]:
+    for forbidden_field in FORBIDDEN_FIELDS:
         meeting.pop(forbidden_field, None)
+    yield "meeting", iter(
+        [
+            (
+                str(meeting_id),
+                prepare_model(
+                    "meeting", meeting, transform_datetime_decimal, datetime_to_unix
+                ),
+            )
+        ]
+    )
+    yield "_migration_index", MigrationHelper.get_backend_migration_index()
 
-    export["meeting"] = remove_meta_fields(transfer_keys({meeting_id: meeting}))
-    export["_migration_index"] = MigrationHelper.get_backend_migration_index()
-
-    # initialize user_ids
+    # fetched before the mediafiles are streamed, since they are referenced by
+    # the meeting_mediafiles of the meeting only
+    organization_mediafiles = (
+        get_organization_mediafiles(datastore, meeting) if update_mediafiles else {}
+    )
     user_ids = set(meeting.get("user_ids", []))
-
-    # fetch related models
-    relation_fields = list(get_relation_fields())
-    get_many_requests = [
-        GetManyRequest(
-            field.get_target_collection(),
+    exported_ids: dict[str, set[int]] = {
+        collection: set() for collection, _ in USER_FIELDS_LIMITED_TO_EXPORT
+    }
+    for collection, ids in get_ids_per_collection(meeting).items():
+        models: Iterable[tuple[int, dict[str, Any]]] = stream_models(
+            datastore,
+            collection,
             ids,
-            get_fields_for_export(field.get_target_collection()),
+            get_fields_for_export(collection),
+            transform_datetime_decimal,
+            datetime_to_unix,
         )
-        for field in relation_fields
-        if (ids := meeting.get(field.get_own_field_name()))
-    ]
-    if get_many_requests:
-        results = datastore.get_many(
-            get_many_requests, lock_result=False, use_changed_models=False
+        if collection == "mediafile" and organization_mediafiles:
+            models = heapq.merge(
+                models,
+                (
+                    (
+                        id_,
+                        prepare_model(
+                            collection,
+                            mediafile,
+                            transform_datetime_decimal,
+                            datetime_to_unix,
+                        ),
+                    )
+                    for id_, mediafile in sorted(organization_mediafiles.items())
+                ),
+                key=lambda item: item[0],
+            )
+        yield collection, (
+            (str(id_), model)
+            for id_, model in collect_user_ids(
+                collection, models, user_ids, exported_ids.get(collection)
+            )
         )
-        # update_mediafiles_for_internal_calls
-        if update_mediafiles and len(
-            mediafile_ids := results.get("mediafile", {}).keys()
-        ) != len(meeting_mediafiles := results.get("meeting_mediafile", {})):
-            mm_with_unknown_mediafiles = {
-                mm_id: mm_data
-                for mm_id, mm_data in meeting_mediafiles.items()
-                if mm_data["mediafile_id"] not in mediafile_ids
-            }
-            unknown_mediafiles: dict[int, dict[str, Any]] = {}
-            next_file_ids = [
-                mm["mediafile_id"] for mm in mm_with_unknown_mediafiles.values()
-            ]
-            while next_file_ids:
-                unknown_mediafiles.update(
-                    datastore.get_many(
-                        [
-                            GetManyRequest(
-                                "mediafile",
-                                next_file_ids,
-                                [
-                                    "id",
-                                    "owner_id",
-                                    "published_to_meetings_in_organization_id",
-                                    "parent_id",
-                                    "child_ids",
-                                    "title",
-                                ],
-                            ),
-                        ],
-                        use_changed_models=False,
-                    )["mediafile"]
-                )
-                next_file_ids = list(
-                    {
-                        id_
-                        for m in unknown_mediafiles.values()
-                        for id_ in [
-                            *([m["parent_id"]] if m.get("parent_id") else []),
-                            *m.get("child_ids", []),
-                        ]
-                    }
-                    - set(unknown_mediafiles)
-                )
-            for mm_id, mm_data in mm_with_unknown_mediafiles.items():
-                mediafile_id = mm_data["mediafile_id"]
-                mediafile = unknown_mediafiles.get(mediafile_id)
-                if (
-                    mediafile
-                    and mediafile["owner_id"] == ONE_ORGANIZATION_FQID
-                    and mediafile["published_to_meetings_in_organization_id"]
-                    == ONE_ORGANIZATION_ID
-                ):
-                    mediafile["meeting_mediafile_ids"] = [mm_id]
-                    results.setdefault("mediafile", {})[mediafile_id] = mediafile
-                    while (
-                        parent_id := mediafile.get("parent_id")
-                    ) and parent_id not in results["mediafile"]:
-                        mediafile = unknown_mediafiles[parent_id]
-                        results["mediafile"][parent_id] = mediafile
-                        descendant_ids: list[int] = [*mediafile.get("child_ids", [])]
-                        while len(descendant_ids):
-                            descendant_id = descendant_ids.pop()
-                            if descendant_id not in results["mediafile"]:
-                                descendant = unknown_mediafiles[descendant_id]
-                                results["mediafile"][descendant_id] = descendant
-                                descendant_ids.extend(descendant.get("child_ids", []))
-
-    else:
-        results = {}
 
-    for field in relation_fields:
-        collection = field.get_target_collection()
-        if collection in results:
-            export[str(collection)] = remove_history_fields(
-                collection, remove_meta_fields(transfer_keys(results[collection]))
+    if user_ids:
+        yield "user", (
+            (str(id_), user)
+            for id_, user in stream_users(
+                datastore,
+                sorted(user_ids),
+                meeting_id,
+                exported_ids,
+                internal_target,
+                transform_datetime_decimal,
+                datetime_to_unix,
             )
-        else:
-            export[str(collection)] = {}
-
-    # update user_ids
-    for collection in export:
-        if collection == "_migration_index":
-            continue
-        model = model_registry[collection]()
-        user_fields: Iterable[BaseRelationField] = model.get_relation_fields()
-        for user_field in user_fields:
-            if (
-                isinstance(user_field, RelationField)
-                and user_field.get_target_collection() == "user"
-            ):
-                user_ids.update(
-                    {
-                        entry.get(user_field.get_own_field_name())
-                        for entry in export[collection].values()
-                        if entry.get(user_field.get_own_field_name())
-                    }
-                )
-            if (
-                isinstance(user_field, RelationListField)
-                and user_field.get_target_collection() == "user"
-            ):
-                for entry in export[collection].values():
-                    if entry.get(user_field.get_own_field_name()):
-                        user_ids.update(
-                            {
-                                id_
-                                for id_ in entry.get(user_field.get_own_field_name())
-                                or []
-                            }
-                        )
-            if (
-                isinstance(user_field, RelationField)
-                and user_field.get_target_collection() == "meeting_user"
-            ):
-                id_ = entry.get(user_field.get_own_field_name())
-                if id_:
-                    user_ids.add(results["meeting_user"][id_]["user_id"])
-
-            if (
-                isinstance(user_field, RelationListField)
-                and user_field.get_target_collection() == "meeting_user"
-            ):
-                for entry in export[collection].values():
-                    if entry.get(user_field.get_own_field_name()):
-                        user_ids.update(
-                            {
-                                user_id
-                                for id_ in entry.get(user_field.get_own_field_name())
-                                if (
-                                    user_id := results["meeting_user"][id_].get(
-                                        "user_id"
-                                    )
-                                )
-                            }
-                        )
-            if isinstance(user_field, GenericRelationField):
-                for entry in export[collection].values():
-                    field_name = user_field.get_own_field_name()
-                    if not entry.get(field_name):
-                        continue
-                    if collection_from_fqid(entry[field_name]) == "user":
-                        user_ids.add(id_from_fqid(entry[field_name]))
-                    elif collection_from_fqid(entry[field_name]) == "meeting_user":
-                        id_ = id_from_fqid(entry[field_name])
-                        user_ids.add(results["meeting_user"][id_]["user_id"])
-    add_users(list(user_ids), export, meeting_id, datastore, internal_target)
-
-    # Sort instances by id within each collection
-    for collection, instances in export.items():
-        if collection == "_migration_index":
-            continue
-        export[collection] = dict(
-            sorted(instances.items(), key=lambda item: int(item[0]))
         )
-        if transform_datetime_decimal and isinstance(instances, dict):
-            for data in instances.values():
-                for field, value in data.items():
-                    if isinstance(value, datetime.datetime):
-                        if datetime_to_unix:
-                            clean_value = value.replace(microsecond=0)
-                            data[field] = clean_value.timestamp()
-                        else:
-                            data[field] = value.isoformat()
-                    if isinstance(value, Decimal):
-                        data[field] = str(value)
-
-    return export
 
 
 # TODO (when removing back relations): replace with Model.get_writable_fields()
@@ -252,92 +172,238 @@ def get_fields_for_export(collection: str) -> set[str]:
     Returns writable fields of the collection with the given name.
     Excludes fields calculated by db.
     """
-    model = model_registry[collection]()
-    return {
-        field.get_own_field_name()
-        for field in model.get_fields()
-        if not (
-            isinstance(field, RelationListField)
-            and field.is_view_field
-            and field.read_only
-            and not field.write_fields
+    model = model_registry[collection]
+    if (export_fields := _export_fields_per_model.get(model)) is None:
+        export_fields = _export_fields_per_model[model] = frozenset(
+            field.get_own_field_name()
+            for field in model.get_fields()
+            if not (
+                isinstance(field, RelationListField)
+                and field.is_view_field
+                and field.read_only
+                and not field.write_fields
+            )
         )
-    }
+    return set(export_fields)
 
 
-def add_users(
-    user_ids: list[int],
-    export_data: dict[str, Any],
-    meeting_id: int,
+_export_fields_per_model: dict[type[Model], frozenset[str]] = {}
+
+
+def get_ids_per_collection(meeting: dict[str, Any]) -> dict[str, list[int]]:
+    """
+    Returns the sorted ids of the models of the meeting per exported collection.
+    """
+    ids_per_collection: dict[str, set[int]] = {}
+    for field in get_relation_fields():
+        ids_per_collection.setdefault(field.get_target_collection(), set()).update(
+            meeting.get(field.get_own_field_name()) or []
+        )
+    return {collection: sorted(ids) for collection, ids in ids_per_collection.items()}
+
+
+def stream_models(
     datastore: Database,
-    internal_target: bool,
-) -> None:
-    if not user_ids:
+    collection: str,
+    ids: list[int],
+    fields: Iterable[str],
+    transform_datetime_decimal: bool,
+    datetime_to_unix: bool,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    if not ids:
         return
+    for models in datastore.stream(
+        collection, FilterOperator("id", "in", ids), list(fields)
+    ):
+        for id_, model in models.items():
+            yield id_, prepare_model(
+                collection, model, transform_datetime_decimal, datetime_to_unix
+            )
+
 
-    gmr = GetManyRequest(
+def stream_users(
+    datastore: Database,
+    user_ids: list[int],
+    meeting_id: int,
+    exported_ids: dict[str, set[int]],
+    internal_target: bool,
+    transform_datetime_decimal: bool,
+    datetime_to_unix: bool,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    genders = (
+        {}
+        if internal_target
+        else datastore.get_all("gender", ["name"], lock_result=False)
+    )
+    for id_, user in stream_models(
+        datastore,
         "user",
         user_ids,
         get_fields_for_export("user"),
-    )
-    users = remove_history_fields(
-        "user",
-        remove_meta_fields(
-            transfer_keys(
-                datastore.get_many([gmr], lock_result=False, use_changed_models=False)[
-                    "user"
-                ]
-            )
-        ),
-    )
-
-    for user in users.values():
+        transform_datetime_decimal,
+        datetime_to_unix,
+    ):
         if meeting_id in (user.get("is_present_in_meeting_ids") or []):
             user["is_present_in_meeting_ids"] = [meeting_id]
         else:
             user["is_present_in_meeting_ids"] = None
         if not internal_target and (gender_id := user.pop("gender_id", None)):
-            gender_dict = datastore.get_all("gender", ["name"], lock_result=False)
-            user["gender"] = gender_dict.get(gender_id, {}).get("name")
+            user["gender"] = genders.get(gender_id, {}).get("name")
         # limit user fields to exported objects
-        collection_field_tupels = [
-            ("meeting_user", "meeting_user_ids"),
-            ("poll", "poll_voted_ids"),
-            ("option", "option_ids"),
-            ("vote", "vote_ids"),
-            ("poll_candidate", "poll_candidate_ids"),
-            ("vote", "delegated_vote_ids"),
-        ]
-        for collection, fname in collection_field_tupels:
+        for collection, fname in USER_FIELDS_LIMITED_TO_EXPORT:
             user[fname] = [
-                id_
-                for id_ in user.get(fname, [])
-                if export_data.get(collection, {}).get(str(id_))
+                related_id
+                for related_id in user.get(fname, [])
+                if related_id in exported_ids[collection]
             ]
-
-    export_data["user"] = users
+        yield id_, user
 
 
-def remove_meta_fields(res: dict[str, Any]) -> dict[str, Any]:
-    dict_without_meta_fields = {}
-    for key in res:
-        new_entry = {}
-        for fieldname in res[key]:
-            if not is_reserved_field(fieldname):
-                new_entry[fieldname] = res[key][fieldname]
-        dict_without_meta_fields[str(key)] = new_entry
-    return dict_without_meta_fields
-
-
-def remove_history_fields(collection: str, res: dict[str, Any]) -> dict[str, Any]:
-    for field in HISTORY_FIELDS_PER_COLLECTION.get(collection, []):
-        for key in res:
-            res[key].pop(field, None)
-    return res
+def collect_user_ids(
+    collection: str,
+    models: Iterable[tuple[int, dict[str, Any]]],
+    user_ids: set[int],
+    exported_ids: set[int] | None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Adds the ids of the users referenced by the models to user_ids and the ids of
+    the models to exported_ids while the models are iterated. The users of
+    referenced meeting_users are not looked up, since they are already referenced
+    by the exported meeting_users themselves.
+    """
+    user_fields: list[str] = []
+    user_list_fields: list[str] = []
+    generic_fields: list[str] = []
+    for field in model_registry[collection].get_relation_fields():
+        if isinstance(field, GenericRelationField):
+            generic_fields.append(field.get_own_field_name())
+        elif field.get_target_collection() == "user":
+            if isinstance(field, RelationField):
+                user_fields.append(field.get_own_field_name())
+            elif isinstance(field, RelationListField):
+                user_list_fields.append(field.get_own_field_name())
+    for id_, model in models:
+        if exported_ids is not None:
+            exported_ids.add(id_)
+        for field_name in user_fields:
+            if user_id := model.get(field_name):
+                user_ids.add(user_id)
+        for field_name in user_list_fields:
+            user_ids.update(model.get(field_name) or [])
+        for field_name in generic_fields:
+            if (fqid := model.get(field_name)) and collection_from_fqid(fqid) == "user":
+                user_ids.add(id_from_fqid(fqid))
+        yield id_, model
+
+
+def get_organization_mediafiles(
+    datastore: Database, meeting: dict[str, Any]
+) -> dict[int, dict[str, Any]]:
+    """
+    Returns the published organization mediafiles which are used in the meeting
+    together with their parents and the descendants of the parents.
+    """
+    mediafile_ids = set(meeting.get("mediafile_ids", []))
+    mm_with_unknown_mediafiles: dict[int, int] = {}
+    if meeting_mediafile_ids := meeting.get("meeting_mediafile_ids"):
+        for meeting_mediafiles in datastore.stream(
+            "meeting_mediafile",
+            FilterOperator("id", "in", meeting_mediafile_ids),
+            ["mediafile_id"],
+        ):
+            for mm_id, mm_data in meeting_mediafiles.items():
+                if mm_data["mediafile_id"] not in mediafile_ids:
+                    mm_with_unknown_mediafiles[mm_id] = mm_data["mediafile_id"]
+    unknown_mediafiles: dict[int, dict[str, Any]] = {}
+    next_file_ids = list(set(mm_with_unknown_mediafiles.values()))
+    while next_file_ids:
+        unknown_mediafiles.update(
+            datastore.get_many(
+                [
+                    GetManyRequest(
+                        "mediafile",
+                        next_file_ids,
+                        [
+                            "id",
+                            "owner_id",
+                            "published_to_meetings_in_organization_id",
+                            "parent_id",
+                            "child_ids",
+                            "title",
+                        ],
+                    ),
+                ],
+                use_changed_models=False,
+            )["mediafile"]
+        )
+        next_file_ids = list(
+            {
+                id_
+                for m in unknown_mediafiles.values()
+                for id_ in [
+                    *([m["parent_id"]] if m.get("parent_id") else []),
+                    *m.get("child_ids", []),
+                ]
+            }
+            - set(unknown_mediafiles)
+        )
+    result: dict[int, dict[str, Any]] = {}
+    for mm_id, mediafile_id in mm_with_unknown_mediafiles.items():
+        mediafile = unknown_mediafiles.get(mediafile_id)
+        if (
+            mediafile
+            and mediafile["owner_id"] == ONE_ORGANIZATION_FQID
+            and mediafile["published_to_meetings_in_organization_id"]
+            == ONE_ORGANIZATION_ID
+        ):
+            mediafile["meeting_mediafile_ids"] = [mm_id]
+            result[mediafile_id] = mediafile
+            while (parent_id := mediafile.get("parent_id")) and parent_id not in result:
+                mediafile = unknown_mediafiles[parent_id]
+                result[parent_id] = mediafile
+                descendant_ids: list[int] = [*mediafile.get("child_ids", [])]
+                while len(descendant_ids):
+                    descendant_id = descendant_ids.pop()
+                    if descendant_id not in result:
+                        descendant = unknown_mediafiles[descendant_id]
+                        result[descendant_id] = descendant
+                        descendant_ids.extend(descendant.get("child_ids", []))
+    return result
+
+
+def prepare_model(
+    collection: str,
+    model: dict[str, Any],
+    transform_datetime_decimal: bool,
+    datetime_to_unix: bool,
+) -> dict[str, Any]:
+    """
+    Removes the empty, meta and history fields of the model and transforms its
+    datetime and decimal values if requested.
+    """
+    history_fields = HISTORY_FIELDS_PER_COLLECTION.get(collection, [])
+    data = {
+        field: value
+        for field, value in model.items()
+        if value is not None
+        and not is_reserved_field(field)
+        and field not in history_fields
+    }
+    if transform_datetime_decimal:
+        for field, value in data.items():
+            if isinstance(value, datetime.datetime):
+                if datetime_to_unix:
+                    clean_value = value.replace(microsecond=0)
+                    data[field] = clean_value.timestamp()
+                else:
+                    data[field] = value.isoformat()
+            if isinstance(value, Decimal):
+                data[field] = str(value)
+    return data
 
 
 def get_relation_fields() -> Iterable[RelationListField]:
-    for field in Meeting().get_relation_fields():
+    for field in Meeting.get_relation_fields():
         if (
             isinstance(field, RelationListField)
             and field not in HISTORY_FIELDS_PER_COLLECTION["meeting"]
@@ -350,10 +416,3 @@ def get_relation_fields() -> Iterable[RelationListField]:
             )
         ):
             yield field
-
-
-def transfer_keys(res: dict[int, Any]) -> dict[str, Any]:
-    new_dict = {}
-    for key in res:
-        new_dict[str(key)] = res[key]
-    return new_dict
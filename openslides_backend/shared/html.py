@@ -1,8 +1,148 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from hashlib import sha256
+from html import unescape
+from typing import Any
+
+import bleach
+from bleach.css_sanitizer import CSSSanitizer
+from bleach.html5lib_shim import Filter  # type: ignore[attr-defined]
+from bleach.sanitizer import BleachSanitizerFilter
 from bs4 import BeautifulSoup
 
+# number of sanitised and extracted texts which are memoised per process
+MEMO_SIZE = 1024
+
+
+class LRUMemo:
+    """
+    Thread-safe memo with a bounded number of entries. The least recently used
+    entry is dropped first.
+    """
+
+    def __init__(self, maxsize: int = MEMO_SIZE) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Any, Any] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self.lock:
+            if (value := self.entries.get(key)) is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+# texts of the results of all sanitisers, keyed by the content hash of the result
+text_memo = LRUMemo()
+
+
+def get_content_hash(html: str) -> bytes:
+    return sha256(html.encode()).digest()
+
+
+class TextCollector(Filter):
+    """
+    Passes the token stream through and collects its text, which is the text of
+    the serialised HTML.
+    """
+
+    def __init__(self, source: Iterator[dict[str, Any]]) -> None:
+        super().__init__(source)
+        self.parts: list[str] = []
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for token in super().__iter__():
+            if token["type"] in ("Characters", "SpaceCharacters"):
+                self.parts.append(token["data"])
+            elif token["type"] == "Entity":
+                self.parts.append(unescape(f"&{token['name']};"))
+            yield token
+
+    def get_text(self) -> str:
+        return "".join(self.parts)
+
+
+class HTMLSanitizer:
+    """
+    Sanitises HTML with one prebuilt bleach Cleaner per profile of allowed tags
+    and styles. Cleaners are not thread-safe, so every thread builds its own.
+    Results are memoised by the content hash of the input and the text of each
+    result is stored in the `text_memo`, so that `get_text_from_html` does not
+    have to parse it again.
+    """
+
+    def __init__(
+        self,
+        attributes: Callable[[str, str, str], bool],
+        postprocess: Callable[[str], str] = lambda html: html,
+        memo_size: int = MEMO_SIZE,
+    ) -> None:
+        self.attributes = attributes
+        self.postprocess = postprocess
+        self.memo = LRUMemo(memo_size)
+        self.local = threading.local()
+
+    def get_cleaner(
+        self, allowed_tags: frozenset[str], allowed_styles: tuple[str, ...]
+    ) -> bleach.Cleaner:
+        cleaners: dict[Any, bleach.Cleaner] = self.local.__dict__.setdefault(
+            "cleaners", {}
+        )
+        profile = (allowed_tags, allowed_styles)
+        if (cleaner := cleaners.get(profile)) is None:
+            cleaner = cleaners[profile] = bleach.Cleaner(
+                tags=allowed_tags,
+                attributes=self.attributes,
+                css_sanitizer=CSSSanitizer(allowed_css_properties=allowed_styles),
+            )
+        return cleaner
+
+    def clean(
+        self, html: str, allowed_tags: set[str], allowed_styles: list[str]
+    ) -> str:
+        profile = (frozenset(allowed_tags), tuple(allowed_styles))
+        key = (profile, get_content_hash(html))
+        if (cleaned_html := self.memo.get(key)) is not None:
+            return cleaned_html
+        cleaner = self.get_cleaner(*profile)
+        html = html.replace("\t", "")
+        if html:
+            # same as `Cleaner.clean`, but with the collection of the text
+            collector = TextCollector(
+                BleachSanitizerFilter(
+                    source=cleaner.walker(cleaner.parser.parseFragment(html)),  # type: ignore[operator]
+                    allowed_tags=cleaner.tags,
+                    attributes=cleaner.attributes,
+                    strip_disallowed_tags=cleaner.strip,
+                    strip_html_comments=cleaner.strip_comments,
+                    css_sanitizer=cleaner.css_sanitizer,
+                    allowed_protocols=cleaner.protocols,
+                )
+            )
+            cleaned_html = self.postprocess(cleaner.serializer.render(collector))
+            text_memo.set(get_content_hash(cleaned_html), collector.get_text())
+        else:
+            cleaned_html = self.postprocess("")
+        self.memo.set(key, cleaned_html)
+        return cleaned_html
+
 
 def get_text_from_html(html: str) -> str:
     if html:
+        if (text := text_memo.get(get_content_hash(html))) is not None:
+            return text
         return BeautifulSoup(html, features="html.parser").get_text()
     else:
         return ""
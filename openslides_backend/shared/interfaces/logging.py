@@ -25,6 +25,9 @@ class Logger(Protocol):
     @abstractmethod
     def exception(self, message: Exception) -> None: ...
 
+    @abstractmethod
+    def isEnabledFor(self, level: int) -> bool: ...
+
 
 class LoggingModule(Protocol):
     """
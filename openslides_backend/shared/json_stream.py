@@ -0,0 +1,137 @@
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain
+from typing import Any, TextIO
+
+import simplejson as json
+
+# size in bytes of the chunks of a streamed JSON document
+CHUNK_SIZE = 64 * 1024
+
+# number of nested dicts and lists which are encoded piece by piece, e.g. the
+# presenter results, the collections of an export and their models
+STREAM_DEPTH = 3
+
+
+class StreamedObject:
+    """
+    A JSON object whose items are produced while it is encoded, e.g. the
+    collections of an exported meeting which are read from the database one
+    after another. The items can only be iterated once. The on_close callback,
+    which may e.g. end the transaction the items are read in, is called after
+    the items are iterated or when the object is closed before.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[tuple[Any, Any]],
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        self._items = items
+        self.on_close = on_close
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        try:
+            yield from self._items
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if on_close := self.on_close:
+            self.on_close = None
+            on_close()
+
+
+def iter_json_chunks(data: Any, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields the JSON encoding of data in chunks of about chunk_size bytes, so that
+    the whole document never has to be held in memory as a single string. The
+    output is the same as the one of `json.dumps(data)`.
+    """
+    buffer: list[str] = []
+    size = 0
+    for part in _iter_encode(data, json.JSONEncoder(), STREAM_DEPTH):
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(buffer).encode()
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def _iter_encode(data: Any, encoder: json.JSONEncoder, depth: int) -> Iterator[str]:
+    """
+    Encodes the outer dicts and lists piece by piece and everything below the
+    given depth at once. The C speedups of the encoder do not encode
+    incrementally, see `JSONEncoder.iterencode`. Streamed objects are always
+    encoded piece by piece.
+    """
+    if isinstance(data, StreamedObject) or (depth and isinstance(data, dict)):
+        separator = "{"
+        for key, value in data.items():
+            yield separator + encoder.encode(_encode_key(key)) + ": "
+            yield from _iter_encode(value, encoder, max(depth - 1, 0))
+            separator = ", "
+        yield "{}" if separator == "{" else "}"
+    elif depth and isinstance(data, list) and data:
+        separator = "["
+        for value in data:
+            yield separator
+            yield from _iter_encode(value, encoder, depth - 1)
+            separator = ", "
+        yield "]"
+    else:
+        yield encoder.encode(data)
+
+
+def _encode_key(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, bool):
+        return json.dumps(key)
+    return str(key)
+
+
+def get_json_response_body(data: Any) -> bytes | Iterator[bytes]:
+    """
+    Returns the JSON encoding of data as bytes if it fits into a single chunk and
+    as an iterator over its chunks otherwise, which can be used as the body of a
+    streamed response.
+    """
+    chunks = iter_json_chunks(data)
+    first = next(chunks, b"")
+    if (second := next(chunks, None)) is None:
+        return first
+    return chain((first, second), chunks)
+
+
+def write_json_collections(
+    file: TextIO,
+    collections: Iterable[tuple[str, Iterable[tuple[Any, Any]]]],
+    **kwargs: Any,
+) -> None:
+    """
+    Writes a JSON object of the form {collection: {id: model}} to the file with an
+    indentation of four spaces while the collections and models are iterated.
+    Collections without models are omitted. The output is the same as the one of
+    `json.dump` with `indent=4` for the whole object, but only a single model is
+    encoded at a time. The kwargs are passed to the JSONEncoder.
+    """
+    encoder = json.JSONEncoder(indent=4, **kwargs)
+    first_collection = True
+    for collection, models in collections:
+        first_model = True
+        for id_, model in models:
+            if first_model:
+                file.write("{" if first_collection else ",")
+                file.write(f"\n    {encoder.encode(str(collection))}: {{")
+                first_collection = first_model = False
+            else:
+                file.write(",")
+            # JSON strings never contain raw line breaks
+            encoded = encoder.encode(model).replace("\n", "\n        ")
+            file.write(f"\n        {encoder.encode(str(id_))}: {encoded}")
+        if not first_model:
+            file.write("\n    }")
+    file.write("{}" if first_collection else "\n}")
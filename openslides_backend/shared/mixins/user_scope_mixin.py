@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from enum import StrEnum
 from typing import Any
 
@@ -15,7 +16,7 @@ from ...permissions.permission_helper import (
 )
 from ...permissions.permissions import Permission, Permissions
 from ...services.database.interface import GetManyRequest
-from ..exceptions import MissingPermission
+from ..exceptions import MissingPermission, ModelDoesNotExist
 from ..patterns import fqid_from_collection_and_id
 
 
@@ -28,13 +29,24 @@ class UserScope(StrEnum):
         return repr(self.value)
 
 
+# scope, scope id, OML, committee meetings, archived meetings only, home committee
+UserScopeData = tuple[UserScope, int, str, dict[int, list[int]], bool, int | None]
+
+USER_SCOPE_FIELDS = [
+    "meeting_ids",
+    "organization_management_level",
+    "committee_management_ids",
+    "home_committee_id",
+]
+
+
 class UserScopeMixin(BaseServiceProvider):
     instance_committee_meeting_ids: dict
     name: str
+    prefetched_user_scopes: dict[int, UserScopeData] | None = None
+    prefetched_meeting_ids: set[int] | None = None
 
-    def get_user_scope(
-        self, id_or_instance: int | dict[str, Any]
-    ) -> tuple[UserScope, int, str, dict[int, list[int]], bool, int | None]:
+    def get_user_scope(self, id_or_instance: int | dict[str, Any]) -> UserScopeData:
         """
         Parameter id_or_instance: id for existing user or instance for user creating and altering actions.
         Returns in the tuple:
@@ -49,23 +61,66 @@ class UserScopeMixin(BaseServiceProvider):
         A committee can have no meetings if the user just has committee management rights and is
         not part of any of its meetings.
         """
-        meeting_ids: list[int] = []
         if isinstance(id_or_instance, dict):
             user = id_or_instance
+            meeting_ids: list[int] = []
             if "group_ids" in user and "meeting_id" in user:
                 meeting_ids.append(user["meeting_id"])
-        else:
-            user = self.datastore.get(
-                fqid_from_collection_and_id("user", id_or_instance),
-                [
-                    "meeting_ids",
-                    "organization_management_level",
-                    "committee_management_ids",
-                    "home_committee_id",
-                ],
-                lock_result=False,
+            return self.calculate_user_scope(user, meeting_ids)
+        if self.prefetched_user_scopes and (
+            user_scope := self.prefetched_user_scopes.get(id_or_instance)
+        ):
+            return user_scope
+        return self.get_user_scopes([id_or_instance])[id_or_instance]
+
+    def get_user_scopes(self, user_ids: list[int]) -> dict[int, UserScopeData]:
+        """
+        Returns the scope data of get_user_scope for all given users. The users
+        and all their meetings are fetched at once.
+        """
+        users = self.datastore.get_many(
+            [GetManyRequest("user", user_ids, USER_SCOPE_FIELDS)],
+            lock_result=False,
+        ).get("user", {})
+        for user_id in user_ids:
+            if user_id not in users:
+                raise ModelDoesNotExist(fqid_from_collection_and_id("user", user_id))
+        meetings = self._get_meetings_for_scope(
+            {
+                meeting_id
+                for user in users.values()
+                for meeting_id in user.get("meeting_ids") or []
+            }
+        )
+        return {
+            user_id: self.calculate_user_scope(
+                users[user_id], users[user_id].get("meeting_ids") or [], meetings
             )
-            meeting_ids += user.get("meeting_ids", [])
+            for user_id in user_ids
+        }
+
+    def prefetch_user_scopes(self, user_ids: list[int]) -> None:
+        """
+        Calculates the scopes of the given users at once, so that the following
+        calls of get_user_scope for them do not need to access the datastore.
+        The admins of their meetings are later fetched at once, too, see
+        _get_admin_user_ids_per_meeting. Must only be used if the users are not
+        changed in the meantime.
+        """
+        self.prefetched_user_scopes = self.get_user_scopes(user_ids)
+        self.prefetched_meeting_ids = {
+            meeting_id
+            for user_scope in self.prefetched_user_scopes.values()
+            for meeting_ids in user_scope[3].values()
+            for meeting_id in meeting_ids
+        }
+
+    def calculate_user_scope(
+        self,
+        user: dict[str, Any],
+        meeting_ids: list[int],
+        meetings: dict[int, dict[str, Any]] | None = None,
+    ) -> UserScopeData:
         committees_manager = set(user.get("committee_management_ids") or [])
         oml_right = user.get("organization_management_level", "")
         home_committee_id: int | None = user.get("home_committee_id")
@@ -76,7 +131,7 @@ class UserScopeMixin(BaseServiceProvider):
             committee_meetings,
             user_in_archived_meetings_only,
         ) = self.calculate_scope_data(
-            meeting_ids, committees_manager, home_committee_id
+            meeting_ids, committees_manager, home_committee_id, meetings
         )
 
         return (
@@ -137,10 +192,14 @@ class UserScopeMixin(BaseServiceProvider):
         if not self._check_not_committee_manager(instance_id):
             return False
 
-        if not (meetings := self._get_meetings_if_subset(b_meeting_ids)):
+        if not (meeting_ids := self._get_meeting_ids_if_subset(b_meeting_ids)):
+            return False
+        admin_user_ids = self._get_admin_user_ids_per_meeting(meeting_ids)
+        if not (meeting_ids := meeting_ids & admin_user_ids.keys()):
             return False
-        admin_meeting_users = self._collect_admin_meeting_users(meetings)
-        return self._analyze_meeting_admins(admin_meeting_users, meetings)
+        return all(
+            self.user_id in admin_user_ids[meeting_id] for meeting_id in meeting_ids
+        )
 
     def _check_not_committee_manager(self, instance_id: int) -> bool:
         """
@@ -157,12 +216,12 @@ class UserScopeMixin(BaseServiceProvider):
                 return False
         return True
 
-    def _get_meetings_if_subset(self, b_meeting_ids: set[int] | None) -> dict[int, Any]:
+    def _get_meeting_ids_if_subset(self, b_meeting_ids: set[int] | None) -> set[int]:
         """
         Helper function used in method check_for_admin_in_all_meetings.
         Returns:
-        * Requested user's meetings if these are subset of request user's meetings.
-        * Empty dict if either user has no meetings or the subset condition is not met.
+        * Requested user's meeting ids if these are subset of request user's meetings.
+        * Empty set if either user has no meetings or the subset condition is not met.
         """
         if not b_meeting_ids and not (
             b_meeting_ids := {
@@ -171,7 +230,7 @@ class UserScopeMixin(BaseServiceProvider):
                 for m_id in m_ids
             }
         ):
-            return {}
+            return set()
         if not (
             a_meeting_ids := set(
                 self.datastore.get(
@@ -181,29 +240,22 @@ class UserScopeMixin(BaseServiceProvider):
                 ).get("meeting_ids", [])
             )
         ):
-            return {}
+            return set()
         if not b_meeting_ids.issubset(a_meeting_ids):
-            return {}
-        return self.datastore.get_many(
-            [
-                GetManyRequest(
-                    "meeting",
-                    list(b_meeting_ids),
-                    ["admin_group_id", "group_ids"],
-                )
-            ],
-            lock_result=False,
-        ).get("meeting", {})
+            return set()
+        return b_meeting_ids
 
     def calculate_scope_data(
         self,
         meeting_ids: list[int],
         committees_manager: set[int],
         home_committee_id: int | None,
+        meetings: dict[int, dict[str, Any]] | None = None,
     ) -> tuple[UserScope, int, dict[int, list[int]], bool]:
         """
         Helper function used in method get_user_scope.
-        Params and return values contain data about the requested user.
+        Params and return values contain data about the requested user. The
+        meetings are fetched if they are not given.
 
         Based on the meeting_ids and committees_manager calculates user scope,
         retrieves its id and defines value for user_in_archived_meetings_only.
@@ -215,7 +267,9 @@ class UserScopeMixin(BaseServiceProvider):
             committee_meetings,
             active_committee_meetings,
             active_meetings_committee,
-        ) = self._get_meetings_committees_maps(meeting_ids, committees_manager)
+        ) = self._get_meetings_committees_maps(
+            meeting_ids, committees_manager, meetings
+        )
 
         user_scope, scope_id = self._get_user_scope_and_scope_id(
             home_committee_id,
@@ -240,7 +294,10 @@ class UserScopeMixin(BaseServiceProvider):
         )
 
     def _get_meetings_committees_maps(
-        self, meeting_ids: list[int], committees_manager: set[int]
+        self,
+        meeting_ids: list[int],
+        committees_manager: set[int],
+        meetings: dict[int, dict[str, Any]] | None = None,
     ) -> tuple[dict[int, list[int]], dict[int, list[int]], dict[int, int]]:
         """
         Helper function used in method calculate_scope_data.
@@ -249,7 +306,7 @@ class UserScopeMixin(BaseServiceProvider):
         committees-meetings maps for user's all and active meetings.
         """
         meetings_committees, active_meetings_committees = (
-            self._map_meetings_to_committees(meeting_ids)
+            self._map_meetings_to_committees(meeting_ids, meetings)
         )
 
         committee_meetings = self._get_committee_meetings_map(
@@ -266,7 +323,7 @@ class UserScopeMixin(BaseServiceProvider):
         )
 
     def _map_meetings_to_committees(
-        self, meeting_ids: list[int]
+        self, meeting_ids: list[int], meetings: dict[int, dict[str, Any]] | None = None
     ) -> tuple[dict[int, int], dict[int, int]]:
         """
         Maps each meeting to its committee. Returns full and active meeting mappings.
@@ -275,17 +332,12 @@ class UserScopeMixin(BaseServiceProvider):
         active_meetings_committees: dict[int, int] = {}
 
         if meeting_ids:
-            raw_meetings_data = self.datastore.get_many(
-                [
-                    GetManyRequest(
-                        "meeting",
-                        meeting_ids,
-                        ["committee_id", "is_active_in_organization_id"],
-                    )
-                ]
-            ).get("meeting", {})
-
-            for meeting_id, meeting_data in raw_meetings_data.items():
+            if meetings is None:
+                meetings = self._get_meetings_for_scope(meeting_ids)
+            user_meeting_ids = set(meeting_ids)
+            for meeting_id, meeting_data in meetings.items():
+                if meeting_id not in user_meeting_ids:
+                    continue
                 committee_id = meeting_data["committee_id"]
                 meetings_committees[meeting_id] = committee_id
                 if meeting_data.get("is_active_in_organization_id"):
@@ -293,6 +345,21 @@ class UserScopeMixin(BaseServiceProvider):
 
         return meetings_committees, active_meetings_committees
 
+    def _get_meetings_for_scope(
+        self, meeting_ids: Iterable[int]
+    ) -> dict[int, dict[str, Any]]:
+        if not (meeting_ids := list(meeting_ids)):
+            return {}
+        return self.datastore.get_many(
+            [
+                GetManyRequest(
+                    "meeting",
+                    meeting_ids,
+                    ["committee_id", "is_active_in_organization_id"],
+                )
+            ]
+        ).get("meeting", {})
+
     def _get_committee_meetings_map(
         self, meetings_committee: dict[int, int], committees_manager: set[int]
     ) -> dict[int, list[int]]:
@@ -329,77 +396,75 @@ class UserScopeMixin(BaseServiceProvider):
 
         return UserScope.Organization, 1
 
-    def _collect_admin_meeting_users(self, meetings: dict[int, Any]) -> set[int]:
+    def _get_admin_user_ids_per_meeting(
+        self, meeting_ids: set[int]
+    ) -> dict[int, set[int]]:
+        """
+        Helper function used in method check_for_admin_in_all_meetings.
+        Returns the ids of the admins per existing meeting. If the meetings
+        belong to the prefetched users, the admins of all their meetings are
+        fetched at once and reused for the following checks.
+        """
+        if self.prefetched_meeting_ids and meeting_ids <= self.prefetched_meeting_ids:
+            meeting_ids = self.prefetched_meeting_ids
+        return self.datastore.get_cached(
+            ("meeting_admin_user_ids", frozenset(meeting_ids)),
+            ("meeting", "group", "meeting_user"),
+            lambda: self._collect_admin_user_ids_per_meeting(meeting_ids),
+        )
+
+    def _collect_admin_user_ids_per_meeting(
+        self, meeting_ids: set[int]
+    ) -> dict[int, set[int]]:
         """
-        Returns meeting_user_ids from groups linked to the given meetings that are either:
+        Returns the user ids of the meeting users per meeting from groups that are either:
         * Admin groups for those meetings, or
         * Have User.CAN_UPDATE or User.CAN_MANAGE permissions
         """
-        group_ids = [
-            group_id
-            for meeting_dict in meetings.values()
-            for group_id in meeting_dict.get("group_ids", [])
-        ]
-        return {
-            mu_id
-            for group in self.datastore.get_many(
-                [
-                    GetManyRequest(
-                        "group",
-                        group_ids,
-                        [
-                            "meeting_user_ids",
-                            "permissions",
-                            "admin_group_for_meeting_id",
-                        ],
-                    )
-                ],
-                lock_result=False,
-            )
-            .get("group", {})
-            .values()
+        meetings = self.datastore.get_many(
+            [GetManyRequest("meeting", list(meeting_ids), ["group_ids"])],
+            lock_result=False,
+        ).get("meeting", {})
+        groups = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    "group",
+                    [
+                        group_id
+                        for meeting in meetings.values()
+                        for group_id in meeting.get("group_ids", [])
+                    ],
+                    ["meeting_user_ids", "permissions", "admin_group_for_meeting_id"],
+                )
+            ],
+            lock_result=False,
+        ).get("group", {})
+        admin_meeting_user_ids = {
+            meeting_user_id
+            for group in groups.values()
             if (
                 group.get("admin_group_for_meeting_id")
                 or "user.can_update" in group.get("permissions", [])
                 or "user.can_manage" in group.get("permissions", [])
             )
-            for mu_id in group.get("meeting_user_ids", [])
+            for meeting_user_id in group.get("meeting_user_ids", [])
         }
-
-    def _analyze_meeting_admins(
-        self,
-        admin_meeting_user_ids: set[int],
-        all_meetings: dict[int, Any],
-    ) -> bool:
-        """
-        Helper function used in method check_for_admin_in_all_meetings.
-        Compares the users of admin meeting users of all meetings with the ids of requested user and request user.
-        Request user must be admin in all meetings. Requested user cannot be admin in any.
-        """
-        meeting_id_to_admin_user_ids: dict[int, set[int]] = {
-            meeting_id: set() for meeting_id in all_meetings
+        meeting_users = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    "meeting_user",
+                    list(admin_meeting_user_ids),
+                    ["user_id", "meeting_id"],
+                )
+            ],
+            lock_result=False,
+        ).get("meeting_user", {})
+        admin_user_ids: dict[int, set[int]] = {
+            meeting_id: set() for meeting_id in meetings
         }
-        for meeting_user in (
-            self.datastore.get_many(
-                [
-                    GetManyRequest(
-                        "meeting_user",
-                        list(admin_meeting_user_ids),
-                        ["user_id", "meeting_id"],
-                    )
-                ],
-                lock_result=False,
-            )
-            .get("meeting_user", {})
-            .values()
-        ):
-            meeting_id_to_admin_user_ids[meeting_user["meeting_id"]].add(
-                meeting_user["user_id"]
-            )
-        return all(
-            self.user_id in admin_users
-            for admin_users in meeting_id_to_admin_user_ids.values()
-        )
+        for meeting_user in meeting_users.values():
+            admin_user_ids[meeting_user["meeting_id"]].add(meeting_user["user_id"])
+        return admin_user_ids
 
     def _check_oml_levels(self, always_check_user_oml: bool, user_oml: str) -> bool:
         """
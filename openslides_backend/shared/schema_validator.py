@@ -0,0 +1,84 @@
+import json
+import os
+import threading
+from collections.abc import Callable
+from hashlib import sha256
+from typing import Any
+
+import fastjsonschema
+
+from .typing import Schema
+
+SchemaValidator = Callable[[Any], Any]
+
+# If set, the generated validator code is stored in and loaded from this
+# directory, so that it does not have to be generated again on every start.
+SCHEMA_CACHE_DIR_VARIABLE = "OPENSLIDES_BACKEND_SCHEMA_CACHE_DIR"
+
+_validators: dict[str, SchemaValidator] = {}
+_validators_lock = threading.Lock()
+
+
+class LazySchemaValidator:
+    """
+    Validator for the given schema which is only compiled on its first call.
+    Identical schemas share a single compiled validator.
+    """
+
+    __slots__ = ("schema", "_validator")
+
+    def __init__(self, schema: Schema) -> None:
+        self.schema = schema
+        self._validator: SchemaValidator | None = None
+
+    def __call__(self, data: Any) -> Any:
+        if self._validator is None:
+            self._validator = get_schema_validator(self.schema)
+        return self._validator(data)
+
+
+def get_schema_validator(schema: Schema) -> SchemaValidator:
+    """
+    Returns the compiled validator for the given schema. Validators are cached
+    per process by the content of the schema and, if the cache directory is
+    configured, on disk.
+    """
+    key = get_schema_key(schema)
+    if (validator := _validators.get(key)) is None:
+        with _validators_lock:
+            if (validator := _validators.get(key)) is None:
+                validator = _validators[key] = compile_schema(schema, key)
+    return validator
+
+
+def get_schema_key(schema: Schema) -> str:
+    return sha256(json.dumps(schema, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def compile_schema(schema: Schema, key: str) -> SchemaValidator:
+    if not (cache_dir := os.environ.get(SCHEMA_CACHE_DIR_VARIABLE)):
+        return fastjsonschema.compile(schema)
+    path = os.path.join(cache_dir, f"{fastjsonschema.VERSION}-{key}.py")
+    try:
+        with open(path) as file:
+            code = file.read()
+    except OSError:
+        code = fastjsonschema.compile_to_code(schema)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # write to a temporary file first so that concurrently starting
+            # workers never read a partially written file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+            with open(tmp_path, "w") as file:
+                file.write(code)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    namespace: dict[str, Any] = {}
+    exec(code, namespace)
+    return namespace["validate"]
+
+
+def clear_schema_validators() -> None:
+    with _validators_lock:
+        _validators.clear()
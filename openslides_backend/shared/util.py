@@ -1,9 +1,8 @@
 from typing import Any
 
-import bleach
 import simplejson as json
-from bleach.css_sanitizer import CSSSanitizer
 
+from .html import HTMLSanitizer
 from .patterns import fqid_from_collection_and_id
 
 ALLOWED_HTML_TAGS_STRICT = {
@@ -160,32 +159,32 @@ ONE_ORGANIZATION_ID = 1
 ONE_ORGANIZATION_FQID = fqid_from_collection_and_id("organization", ONE_ORGANIZATION_ID)
 
 
+def check_attr_allowed(tag: str, name: str, value: str) -> bool:
+    if name.startswith("data-"):
+        return True
+    if name in ALLOWED_ATTRIBUTES_ALL:
+        return True
+    if tag in ALLOWED_ATTRIBUTES and name in ALLOWED_ATTRIBUTES[tag]:
+        return True
+
+    return False
+
+
+html_sanitizer = HTMLSanitizer(
+    check_attr_allowed,
+    lambda html: html.replace(
+        "<iframe",
+        '<iframe sandbox="allow-scripts allow-same-origin" referrerpolicy="no-referrer"',
+    ),
+)
+
+
 def validate_html(
     html: str,
     allowed_tags: set[str] = ALLOWED_HTML_TAGS_STRICT,
     allowed_styles: list[str] = ALLOWED_STYLES,
 ) -> str:
-    def check_attr_allowed(tag: str, name: str, value: str) -> bool:
-        if name.startswith("data-"):
-            return True
-        if name in ALLOWED_ATTRIBUTES_ALL:
-            return True
-        if tag in ALLOWED_ATTRIBUTES and name in ALLOWED_ATTRIBUTES[tag]:
-            return True
-
-        return False
-
-    html = html.replace("\t", "")
-    cleaned_html = bleach.clean(
-        html,
-        tags=allowed_tags,
-        attributes=check_attr_allowed,
-        css_sanitizer=CSSSanitizer(allowed_css_properties=allowed_styles),
-    )
-    return cleaned_html.replace(
-        "<iframe",
-        '<iframe sandbox="allow-scripts allow-same-origin" referrerpolicy="no-referrer"',
-    )
+    return html_sanitizer.clean(html, allowed_tags, allowed_styles)
 
 
 def get_initial_data_file(file: str) -> dict[str, Any]:
@@ -10,6 +10,7 @@ from openslides_backend.services.postgresql.db_connection_handling import (
     env,
     get_new_os_conn,
 )
+from openslides_backend.services.postgresql.preflight_cache import preflight_cache
 from tests.conftest_helper import (
     deactivate_notify_triggers,
     generate_remove_all_test_functions,
@@ -79,6 +80,8 @@ def db_connection() -> Generator[Connection[DictRow], None, None]:
         with conn.cursor() as curs:
             curs.execute("SELECT init_table_contents();")
         conn.commit()
+        # the version table and the organization were written without notification
+        preflight_cache.invalidate()
         yield conn
         conn.commit()
         with conn.cursor() as curs, suppress(AdminShutdown):
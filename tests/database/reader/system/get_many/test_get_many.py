@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from psycopg import Connection
@@ -258,3 +258,28 @@ def test_use_changed_models_missing_field(db_connection: Connection) -> None:
             2: {"id": 2, "name": "42", "organization_id": 1},
         },
     }
+
+
+def test_use_changed_models_missing_fields_coalesced(db_connection: Connection) -> None:
+    """Missing fields of different ids are fetched with one query per collection."""
+    setup_data(db_connection, standard_data)
+    with get_new_os_conn() as conn:
+        extended_database = ExtendedDatabase(conn, MagicMock(), MagicMock())
+        extended_database.apply_changed_model("committee/1", {"name": "3"})
+        extended_database.apply_changed_model("committee/2", {"organization_id": None})
+        with patch.object(
+            extended_database.database_reader,
+            "execute_query",
+            wraps=extended_database.database_reader.execute_query,
+        ) as execute_query:
+            response = extended_database.get_many(
+                default_request, use_changed_models=True
+            )
+    assert execute_query.call_count == 2
+    assert response == {
+        "user": {1: {"id": 1, "username": "data"}},
+        "committee": {
+            1: {"id": 1, "name": "3", "organization_id": 1},
+            2: {"id": 2, "name": "42"},
+        },
+    }
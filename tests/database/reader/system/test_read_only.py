@@ -0,0 +1,77 @@
+from threading import Thread
+from time import sleep
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from psycopg import Connection
+from psycopg.errors import ReadOnlySqlTransaction
+
+from openslides_backend.services.database.read_only_database import ReadOnlyDatabase
+from openslides_backend.services.postgresql import db_connection_handling
+from openslides_backend.services.postgresql.db_connection_handling import (
+    get_new_os_conn,
+    get_new_read_only_os_conn,
+)
+from openslides_backend.shared.exceptions import BadCodingException
+from openslides_backend.shared.filters import FilterOperator
+from tests.database.reader.system.util import setup_data, standard_data
+
+
+def test_no_row_locks(db_connection: Connection) -> None:
+    setup_data(db_connection, standard_data)
+    with get_new_read_only_os_conn() as conn:
+        read_only_database = ReadOnlyDatabase(conn, MagicMock(), MagicMock())
+        assert read_only_database.get("user/1", ["username"], lock_result=True) == {
+            "id": 1,
+            "username": "data",
+        }
+        assert read_only_database.filter(
+            "user", FilterOperator("is_demo_user", "=", True), ["id"], lock_result=True
+        ) == {1: {"id": 1}, 3: {"id": 3}}
+        # the rows can still be locked by a writing transaction
+        with get_new_os_conn() as write_conn:
+            write_conn.execute("SELECT id FROM user_t FOR UPDATE NOWAIT")
+
+
+def test_read_only_transaction(db_connection: Connection) -> None:
+    setup_data(db_connection, standard_data)
+    with get_new_read_only_os_conn() as conn:
+        with pytest.raises(ReadOnlySqlTransaction):
+            conn.execute("UPDATE user_t SET username = 'x' WHERE id = 1")
+    # the pooled connection is writable again in a normal context
+    with get_new_os_conn() as conn:
+        conn.execute("UPDATE user_t SET username = 'x' WHERE id = 1")
+        conn.rollback()
+
+
+def test_no_changes(db_connection: Connection) -> None:
+    with get_new_read_only_os_conn() as conn:
+        read_only_database = ReadOnlyDatabase(conn, MagicMock(), MagicMock())
+        with pytest.raises(BadCodingException):
+            read_only_database.apply_changed_model("user/1", {"username": "x"})
+        with pytest.raises(BadCodingException):
+            read_only_database.reserve_id("user")
+
+
+def test_read_only_pool_created_once() -> None:
+    pool = MagicMock(closed=False)
+
+    def create_conn_pool(*args: Any) -> MagicMock:
+        sleep(0.05)
+        return pool
+
+    with (
+        patch.object(db_connection_handling, "env", MagicMock()),
+        patch.object(db_connection_handling, "os_read_only_conn_pool", None),
+        patch.object(
+            db_connection_handling, "create_conn_pool", side_effect=create_conn_pool
+        ) as create_mock,
+    ):
+        threads = [Thread(target=get_new_read_only_os_conn) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert create_mock.call_count == 1
+    pool.close.assert_not_called()
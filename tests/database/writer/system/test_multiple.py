@@ -6,7 +6,7 @@ from openslides_backend.services.database.extended_database import ExtendedDatab
 from openslides_backend.services.postgresql.db_connection_handling import (
     get_new_os_conn,
 )
-from openslides_backend.shared.exceptions import ModelDoesNotExist
+from openslides_backend.shared.exceptions import ModelDoesNotExist, ModelExists
 from openslides_backend.shared.interfaces.event import EventType
 from tests.database.util import TestPerformance, performance
 from tests.database.writer.system.util import (
@@ -130,6 +130,120 @@ def test_delete_update() -> None:
     assert e_info.value.fqid == "user/1"
 
 
+def test_batched_create() -> None:
+    data = get_data()
+    data[0]["events"] = [
+        *(
+            {
+                "type": EventType.Create,
+                "fqid": f"user/{i}",
+                "fields": {"username": f"{i}", "first_name": "2"},
+            }
+            for i in range(1, 6)
+        ),
+        {
+            "type": EventType.Create,
+            "fqid": "user/6",
+            "fields": {"username": "6"},
+        },
+        {
+            "type": EventType.Create,
+            "fqid": "committee/1",
+            "fields": {"name": "com1", "manager_ids": [1, 2, 3, 4, 5]},
+        },
+    ]
+    with get_new_os_conn() as conn:
+        with TestPerformance(conn) as performance:
+            extended_database = ExtendedDatabase(conn, MagicMock(), MagicMock())
+            result = extended_database.write(create_write_requests(data))
+    assert set(result) == {"committee/1", *(f"user/{i}" for i in range(1, 7))}
+    # savepoint, three model inserts, one intermediate table insert, release
+    assert performance["requests_count"] == 6
+    assert_model(
+        "committee/1", {"id": 1, "name": "com1", "manager_ids": [1, 2, 3, 4, 5]}
+    )
+    assert_model("user/6", {"id": 6, "username": "6"})
+
+
+def test_batched_create_model_exists() -> None:
+    create_models(get_data())
+    data = get_data()
+    data[0]["events"] = [
+        {
+            "type": EventType.Create,
+            "fqid": f"user/{i}",
+            "fields": {"username": f"{i}"},
+        }
+        for i in range(3, 0, -1)
+    ]
+    with get_new_os_conn() as conn:
+        extended_database = ExtendedDatabase(conn, MagicMock(), MagicMock())
+        with pytest.raises(ModelExists) as e_info:
+            extended_database.write(create_write_requests(data))
+    assert e_info.value.fqid == "user/1"
+    assert_no_model("user/2")
+
+
+def test_batched_delete() -> None:
+    create_models(
+        [
+            {
+                "events": [
+                    {
+                        "type": EventType.Create,
+                        "fqid": f"user/{i}",
+                        "fields": {"username": f"{i}"},
+                    }
+                    for i in range(1, 4)
+                ]
+            }
+        ]
+    )
+    data = get_data()
+    data[0]["events"] = [
+        {"type": EventType.Delete, "fqid": f"user/{i}"} for i in range(1, 4)
+    ]
+    with get_new_os_conn() as conn:
+        extended_database = ExtendedDatabase(conn, MagicMock(), MagicMock())
+        result = extended_database.write(create_write_requests(data))
+    assert result == {"user/1": {}, "user/2": {}, "user/3": {}}
+    for i in range(1, 4):
+        assert_no_model(f"user/{i}")
+
+
+def test_batched_delete_model_does_not_exist() -> None:
+    create_models(get_data())
+    data = get_data()
+    data[0]["events"] = [
+        {"type": EventType.Delete, "fqid": "user/1"},
+        {"type": EventType.Delete, "fqid": "user/2"},
+        {"type": EventType.Delete, "fqid": "user/1"},
+    ]
+    with get_new_os_conn() as conn:
+        extended_database = ExtendedDatabase(conn, MagicMock(), MagicMock())
+        with pytest.raises(ModelDoesNotExist) as e_info:
+            extended_database.write(create_write_requests(data))
+    assert e_info.value.fqid == "user/2"
+    assert_model("user/1", {"id": 1, "username": "1", "first_name": "1"})
+
+
+def test_batched_delete_model_does_not_exist_rolls_back_batch() -> None:
+    create_models(get_data())
+    data = get_data()
+    data[0]["events"] = [
+        {"type": EventType.Delete, "fqid": "user/1"},
+        {"type": EventType.Delete, "fqid": "user/2"},
+    ]
+    with get_new_os_conn() as conn:
+        extended_database = ExtendedDatabase(conn, MagicMock(), MagicMock())
+        with pytest.raises(ModelDoesNotExist):
+            extended_database.write(create_write_requests(data))
+        # the connection is still usable and the batch left no partial deletes
+        with conn.cursor() as curs:
+            curs.execute("SELECT id FROM user_t WHERE id = 1")
+            assert curs.fetchall() == [{"id": 1}]
+
+
 @performance
 def test_update_performance() -> None:
     MODEL_COUNT = 10000
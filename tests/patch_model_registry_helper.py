@@ -1,6 +1,6 @@
 from unittest.mock import _patch, patch
 
-from openslides_backend.models.base import Model, ModelMetaClass
+from openslides_backend.models.base import Model, ModelFieldMetadata, ModelMetaClass
 from openslides_backend.models.fields import Field
 from openslides_backend.shared.patterns import Collection
 
@@ -23,6 +23,7 @@ class FakeModelMetaClass(ModelMetaClass):
                 if isinstance(attr, Field):
                     attr.own_collection = new_class.collection
                     attr.own_field_name = attr_name
+            new_class.field_metadata = ModelFieldMetadata.from_model_class(new_class)
             fake_registry[new_class.collection] = new_class
         return new_class
 
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, cast
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock
 from zoneinfo import ZoneInfo
 
 from psycopg.types.json import Jsonb
@@ -603,6 +603,63 @@ class MeetingClone(BaseActionTestCase):
             },
         )
 
+    def test_clone_with_extension_references(self) -> None:
+        self.set_test_data_with_admin()
+        self.create_motion(1, 23)
+        self.create_motion(
+            meeting_id=1,
+            base=22,
+            motion_data={
+                "state_extension": "see [motion/23] and [motion/22]",
+                "state_extension_reference_ids": ["motion/22", "motion/23"],
+                "recommendation_extension": "<p>[motion/23]</p>",
+                "recommendation_extension_reference_ids": ["motion/23"],
+            },
+        )
+        response = self.request("meeting.clone", {"meeting_id": 1})
+        self.assert_status_code(response, 200)
+        self.assert_model_exists(
+            "motion/24",
+            {
+                "meeting_id": 2,
+                "state_extension": "see [motion/25] and [motion/24]",
+                "recommendation_extension": "<p>[motion/25]</p>",
+                "recommendation_extension_reference_ids": ["motion/25"],
+            },
+        )
+        self.assert_model_exists(
+            "motion/22",
+            {
+                "state_extension": "see [motion/23] and [motion/22]",
+                "recommendation_extension": "<p>[motion/23]</p>",
+            },
+        )
+
+    def test_clone_drops_origin_in_other_meeting(self) -> None:
+        self.set_test_data_with_admin()
+        self.create_meeting(4)
+        self.create_motion(4, 1)
+        self.create_motion(1, 2, motion_data={"origin_id": 1, "origin_meeting_id": 4})
+        self.set_models({"motion/1": {"all_derived_motion_ids": [2]}})
+        response = self.request("meeting.clone", {"meeting_id": 1})
+        self.assert_status_code(response, 200)
+        self.assert_model_exists(
+            "motion/3",
+            {
+                "meeting_id": 5,
+                "origin_id": None,
+                "origin_meeting_id": None,
+                "all_origin_ids": None,
+            },
+        )
+        self.assert_model_exists(
+            "motion/1", {"derived_motion_ids": [2], "all_derived_motion_ids": [2]}
+        )
+        self.assert_model_exists(
+            "motion/2",
+            {"origin_id": 1, "origin_meeting_id": 4, "all_origin_ids": [1]},
+        )
+
     def test_clone_user_ids_and_admin_ids(self) -> None:
         del self.meeting_data["template_for_organization_id"]
         self.set_test_data()
@@ -877,12 +934,12 @@ class MeetingClone(BaseActionTestCase):
                 },
             }
         )
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
-        self.assertEqual(self.media.duplicate_mediafile.call_count, 2)
-        self.media.duplicate_mediafile.assert_has_calls(
-            calls=[call(1, 3), call(2, 4)], any_order=True
+        self.media.duplicate_mediafiles.assert_called_once()
+        self.assertCountEqual(
+            self.media.duplicate_mediafiles.call_args.args[0], [(1, 3), (2, 4)]
         )
         self.assert_model_exists(
             "meeting_mediafile/21",
@@ -934,10 +991,10 @@ class MeetingClone(BaseActionTestCase):
                 },
             }
         )
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
-        self.media.duplicate_mediafile.assert_called_once_with(2, 4)
+        self.media.duplicate_mediafiles.assert_called_once_with([(2, 4)])
         self.assert_model_exists(
             "meeting_mediafile/21",
             {
@@ -1068,10 +1125,10 @@ class MeetingClone(BaseActionTestCase):
     def check_clone_with_meeting_mediafile_hierarchy_complex(
         self, check_fqids: list[str]
     ) -> None:
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
-        self.media.duplicate_mediafile.assert_called_once_with(1, 4)
+        self.media.duplicate_mediafiles.assert_called_once_with([(1, 4)])
         self.assert_model_exists(
             "meeting_mediafile/31", {"meeting_id": 2, "mediafile_id": 5}
         )
@@ -1236,7 +1293,7 @@ class MeetingClone(BaseActionTestCase):
         )
         self.assert_status_code(response, 200)
 
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
 
@@ -1290,7 +1347,7 @@ class MeetingClone(BaseActionTestCase):
             }
         )
 
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
         self.assert_model_exists(
@@ -1322,7 +1379,44 @@ class MeetingClone(BaseActionTestCase):
         self.assert_model_exists(
             "mediafile/17", {"meeting_mediafile_ids": [10, 11, 12]}
         )
-        self.media.duplicate_mediafile.assert_not_called()
+        self.media.duplicate_mediafiles.assert_not_called()
+
+    def test_clone_keeps_orga_wide_mediafile_shared(self) -> None:
+        self.set_test_data_with_admin()
+        self.create_mediafile(1)
+        self.create_mediafile(2, 1)
+        self.set_models(
+            {
+                "meeting_mediafile/10": {
+                    "is_public": True,
+                    "meeting_id": 1,
+                    "mediafile_id": 1,
+                },
+                "meeting_mediafile/20": {
+                    "is_public": True,
+                    "meeting_id": 1,
+                    "mediafile_id": 2,
+                },
+            }
+        )
+        self.media.duplicate_mediafiles = MagicMock()
+        response = self.request("meeting.clone", {"meeting_id": 1})
+        self.assert_status_code(response, 200)
+        self.media.duplicate_mediafiles.assert_called_once_with([(2, 3)])
+        self.assert_model_exists(
+            "meeting_mediafile/21", {"meeting_id": 2, "mediafile_id": 1}
+        )
+        self.assert_model_exists(
+            "meeting_mediafile/22", {"meeting_id": 2, "mediafile_id": 3}
+        )
+        self.assert_model_exists(
+            "mediafile/1",
+            {"owner_id": ONE_ORGANIZATION_FQID, "meeting_mediafile_ids": [10, 21]},
+        )
+        self.assert_model_exists(
+            "mediafile/3", {"owner_id": "meeting/2", "meeting_mediafile_ids": [22]}
+        )
+        self.assert_model_not_exists("mediafile/4")
 
     def test_clone_with_organization_tag(self) -> None:
         self.test_models["organization_tag/1"]["tagged_ids"] = ["meeting/1"]
@@ -2061,7 +2155,7 @@ class MeetingClone(BaseActionTestCase):
         with CountDatastoreCalls() as counter:
             response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
-        assert counter.calls == 9
+        assert counter.calls == 7
 
     @performance
     def test_clone_performance(self) -> None:
@@ -2333,7 +2427,7 @@ class MeetingClone(BaseActionTestCase):
                 },
             }
         )
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
         models: dict[str, dict[str, Any]] = {
@@ -2407,7 +2501,7 @@ class MeetingClone(BaseActionTestCase):
         }
         for fqid, model in models.items():
             self.assert_model_exists(fqid, model)
-        self.media.duplicate_mediafile.assert_not_called()
+        self.media.duplicate_mediafiles.assert_not_called()
 
     def test_clone_require_duplicate_from_allowed(self) -> None:
         self.set_test_data_with_admin()
@@ -2456,7 +2550,7 @@ class MeetingClone(BaseActionTestCase):
                 },
             }
         )
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1101, "admin_ids": [1]})
         self.assert_status_code(response, 200)
 
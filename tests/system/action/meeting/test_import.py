@@ -1087,7 +1087,9 @@ class MeetingImport(BaseActionTestCase):
         self.assert_status_code(response, 200)
         mediafile = self.assert_model_exists("mediafile/1", {"owner_id": "meeting/2"})
         assert mediafile.get("blob") is None
-        self.media.upload_mediafile.assert_called_with(file_content, 1, "text/plain")
+        self.media.upload_mediafiles.assert_called_with(
+            [(file_content, 1, "text/plain")]
+        )
         self.assert_model_exists(
             "meeting_mediafile/1", {"mediafile_id": 1, "meeting_id": 2}
         )
@@ -2267,6 +2269,35 @@ class MeetingImport(BaseActionTestCase):
             response = self.request("meeting.import", data)
         self.assert_status_code(response, 200)
 
+    @performance
+    def test_generated_meeting_performance(self) -> None:
+        ids = list(range(1, 10001))
+        request_data = self.create_request_data(
+            {
+                "motion": {
+                    str(id_): self.get_motion_data(id_, {"list_of_speakers_id": id_})
+                    for id_ in ids
+                },
+                "list_of_speakers": {
+                    str(id_): {
+                        "id": id_,
+                        "meeting_id": 1,
+                        "content_object_id": f"motion/{id_}",
+                        "closed": False,
+                        "speaker_ids": [],
+                        "projection_ids": [],
+                    }
+                    for id_ in ids
+                },
+            }
+        )
+        request_data["meeting"]["meeting"]["1"]["motion_ids"] = ids
+        request_data["meeting"]["meeting"]["1"]["list_of_speakers_ids"] = ids
+        request_data["meeting"]["motion_state"]["1"]["motion_ids"] = ids
+        with Profiler("test_meeting_import_generated.prof"):
+            response = self.request("meeting.import", request_data)
+        self.assert_status_code(response, 200)
+
     def test_import_amendment_paragraphs(self) -> None:
         request_data = self.create_request_data(
             {
@@ -9,6 +9,7 @@ from openslides_backend.action.mixins.delegation_based_restriction_mixin import
 from openslides_backend.permissions.base_classes import Permission
 from openslides_backend.permissions.permissions import Permissions
 from tests.system.action.base import BaseActionTestCase
+from tests.system.util import CountDatabaseQueries, performance
 
 DEFAULT_PASSWORD = "password"
 
@@ -54,6 +55,24 @@ class SpeakerCreateActionTest(BaseActionTestCase):
         self.assert_model_exists("list_of_speakers/23", {"speaker_ids": [1]})
         self.assert_model_exists("user/7", {"meeting_user_ids": [17]})
 
+    @performance
+    def test_create_many_query_count(self) -> None:
+        self.set_models(self.los_23_data)
+        meeting_user_ids = [
+            self.set_user_groups(self.create_user(f"user_{i}"), [1])[0]
+            for i in range(500)
+        ]
+        with CountDatabaseQueries() as counter:
+            response = self.request_multi(
+                "speaker.create",
+                [
+                    {"meeting_user_id": meeting_user_id, "list_of_speakers_id": 23}
+                    for meeting_user_id in meeting_user_ids
+                ],
+            )
+        self.assert_status_code(response, 200)
+        print(f"speaker.create of 500 speakers: {counter.queries} queries")
+
     def test_create_in_closed_los(self) -> None:
         self.test_models["list_of_speakers/23"]["closed"] = True
         self.set_models(self.test_models)
@@ -1,4 +1,9 @@
-from openslides_backend.action.generics.delete import DeleteAction
+from typing import Any
+
+from openslides_backend.action.generics.delete import (
+    DeleteAction,
+    is_plain_delete_action,
+)
 from openslides_backend.action.util.action_type import ActionType
 from openslides_backend.action.util.register import register_action
 from openslides_backend.models import fields
@@ -108,6 +113,11 @@ class FakeModelCDDDeleteAction(DeleteAction):
     skip_archived_meeting_check = True
 
 
+class FakeModelCDBCustomDeleteAction(FakeModelCDBDeleteAction):
+    def update_instance(self, instance: dict[str, Any]) -> dict[str, Any]:
+        return instance
+
+
 class TestDeleteCascade(PatchModelRegistryMixin, BaseGenericTestCase):
     collection_a = "fake_model_cd_a"
     collection_b = "fake_model_cd_b"
@@ -318,3 +328,30 @@ class TestDeleteCascade(PatchModelRegistryMixin, BaseGenericTestCase):
         self.assert_model_exists(
             "fake_model_cd_d/1", {"fake_model_cd_a_set_null_required": 1}
         )
+
+    def test_cascade_protect_multiple(self) -> None:
+        self.set_models(
+            {
+                "fake_model_cd_a/1": {"fake_model_cd_b": 1, "fake_model_cd_c": 2},
+                "fake_model_cd_b/1": {
+                    "fake_model_cd_a": 1,
+                    "fake_model_cd_c_protect": 1,
+                    "fake_model_cd_c_cascade": 3,
+                },
+                "fake_model_cd_c/1": {"fake_model_cd_b_protected": 1},
+                "fake_model_cd_c/2": {"fake_model_cd_a": 1},
+                "fake_model_cd_c/3": {"fake_model_cd_b_cascaded": 1},
+            }
+        )
+        response = self.request("fake_model_cd_a.delete", {"id": 1})
+        self.assert_status_code(response, 400)
+        self.assertIn(
+            "You can not delete fake_model_cd_a/1 because you have to delete the following related models first: ['fake_model_cd_c/1']",
+            response.json["message"],
+        )
+        for fqid in ("fake_model_cd_a/1", "fake_model_cd_b/1", "fake_model_cd_c/3"):
+            self.assert_model_exists(fqid)
+
+    def test_is_plain_delete_action(self) -> None:
+        assert is_plain_delete_action(FakeModelCDBDeleteAction)
+        assert not is_plain_delete_action(FakeModelCDBCustomDeleteAction)
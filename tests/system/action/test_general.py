@@ -73,6 +73,19 @@ class GeneralActionWSGITester(BaseActionTestCase):
         response = self.client.get(get_route_path(ActionView.health_route))
         self.assert_status_code(response, 200)
 
+    def test_metrics_route(self) -> None:
+        response = self.client.get(get_route_path(ActionView.metrics_route))
+        self.assert_status_code(response, 200)
+        write_metrics = response.json["metrics"]["write"]
+        for key in (
+            "transactions",
+            "retries",
+            "failed_transactions",
+            "lock_wait_time",
+            "write_time",
+        ):
+            self.assertIn(key, write_metrics)
+
     def test_info_route(self) -> None:
         response = self.client.get(get_route_path(ActionView.info_route))
         self.assert_status_code(response, 200)
@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 from openslides_backend.action.generics.create import CreateAction
 from openslides_backend.action.util.register import register_action
 from openslides_backend.models import fields
 from openslides_backend.models.base import model_registry
 from openslides_backend.permissions.management_levels import OrganizationManagementLevel
+from openslides_backend.permissions.permission_helper import has_perm, is_admin
 from openslides_backend.permissions.permissions import Permissions
 from openslides_backend.services.postgresql.db_connection_handling import (
     get_new_os_conn,
@@ -156,3 +159,27 @@ class TestPermissions(PatchModelRegistryMixin, BaseActionTestCase):
             response.json["message"]
             == "You are not allowed to perform action fake_model_p.create. Missing Permission: motion.can_create"
         )
+
+    def test_permission_context_cached(self) -> None:
+        self.set_user_groups(self.user_id, [3])
+        self.set_group_permissions(3, [Permissions.Motion.CAN_SEE])
+        reader = self.datastore.database_reader
+        with (
+            patch.object(reader, "get_many", wraps=reader.get_many) as get_many,
+            patch.object(reader, "filter", wraps=reader.filter) as filter_,
+        ):
+            assert not has_perm(
+                self.datastore, self.user_id, Permissions.Motion.CAN_CREATE, 1
+            )
+            read_count = get_many.call_count + filter_.call_count
+            assert has_perm(self.datastore, self.user_id, Permissions.Motion.CAN_SEE, 1)
+            assert not is_admin(self.datastore, self.user_id, 1)
+            assert get_many.call_count + filter_.call_count == read_count
+            # changes of the permissions in the request invalidate the cache
+            self.datastore.apply_changed_model(
+                "group/3", {"permissions": [Permissions.Motion.CAN_MANAGE]}
+            )
+            assert has_perm(
+                self.datastore, self.user_id, Permissions.Motion.CAN_CREATE, 1
+            )
+            assert get_many.call_count + filter_.call_count > read_count
@@ -1,8 +1,14 @@
 from datetime import datetime
+from unittest.mock import patch
 
 from psycopg.types.json import Jsonb
 
-from openslides_backend.action.mixins.import_mixins import ImportState
+from openslides_backend.action.mixins.import_mixins import (
+    ImportPreviewStore,
+    ImportRow,
+    ImportState,
+)
+from openslides_backend.shared.exceptions import ActionException, ModelDoesNotExist
 from tests.system.action.base import BaseActionTestCase
 from tests.system.action.topic.test_json_upload import TopicJsonUploadForUseInImport
 
@@ -45,6 +51,94 @@ class TopicJsonImport(BaseActionTestCase):
         self.assert_model_exists("meeting/22", {"topic_ids": [1]})
         self.assert_model_not_exists("import_preview/2")
 
+    def test_import_preview_store(self) -> None:
+        rows = [
+            {"state": ImportState.NEW, "messages": [], "data": {"title": str(i)}}
+            for i in range(5)
+        ]
+        self.set_models(
+            {"import_preview/2": {"result": Jsonb({"rows": rows, "meeting_id": 22})}}
+        )
+        store = ImportPreviewStore(self.datastore, 2)
+        assert store.get_info() == {
+            "name": "topic",
+            "state": ImportState.DONE,
+            "meeting_id": 22,
+            "rows_count": 5,
+        }
+        assert store.get_rows(1, 2) == rows[1:3]
+        assert list(store.iter_rows(batch_size=2)) == [rows[:2], rows[2:4], rows[4:]]
+        with self.assertRaises(ModelDoesNotExist):
+            ImportPreviewStore(self.datastore, 3).get_info()
+
+    def test_import_preview_store_pages(self) -> None:
+        rows = [
+            {"state": ImportState.NEW, "messages": [], "data": {"title": str(i)}}
+            for i in range(5)
+        ]
+        with patch.object(ImportPreviewStore, "ROWS_PER_PAGE", 2):
+            store_id = ImportPreviewStore.create(
+                self.datastore, 1, "topic", ImportState.DONE, rows, 22
+            )
+        self.connection.commit()
+        self.assert_model_exists(
+            f"import_preview/{store_id + 2}",
+            {"result": {"rows": rows[4:], "preview_id": store_id}},
+        )
+        store = ImportPreviewStore(self.datastore, store_id)
+        assert store.get_info() == {
+            "name": "topic",
+            "state": ImportState.DONE,
+            "meeting_id": 22,
+            "rows_count": 5,
+        }
+        assert store.get_rows(1, 3) == rows[1:4]
+        assert store.get_rows(4, 10) == rows[4:]
+        assert list(store.iter_rows()) == [rows[:2], rows[2:4], rows[4:]]
+        with self.assertRaises(ModelDoesNotExist):
+            ImportPreviewStore(self.datastore, store_id + 1).get_info()
+
+        updated_row: ImportRow = {
+            "state": ImportState.ERROR,
+            "messages": ["x"],
+            "data": {},
+        }
+        store.update_rows({3: updated_row}, 1)
+        self.connection.commit()
+        assert store.get_rows(2, 3) == [rows[2], updated_row, rows[4]]
+        with self.assertRaises(ActionException):
+            store.update_rows({5: updated_row}, 1)
+
+        store.delete(1)
+        self.connection.commit()
+        for id_ in range(store_id, store_id + 3):
+            self.assert_model_not_exists(f"import_preview/{id_}")
+
+    def test_import_pages(self) -> None:
+        rows = [
+            {
+                "state": ImportState.NEW,
+                "messages": [],
+                "data": {
+                    "title": {"value": str(i), "info": ImportState.NEW},
+                    "meeting_id": 22,
+                },
+            }
+            for i in range(3)
+        ]
+        with patch.object(ImportPreviewStore, "ROWS_PER_PAGE", 2):
+            store_id = ImportPreviewStore.create(
+                self.datastore, 1, "topic", ImportState.DONE, rows, 22
+            )
+        self.connection.commit()
+        response = self.request("topic.import", {"id": store_id, "import": True})
+        self.assert_status_code(response, 200)
+        assert response.json["results"][0][0]["rows"] == rows
+        for id_ in range(1, 4):
+            self.assert_model_exists(f"topic/{id_}", {"title": str(id_ - 1)})
+        self.assert_model_not_exists(f"import_preview/{store_id}")
+        self.assert_model_not_exists(f"import_preview/{store_id + 1}")
+
     def test_import_abort_with_import_false(self) -> None:
         response = self.request("topic.import", {"id": 2, "import": False})
         self.assert_status_code(response, 200)
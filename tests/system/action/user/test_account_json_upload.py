@@ -665,6 +665,51 @@ class AccountJsonUpload(BaseActionTestCase):
             "username": {"value": "test", "info": ImportState.DONE, "id": 3},
         }
 
+    def test_json_upload_mixed_existing_names_and_emails(self) -> None:
+        self.set_models(
+            {
+                "user/3": {
+                    "username": "test3",
+                    "first_name": "Max",
+                    "last_name": "Mustermann",
+                    "email": "max@mustermann.org",
+                },
+                "user/4": {
+                    "username": "test4",
+                    "first_name": "Erika",
+                    "last_name": "Musterfrau",
+                    "email": "erika@musterfrau.org",
+                },
+            },
+        )
+        response = self.request(
+            "account.json_upload",
+            {
+                "data": [
+                    {
+                        "first_name": "Max",
+                        "last_name": "Musterfrau",
+                        "email": "erika@musterfrau.org",
+                    },
+                    {
+                        "first_name": "Erika",
+                        "last_name": "Musterfrau",
+                        "email": "erika@musterfrau.org",
+                    },
+                ]
+            },
+        )
+        self.assert_status_code(response, 200)
+        result = response.json["results"][0][0]
+        assert result["rows"][0]["state"] == ImportState.NEW
+        assert "id" not in result["rows"][0]["data"]
+        assert result["rows"][0]["data"]["username"] == {
+            "value": "MaxMusterfrau",
+            "info": ImportState.GENERATED,
+        }
+        assert result["rows"][1]["state"] == ImportState.DONE
+        assert result["rows"][1]["data"]["id"] == 4
+
     def test_json_upload_invalid_vote_weight(self) -> None:
         response = self.request(
             "account.json_upload",
@@ -123,7 +123,7 @@ For more information, see
                 deactivate_notify_triggers(curs)
 
     def tearDown(self) -> None:
-        migration_module.Sql_helper.offset = 0
+        migration_module.Sql_helper.last_fqid = ""
         # Reset tables to ensure that init sql doesn't write garbage.
         with get_new_os_conn() as conn:
             with conn.cursor() as curs:
@@ -529,15 +529,12 @@ For more information, see
             "output": "migration finished\n",
         }
         while not (
-            # fmt: off
             (response := self.request("progress").json) == expected_response
-            or response == expected_response | {
-                "output": "100 of 161 models written to tables.\n161 of 161 models written to tables.\nmigration finished\n",
-            }
-            or response == expected_response | {
-                "output": "161 of 161 models written to tables.\nmigration finished\n",
-            }
-            # fmt: on
+            or (
+                response | {"output": ""} == expected_response | {"output": ""}
+                and response["output"].startswith("161 of 161 models written to tables")
+                and response["output"].endswith("migration finished\n")
+            )
         ):
             sleep(0.1)
             if datetime.now() - start > max_time:
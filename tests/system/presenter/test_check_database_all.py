@@ -277,6 +277,9 @@ class TestCheckDatabaseAll(BasePresenterTestCase):
         assert status_code == 200
         assert data["ok"] is True
         assert "errors" not in data
+        status_code, data = self.request("check_database_all", {"streaming": True})
+        assert status_code == 200
+        assert data == {"ok": True}
 
     def get_new_user(self, username: str, datapart: dict[str, Any]) -> dict[str, Any]:
         return {
@@ -882,6 +885,9 @@ class TestCheckDatabaseAll(BasePresenterTestCase):
             print(data)
         assert data["ok"] is True
         assert "errors" not in data
+        status_code, data = self.request("check_database_all", {"streaming": True})
+        assert status_code == 200
+        assert data == {"ok": True}
 
     def test_no_permissions(self) -> None:
         self.create_meeting()
@@ -1,4 +1,5 @@
 from openslides_backend.permissions.management_levels import OrganizationManagementLevel
+from tests.system.util import CountDatastoreCalls
 
 from .base import BasePresenterTestCase
 
@@ -121,6 +122,24 @@ class TestGetUSerScope(BasePresenterTestCase):
             },
         )
 
+    def test_number_of_queries_independent_of_users(self) -> None:
+        self.create_meeting()
+        self.create_meeting(4)
+        self.create_user("meeting_user", group_ids=[1])
+        self.create_user("two_meetings", group_ids=[1, 4])
+        self.create_user("cml", committee_management_ids=[63])
+        self.create_user("home_committee", home_committee_id=60)
+        with CountDatastoreCalls() as counter:
+            status_code, _ = self.request("get_user_scope", {"user_ids": [2]})
+        self.assertEqual(status_code, 200)
+        with CountDatastoreCalls() as counter_many:
+            status_code, data = self.request(
+                "get_user_scope", {"user_ids": [2, 3, 4, 5]}
+            )
+        self.assertEqual(status_code, 200)
+        assert sorted(data["3"]["committee_ids"]) == [60, 63]
+        assert counter_many.calls == counter.calls
+
     def test_without_user_None(self) -> None:
         status_code, data = self.request("get_user_scope", {"user_ids": [None]})
         self.assertEqual(status_code, 400)
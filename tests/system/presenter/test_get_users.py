@@ -1,4 +1,6 @@
 from openslides_backend.permissions.management_levels import OrganizationManagementLevel
+from tests.system.base import ADMIN_USERNAME
+from tests.system.util import Profiler, performance
 
 from .base import BasePresenterTestCase
 
@@ -145,3 +147,84 @@ class TestGetUsers(BasePresenterTestCase):
         self.client.auth_data.pop("access_token", None)
         status_code, data = self.request("get_users", {})
         self.assertEqual(status_code, 403)
+
+    def test_filter_special_characters(self) -> None:
+        self.set_models(
+            {
+                "user/2": {**self.user2, "username": "flo_rian"},
+                "user/3": {**self.user3, "username": "te%st"},
+                "user/4": self.user4,
+            }
+        )
+        for keyword, expected in (("_", [2]), ("%", [3]), ("john", [4])):
+            status_code, data = self.request("get_users", {"filter": keyword})
+            self.assertEqual(status_code, 200)
+            self.assertEqual(data, {"users": expected})
+
+    def test_filter_case_sensitive(self) -> None:
+        self.set_models({"user/2": self.user2})
+        status_code, data = self.request("get_users", {"filter": "Flo"})
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data, {"users": []})
+
+    def test_negative_start_index(self) -> None:
+        self.set_models(
+            {
+                "user/2": self.user2,
+                "user/3": self.user3,
+                "user/4": self.user4,
+            }
+        )
+        status_code, data = self.request(
+            "get_users",
+            {"start_index": -2, "entries": 1, "sort_criteria": ["username"]},
+        )
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data, {"users": [4]})
+
+    @performance
+    def test_get_users_performance(self) -> None:
+        quantity = 100000
+        self.connection.execute(
+            """
+            INSERT INTO user_t (id, username, first_name, last_name, organization_id)
+            SELECT i, 'user' || i, 'first' || (i % 1000), 'last' || (i % 5000), 1
+            FROM generate_series(2, %s) AS i
+            """,
+            (quantity + 1,),
+        )
+        self.connection.commit()
+        self.adjust_id_sequence("user")
+        users = [(1, "", "", ADMIN_USERNAME)] + [
+            (i, f"last{i % 5000}", f"first{i % 1000}", f"user{i}")
+            for i in range(2, quantity + 2)
+        ]
+        users.sort(key=lambda user: user[1:])
+        with Profiler("test_presenter_performance_get_users.prof"):
+            status_code, data = self.request(
+                "get_users", {"start_index": 50000, "entries": 100}
+            )
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data, {"users": [user[0] for user in users[50000:50100]]})
+        status_code, data = self.request(
+            "get_users", {"filter": "user4242", "sort_criteria": ["username"]}
+        )
+        self.assertEqual(status_code, 200)
+        self.assertEqual(
+            data,
+            {
+                "users": [
+                    4242,
+                    42420,
+                    42421,
+                    42422,
+                    42423,
+                    42424,
+                    42425,
+                    42426,
+                    42427,
+                    42428,
+                    42429,
+                ]
+            },
+        )
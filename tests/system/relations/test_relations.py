@@ -1,3 +1,13 @@
+from unittest.mock import MagicMock, patch
+
+from openslides_backend.action.relations.single_relation_handler import (
+    SingleRelationHandler,
+)
+from openslides_backend.services.database.extended_database import ExtendedDatabase
+from openslides_backend.services.postgresql.db_connection_handling import (
+    get_new_os_conn,
+)
+
 from .setup import BaseRelationsTestCase, FakeModelA, SingleRelationHandlerWithContext
 
 
@@ -201,3 +211,59 @@ class RelationHandlerTest(BaseRelationsTestCase):
             }
         }
         assert result == expected
+
+    def test_perform_batch(self) -> None:
+        self.set_models(
+            {
+                "fake_model_a/1": {},
+                "fake_model_a/2": {},
+                "fake_model_b/3": {"fake_model_a_oo": 2},
+                "fake_model_b/4": {},
+                "fake_model_b/5": {},
+            }
+        )
+        instance = {"id": 1, "fake_model_b_oo": 3, "fake_model_b_mm": [4, 5]}
+        with get_new_os_conn() as conn:
+            datastore = ExtendedDatabase(conn, MagicMock(), MagicMock())
+            handlers = [
+                SingleRelationHandler(
+                    datastore, FakeModelA.fake_model_b_oo, "fake_model_b_oo", instance
+                ),
+                SingleRelationHandler(
+                    datastore, FakeModelA.fake_model_b_mm, "fake_model_b_mm", instance
+                ),
+            ]
+            with patch.object(
+                datastore.database_reader,
+                "get_many",
+                wraps=datastore.database_reader.get_many,
+            ) as get_many:
+                results = SingleRelationHandler.perform_batch(datastore, handlers)
+        # current and related models, then the same for the chained fake_model_a/2
+        assert get_many.call_count == 4
+        assert results == [
+            {
+                "fake_model_b/3/fake_model_a_oo": {
+                    "type": "add",
+                    "value": 1,
+                    "modified_element": 1,
+                },
+                "fake_model_a/2/fake_model_b_oo": {
+                    "type": "remove",
+                    "value": None,
+                    "modified_element": 3,
+                },
+            },
+            {
+                "fake_model_b/4/fake_model_a_mm": {
+                    "type": "add",
+                    "value": [1],
+                    "modified_element": 1,
+                },
+                "fake_model_b/5/fake_model_a_mm": {
+                    "type": "add",
+                    "value": [1],
+                    "modified_element": 1,
+                },
+            },
+        ]
@@ -13,6 +13,7 @@ from requests.models import Response as RequestsResponse
 from openslides_backend.http.application import OpenSlidesBackendWSGIApplication
 from openslides_backend.http.views import ActionView, PresenterView
 from openslides_backend.http.views.base_view import ROUTE_OPTIONS_ATTR, RouteFunction
+from openslides_backend.services.database.database_reader import DatabaseReader
 from openslides_backend.services.database.extended_database import ExtendedDatabase
 from openslides_backend.services.media.interface import MediaService
 from openslides_backend.services.vote.adapter import VoteAdapter
@@ -187,3 +188,27 @@ class CountDatastoreCalls:
     @property
     def calls(self) -> int:
         return sum(mock.call_count for mock in self.mocks)
+
+
+class CountDatabaseQueries:
+    """
+    Helper class to track the amount of queries sent to the database by the reader. Use as context
+    manager and access the result via the `queries` property.
+    """
+
+    def __enter__(self) -> Self:
+        self.patcher = patch.object(
+            DatabaseReader,
+            "execute_query",
+            autospec=True,
+            side_effect=DatabaseReader.execute_query,
+        )
+        self.mock = self.patcher.start()
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        self.patcher.stop()
+
+    @property
+    def queries(self) -> int:
+        return self.mock.call_count
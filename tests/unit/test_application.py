@@ -0,0 +1,65 @@
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from werkzeug.test import Client
+
+from openslides_backend.http.application import OpenSlidesBackendWSGIApplication
+from openslides_backend.shared.exceptions import PresenterException
+from openslides_backend.shared.json_stream import CHUNK_SIZE, StreamedObject
+
+
+class FakeView:
+    results: list[Any] = []
+
+    def __init__(self, *args: Any) -> None:
+        pass
+
+    def dispatch(self, request: Any) -> tuple[list[Any], None]:
+        return self.results, None
+
+
+def get_client(results: list[Any]) -> Client:
+    FakeView.results = results
+    application = OpenSlidesBackendWSGIApplication(
+        MagicMock(), MagicMock(), FakeView, MagicMock()  # type: ignore
+    )
+    return Client(application)
+
+
+def iter_models(error_after: int) -> Iterator[tuple[str, Any]]:
+    for id_ in range(error_after):
+        yield str(id_), {"text": "x" * 1000}
+    raise PresenterException("Export failed.")
+
+
+def test_streamed_error_in_first_chunk() -> None:
+    on_close = MagicMock()
+    client = get_client([StreamedObject(iter_models(1), on_close)])
+    response = client.post("/system/presenter/handle_request")
+    assert response.status_code == 400
+    assert "Export failed." in response.get_data(as_text=True)
+    on_close.assert_called_once()
+
+
+def test_streamed_error_after_first_chunk() -> None:
+    on_close = MagicMock()
+    client = get_client([StreamedObject(iter_models(CHUNK_SIZE // 200), on_close)])
+    response = client.post("/system/presenter/handle_request")
+    assert response.status_code == 200
+    # the body is not ended properly, the server aborts the connection
+    with pytest.raises(PresenterException):
+        response.get_data()
+    response.close()
+    on_close.assert_called_once()
+
+
+def test_streamed_response() -> None:
+    on_close = MagicMock()
+    models = [(str(id_), {"text": "x" * 1000}) for id_ in range(CHUNK_SIZE // 500)]
+    client = get_client([StreamedObject(iter(models), on_close)])
+    response = client.post("/system/presenter/handle_request")
+    assert response.status_code == 200
+    assert response.json == [dict(models)]
+    on_close.assert_called_once()
@@ -0,0 +1,107 @@
+from typing import Any
+from unittest import TestCase
+
+import openslides_backend.models.models  # noqa
+from openslides_backend.services.database.changed_models_index import ChangedModelsIndex
+from openslides_backend.shared.filters import And, Filter, FilterOperator
+from openslides_backend.shared.typing import DeletedModel, PartialModel
+
+
+def fits_filter(model: PartialModel, filter_: Filter) -> bool:
+    if isinstance(filter_, And):
+        return all(fits_filter(model, part) for part in filter_.and_filter)
+    assert isinstance(filter_, FilterOperator) and filter_.operator == "="
+    return model.get(filter_.field) == filter_.value
+
+
+class ChangedModelsIndexTest(TestCase):
+    def setUp(self) -> None:
+        self.index = ChangedModelsIndex(fits_filter)
+        self.changed_models: dict[int, PartialModel] = {}
+
+    def apply(self, id_: int, instance: dict[str, Any]) -> None:
+        snapshot = self.index.get_snapshot("speaker", self.changed_models.get(id_))
+        if isinstance(instance, DeletedModel):
+            self.changed_models[id_] = instance
+        else:
+            self.changed_models.setdefault(id_, {}).update(instance)
+        self.index.update("speaker", id_, self.changed_models[id_], snapshot)
+
+    def test_field_index(self) -> None:
+        self.apply(1, {"list_of_speakers_id": 1, "meta_new": True})
+        self.apply(2, {"list_of_speakers_id": 2, "meta_new": True})
+        self.apply(3, {"weight": 3})
+        self.apply(4, {"meta_new": True})
+        filter_ = And(
+            FilterOperator("list_of_speakers_id", "=", 1),
+            FilterOperator("weight", ">", 0),
+        )
+        field_index, value = self.index.get_field_index(
+            "speaker", filter_, self.changed_models
+        )
+        assert field_index and value == 1
+        assert field_index.get_candidates(1) == {1, 3}
+        assert field_index.get_candidates(None) == {3, 4}
+        assert field_index.excludes(2, 1)
+        assert not field_index.excludes(3, 1)
+        assert not field_index.excludes(5, 1)
+
+        self.apply(2, {"list_of_speakers_id": 1})
+        self.apply(3, {"list_of_speakers_id": 2})
+        self.apply(1, DeletedModel())
+        assert field_index.get_candidates(1) == {2}
+        assert field_index.get_candidates(2) == {3}
+        assert not field_index.excludes(1, 1)
+
+    def test_no_field_index(self) -> None:
+        for filter_ in (
+            FilterOperator("weight", "=", 1),
+            FilterOperator("list_of_speakers_id", ">", 1),
+            FilterOperator("list_of_speakers_id", "in", [1, 2]),
+        ):
+            assert self.index.get_field_index(
+                "speaker", filter_, self.changed_models
+            ) == (None, None)
+
+    def test_running_maximum(self) -> None:
+        filter_ = FilterOperator("list_of_speakers_id", "=", 1)
+        key = ("max", filter_, "weight", True)
+        self.apply(1, {"list_of_speakers_id": 1, "weight": 1})
+        self.index.set_aggregate("speaker", key, "max", filter_, "weight", 1)
+        for id_ in range(2, 5):
+            instance = {"list_of_speakers_id": 1, "weight": id_, "meta_new": True}
+            self.apply(id_, instance)
+            # applying the same values again does not change anything
+            self.apply(id_, instance)
+            entry = self.index.get_aggregate("speaker", key)
+            assert entry and entry.value == id_
+        self.apply(5, {"list_of_speakers_id": 2, "weight": 10, "meta_new": True})
+        self.apply(1, {"other_field": 10})
+        entry = self.index.get_aggregate("speaker", key)
+        assert entry and entry.value == 4
+
+    def test_running_count(self) -> None:
+        filter_ = FilterOperator("list_of_speakers_id", "=", 1)
+        key = ("count", filter_, "*", True)
+        self.index.set_aggregate("speaker", key, "count", filter_, "*", 0)
+        self.apply(1, {"list_of_speakers_id": 1, "meta_new": True})
+        self.apply(2, {"list_of_speakers_id": 2, "meta_new": True})
+        entry = self.index.get_aggregate("speaker", key)
+        assert entry and entry.value == 1
+
+    def test_aggregate_dropped(self) -> None:
+        filter_ = FilterOperator("list_of_speakers_id", "=", 1)
+        key = ("max", filter_, "weight", True)
+        self.apply(1, {"list_of_speakers_id": 1, "weight": 3, "meta_new": True})
+        for instance in (
+            {"weight": 1},
+            {"list_of_speakers_id": 2},
+            DeletedModel(),
+        ):
+            self.index.set_aggregate("speaker", key, "max", filter_, "weight", 3)
+            self.apply(1, instance)
+            assert self.index.get_aggregate("speaker", key) is None
+        # changes to existing models are not known to the aggregate
+        self.index.set_aggregate("speaker", key, "max", filter_, "weight", 3)
+        self.apply(2, {"weight": 1})
+        assert self.index.get_aggregate("speaker", key) is None
@@ -1,6 +1,7 @@
 from copy import deepcopy
 from datetime import datetime
 from decimal import Decimal
+from time import time
 from typing import Any, Literal
 from unittest import TestCase
 
@@ -28,6 +29,7 @@ from openslides_backend.models.fields import (
     TimestampField,
 )
 from openslides_backend.shared.util import ONE_ORGANIZATION_FQID
+from tests.system.util import performance
 
 BACKEND_MIGRATION_INDEX = MigrationHelper.get_backend_migration_index()
 
@@ -376,6 +378,18 @@ class TestCheckerCheckData(TestCase):
             expected_error="\torganization/1/default_language: Value error: Value 1337 is not a valid enum value",
         )
 
+    @performance
+    def test_many_reverse_relations_performance(self) -> None:
+        ids = list(range(1, 100001))
+        self.meeting_data["meeting"]["1"]["projector_message_ids"] = ids
+        self.meeting_data["projector_message"] = {
+            str(id_): {"id": id_, "meeting_id": 1, "message": "<p>message</p>"}
+            for id_ in ids
+        }
+        start = time()
+        self.check_data(self.meeting_data)
+        print(f"100000 projector messages: {time() - start:.3f} seconds")
+
     def test_correct_types(self) -> None:
         self.meeting_data.update(
             {
@@ -886,3 +900,25 @@ class TestCheckerCheckData(TestCase):
             data=self.meeting_data,
             expected_error="\tprojection/1/content_object_id error: The collection theme is not supported as a reverse relation in projection/content_object_id.",
         )
+
+
+class TestCheckerMissingReferences(TestCase):
+    def test_get_missing_references(self) -> None:
+        data: dict[str, Any] = {
+            "_migration_index": BACKEND_MIGRATION_INDEX,
+            "list_of_speakers": {
+                "1": {
+                    "id": 1,
+                    "meeting_id": 1,
+                    "content_object_id": "motion/2",
+                    "speaker_ids": [3, 4],
+                }
+            },
+            "speaker": {"3": {"id": 3, "list_of_speakers_id": 1, "meeting_id": 1}},
+        }
+        checker = Checker(
+            data=data, mode="all", referenced_data={"meeting": {"1": {"id": 1}}}
+        )
+        self.assertEqual(
+            checker.get_missing_references(), {"motion": {2}, "speaker": {4}}
+        )
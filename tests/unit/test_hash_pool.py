@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+from openslides_backend.services.auth import hash_pool
+
+
+def fake_hash(value: str) -> str:
+    return f"hash:{value}"
+
+
+def test_hash_many_serial() -> None:
+    with patch.object(hash_pool, "get_pool", return_value=None):
+        assert hash_pool.hash_many(["a", "b", "c", "d"], fake_hash) == [
+            "hash:a",
+            "hash:b",
+            "hash:c",
+            "hash:d",
+        ]
+
+
+def test_hash_many_small_batch() -> None:
+    get_pool = MagicMock()
+    with patch.object(hash_pool, "get_pool", get_pool):
+        assert hash_pool.hash_many(["a"], fake_hash) == ["hash:a"]
+    get_pool.assert_not_called()
+
+
+def test_hash_many_pool() -> None:
+    values = [str(i) for i in range(100)]
+    with ThreadPoolExecutor(2) as pool, patch.object(
+        hash_pool, "get_pool", return_value=pool
+    ), patch.object(hash_pool, "hash_in_worker", lambda value: f"pool:{value}"):
+        assert hash_pool.hash_many(values, fake_hash) == [
+            f"pool:{value}" for value in values
+        ]
+
+
+def test_hash_many_broken_pool() -> None:
+    pool = MagicMock()
+    pool.map.side_effect = BrokenProcessPool()
+    with patch.object(hash_pool, "get_pool", return_value=pool), patch.object(
+        hash_pool, "_pool", pool
+    ):
+        assert hash_pool.hash_many(["a", "b", "c", "d"], fake_hash) == [
+            "hash:a",
+            "hash:b",
+            "hash:c",
+            "hash:d",
+        ]
+        assert hash_pool._pool is None
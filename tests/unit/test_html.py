@@ -0,0 +1,71 @@
+from time import time
+
+import pytest
+from bs4 import BeautifulSoup
+
+from openslides_backend.shared.html import LRUMemo, get_text_from_html, text_memo
+from openslides_backend.shared.util import (
+    ALLOWED_HTML_TAGS_PERMISSIVE,
+    ALLOWED_HTML_TAGS_STRICT,
+    html_sanitizer,
+    validate_html,
+)
+from tests.database.util import performance
+
+HTML = [
+    "<p>a &amp; b&nbsp;c &foo; &lt;x&gt; d & e &#39; &#x27; &nbsp</p>",
+    '<script>alert(1)</script><p style="color:red;position:absolute">x</p>',
+    '<!-- comment --><iframe src="x"></iframe><video>y</video>',
+    "\t<table><tr><td>1</td></tr></table><ul><li>a<li>b</ul>",
+    "<p>unclosed <b>bold <i>x</p>",
+    '<a href="javascript:x" onclick="y">l</a>&euro;&copy2',
+    "<![CDATA[x]]><textarea>&lt;</textarea>\r\nline\rx",
+]
+
+
+@pytest.mark.parametrize("html", HTML)
+def test_validate_html_text(html: str) -> None:
+    for allowed_tags in (ALLOWED_HTML_TAGS_STRICT, ALLOWED_HTML_TAGS_PERMISSIVE):
+        cleaned_html = validate_html(html, allowed_tags)
+        assert validate_html(html, allowed_tags) == cleaned_html
+        assert (
+            get_text_from_html(cleaned_html)
+            == BeautifulSoup(cleaned_html, features="html.parser").get_text()
+        )
+
+
+def test_validate_html_profiles() -> None:
+    html = "<p>a</p><video></video>"
+    assert validate_html(html) == "<p>a</p>&lt;video&gt;&lt;/video&gt;"
+    assert validate_html(html, ALLOWED_HTML_TAGS_PERMISSIVE) == html
+    assert validate_html("") == ""
+
+
+def test_get_text_from_html_not_sanitised() -> None:
+    text_memo.clear()
+    assert get_text_from_html("<p>a &amp; <b>b</b></p>") == "a & b"
+    assert get_text_from_html("") == ""
+
+
+def test_lru_memo() -> None:
+    memo = LRUMemo(2)
+    memo.set(1, "a")
+    memo.set(2, "b")
+    assert memo.get(1) == "a"
+    memo.set(3, "c")
+    assert memo.get(2) is None
+    assert memo.get(1) == "a"
+    assert memo.get(3) == "c"
+
+
+@performance
+def test_validate_html_performance() -> None:
+    paragraphs = {
+        str(i): f"<p>Paragraph {i % 50} with <strong>some</strong> text.</p>" * 20
+        for i in range(5000)
+    }
+    html_sanitizer.memo.clear()
+    start = time()
+    for html in paragraphs.values():
+        get_text_from_html(validate_html(html))
+    print(f"5000 amendment paragraphs: {time() - start:.3f} seconds")
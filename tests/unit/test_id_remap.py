@@ -0,0 +1,115 @@
+from time import time
+from unittest import TestCase
+
+import pytest
+
+import openslides_backend.models.models  # noqa
+from openslides_backend.action.util.id_remap import (
+    RemapKind,
+    compile_remap_plan,
+    remap_ids,
+)
+from openslides_backend.models.checker import MEETING_COLLECTIONS
+from openslides_backend.shared.exceptions import ActionException
+from tests.system.util import performance
+
+ALLOWED = frozenset(MEETING_COLLECTIONS)
+
+
+class IdRemapTest(TestCase):
+    def test_compile_plan(self) -> None:
+        plan = compile_remap_plan("motion", ALLOWED)
+        assert plan["id"] == (RemapKind.ID, None)
+        assert plan["title"] == (RemapKind.PLAIN, None)
+        assert plan["state_id"] == (RemapKind.RELATION, "motion_state")
+        assert plan["tag_ids"] == (RemapKind.RELATION_LIST, "tag")
+        assert plan["agenda_item_id"] == (RemapKind.RELATION, "agenda_item")
+        assert plan["state_extension"] == (RemapKind.EXTENSION, None)
+        assert compile_remap_plan("meeting", ALLOWED)["user_ids"] == (
+            RemapKind.CLEARED,
+            None,
+        )
+
+    def test_compile_plan_not_allowed_collection(self) -> None:
+        plan = compile_remap_plan("meeting", ALLOWED)
+        assert plan["committee_id"] == (RemapKind.PLAIN, None)
+        assert plan["is_active_in_organization_id"] == (RemapKind.PLAIN, None)
+
+    def test_remap(self) -> None:
+        entries = [
+            {
+                "id": 1,
+                "state_id": 2,
+                "tag_ids": [3, 4],
+                "origin_id": None,
+                "state_extension": "[motion/1] and [motion/2]",
+            },
+            {"id": 2, "title": "text", "tag_ids": None},
+        ]
+        remap_ids(
+            "motion",
+            entries,
+            {"motion": {1: 11, 2: 12}, "motion_state": {2: 22}, "tag": {3: 33, 4: 44}},
+            ALLOWED,
+        )
+        assert entries == [
+            {
+                "id": 11,
+                "state_id": 22,
+                "tag_ids": [33, 44],
+                "origin_id": None,
+                "state_extension": "[motion/11] and [motion/12]",
+            },
+            {"id": 12, "title": "text", "tag_ids": []},
+        ]
+
+    def test_remap_generic(self) -> None:
+        entries = [
+            {"id": 1, "content_object_id": "motion/1", "projection_ids": [2]},
+        ]
+        remap_ids(
+            "list_of_speakers",
+            entries,
+            {"list_of_speakers": {1: 5}, "motion": {1: 6}, "projection": {2: 7}},
+            ALLOWED,
+        )
+        assert entries == [
+            {"id": 5, "content_object_id": "motion/6", "projection_ids": [7]}
+        ]
+
+    def test_remap_generic_not_allowed_collection(self) -> None:
+        entries = [{"id": 1, "owner_id": "organization/1"}]
+        remap_ids("mediafile", entries, {"mediafile": {1: 2}}, ALLOWED)
+        assert entries == [{"id": 2, "owner_id": "organization/1"}]
+
+    def test_remap_unknown_field(self) -> None:
+        with pytest.raises(ActionException) as e:
+            remap_ids("tag", [{"id": 1, "unknown": 2}], {"tag": {1: 2}}, ALLOWED)
+        assert e.value.message == "tag/unknown is not allowed."
+
+
+@performance
+def test_remap_performance() -> None:
+    count = 200000
+    entries = [
+        {
+            "id": id_,
+            "meeting_id": 1,
+            "title": "motion",
+            "state_id": 1,
+            "tag_ids": [1, 2],
+            "list_of_speakers_id": id_,
+            "state_extension": f"[motion/{id_}]",
+        }
+        for id_ in range(1, count + 1)
+    ]
+    replace_map = {
+        "motion": {id_: id_ + count for id_ in range(1, count + 1)},
+        "list_of_speakers": {id_: id_ + count for id_ in range(1, count + 1)},
+        "meeting": {1: 2},
+        "motion_state": {1: 2},
+        "tag": {1: 3, 2: 4},
+    }
+    start = time()
+    remap_ids("motion", entries, replace_map, ALLOWED)
+    print(f"{count} motions: {time() - start:.3f} seconds")
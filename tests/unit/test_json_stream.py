@@ -0,0 +1,99 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from io import StringIO
+from typing import Any
+
+import simplejson
+
+from openslides_backend.shared.json_stream import (
+    StreamedObject,
+    get_json_response_body,
+    iter_json_chunks,
+    write_json_collections,
+)
+
+DATA: dict[str, dict[int, dict[str, Any]]] = {
+    "meeting": {},
+    "motion": {
+        1: {"id": 1, "title": "a\nb", "weight": Decimal("1.500000"), "tags": [1, 2]},
+        2: {"id": 2, "created": datetime(2024, 1, 2, 3, 4, 5), "text": None},
+    },
+    "user": {3: {"id": 3, "username": "ü", "meta": {"b": 1, "a": []}}},
+}
+
+
+def test_iter_json_chunks() -> None:
+    data = [{"users": list(range(10000)), "user": {3: DATA["user"][3]}}, {}, []]
+    chunks = list(iter_json_chunks(data, chunk_size=1000))
+    assert len(chunks) > 10
+    assert all(len(chunk) < 1100 for chunk in chunks)
+    assert b"".join(chunks) == simplejson.dumps(data).encode()
+
+
+def test_iter_json_chunks_keys() -> None:
+    data = {1: {None: 1, True: 2, 1.5: 3}, "x": "y"}
+    chunks = list(iter_json_chunks(data))
+    assert b"".join(chunks) == simplejson.dumps(data).encode()
+
+
+def test_get_json_response_body() -> None:
+    assert get_json_response_body({"success": True}) == b'{"success": true}'
+    data = {"users": list(range(100000))}
+    body = get_json_response_body(data)
+    assert not isinstance(body, bytes)
+    assert b"".join(body) == simplejson.dumps(data).encode()
+
+
+def test_streamed_object() -> None:
+    closed: list[bool] = []
+    export = {"meeting": {}, "_migration_index": 1, "user": DATA["user"]}
+    data = [
+        StreamedObject(
+            (
+                (
+                    collection,
+                    (
+                        StreamedObject(iter(models.items()))
+                        if isinstance(models, dict)
+                        else models
+                    ),
+                )
+                for collection, models in export.items()
+            ),
+            on_close=lambda: closed.append(True),
+        )
+    ]
+    chunks = list(iter_json_chunks(data, chunk_size=10))
+    assert closed == [True]
+    assert b"".join(chunks) == simplejson.dumps([export]).encode()
+
+
+def test_streamed_object_closed_before_iteration() -> None:
+    closed: list[bool] = []
+    streamed = StreamedObject([("a", 1)], on_close=lambda: closed.append(True))
+    streamed.close()
+    streamed.close()
+    assert closed == [True]
+    assert b"".join(iter_json_chunks(StreamedObject([]))) == b"{}"
+
+
+def test_write_json_collections() -> None:
+    file = StringIO()
+    write_json_collections(
+        file,
+        ((collection, models.items()) for collection, models in DATA.items()),
+        sort_keys=True,
+        default=str,
+        use_decimal=False,
+    )
+    everything = {collection: models for collection, models in DATA.items() if models}
+    assert file.getvalue() == json.dumps(
+        everything, indent=4, sort_keys=True, default=str
+    )
+
+
+def test_write_json_collections_empty() -> None:
+    file = StringIO()
+    write_json_collections(file, [("meeting", [])])
+    assert file.getvalue() == "{}"
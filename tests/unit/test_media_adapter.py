@@ -0,0 +1,181 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openslides_backend.services.media.adapter import MediaServiceAdapter
+from openslides_backend.services.shared.http_client import HTTPClient
+from openslides_backend.shared.exceptions import MediaServiceException
+
+
+class StubMediaService(ThreadingHTTPServer):
+    def __init__(self, bulk_routes: bool) -> None:
+        super().__init__(("127.0.0.1", 0), StubMediaHandler)
+        self.bulk_routes = bulk_routes
+        # bulk requests with more mediafiles are rejected as too large
+        self.max_bulk_size: int | None = None
+        self.requests: list[tuple[str, Any]] = []
+        self.connections = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/internal/media"
+
+
+class StubMediaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubMediaService
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        route = self.path.split("/")[-2]
+        if route.endswith("_mediafiles") and not self.server.bulk_routes:
+            status = 404
+        elif (
+            route.endswith("_mediafiles")
+            and self.server.max_bulk_size is not None
+            and len(payload["mediafiles"]) > self.server.max_bulk_size
+        ):
+            status = 413
+        else:
+            self.server.requests.append((route, payload))
+            status = 500 if payload.get("source_id") == 0 else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def start_stub(bulk_routes: bool) -> Iterator[StubMediaService]:
+    server = StubMediaService(bulk_routes)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub() -> Iterator[StubMediaService]:
+    yield from start_stub(bulk_routes=True)
+
+
+@pytest.fixture
+def stub_without_bulk() -> Iterator[StubMediaService]:
+    yield from start_stub(bulk_routes=False)
+
+
+def get_adapter(server: StubMediaService) -> MediaServiceAdapter:
+    return MediaServiceAdapter(
+        server.url, MagicMock(), HTTPClient(pool_size=2, timeout=5, max_retries=0)
+    )
+
+
+def test_connection_is_reused(stub: StubMediaService) -> None:
+    adapter = get_adapter(stub)
+    for i in range(1, 6):
+        adapter.duplicate_mediafile(i, i + 10)
+    assert len(stub.requests) == 5
+    assert stub.connections == 1
+
+
+def test_duplicate_mediafiles_bulk(stub: StubMediaService) -> None:
+    adapter = get_adapter(stub)
+    adapter.duplicate_mediafiles([(1, 11), (2, 12)])
+    assert stub.requests == [
+        (
+            "duplicate_mediafiles",
+            {
+                "mediafiles": [
+                    {"source_id": 1, "target_id": 11},
+                    {"source_id": 2, "target_id": 12},
+                ]
+            },
+        )
+    ]
+
+
+def test_upload_mediafiles_bulk(stub: StubMediaService) -> None:
+    adapter = get_adapter(stub)
+    adapter.upload_mediafiles([("YQ==", 1, "text/plain")])
+    assert stub.requests == [
+        (
+            "upload_mediafiles",
+            {"mediafiles": [{"file": "YQ==", "id": 1, "mimetype": "text/plain"}]},
+        )
+    ]
+
+
+def test_upload_mediafiles_bulk_limited_by_bytes(stub: StubMediaService) -> None:
+    adapter = get_adapter(stub)
+    mediafiles = [("YWFh", 1, "text/plain"), ("YQ==", 2, "text/plain")]
+    mediafiles.append(("YWJjZGVm", 3, "text/plain"))
+    with patch("openslides_backend.services.media.adapter.MEDIA_BATCH_MAX_BYTES", 8):
+        adapter.upload_mediafiles(mediafiles)
+    assert [
+        [mediafile["id"] for mediafile in payload["mediafiles"]]
+        for _, payload in stub.requests
+    ] == [[1, 2], [3]]
+
+
+def test_upload_mediafiles_too_large(stub: StubMediaService) -> None:
+    stub.max_bulk_size = 1
+    adapter = get_adapter(stub)
+    adapter.upload_mediafiles([("YQ==", 1, "text/plain"), ("Yg==", 2, "text/plain")])
+    adapter.upload_mediafiles([("Yw==", 3, "text/plain")])
+    assert adapter.supports_bulk is True
+    assert stub.requests == [
+        ("upload_mediafile", {"file": "YQ==", "id": 1, "mimetype": "text/plain"}),
+        ("upload_mediafile", {"file": "Yg==", "id": 2, "mimetype": "text/plain"}),
+        (
+            "upload_mediafiles",
+            {"mediafiles": [{"file": "Yw==", "id": 3, "mimetype": "text/plain"}]},
+        ),
+    ]
+
+
+def test_default_timeouts() -> None:
+    client = HTTPClient()
+    assert client.timeout == (10.0, None)
+
+
+def test_duplicate_mediafiles_fallback(stub_without_bulk: StubMediaService) -> None:
+    adapter = get_adapter(stub_without_bulk)
+    adapter.duplicate_mediafiles([(1, 11), (2, 12)])
+    adapter.duplicate_mediafiles([(3, 13)])
+    assert adapter.supports_bulk is False
+    assert stub_without_bulk.requests == [
+        ("duplicate_mediafile", {"source_id": 1, "target_id": 11}),
+        ("duplicate_mediafile", {"source_id": 2, "target_id": 12}),
+        ("duplicate_mediafile", {"source_id": 3, "target_id": 13}),
+    ]
+
+
+def test_duplicate_mediafile_error(stub: StubMediaService) -> None:
+    adapter = get_adapter(stub)
+    with pytest.raises(MediaServiceException) as e:
+        adapter.duplicate_mediafile(0, 1)
+    assert "Mediaservice Error" in e.value.message
+
+
+def test_connection_error() -> None:
+    adapter = MediaServiceAdapter(
+        "http://127.0.0.1:1/internal/media",
+        MagicMock(),
+        HTTPClient(pool_size=1, timeout=1, max_retries=0),
+    )
+    with pytest.raises(MediaServiceException) as e:
+        adapter.duplicate_mediafiles([(1, 2)])
+    assert "Connect to mediaservice failed" in e.value.message
@@ -1,3 +1,4 @@
+from time import time
 from typing import cast
 from unittest import TestCase
 
@@ -6,6 +7,7 @@ from fastjsonschema import validate
 from openslides_backend.action.util.default_schema import DefaultSchema
 from openslides_backend.models import fields
 from openslides_backend.shared.exceptions import ActionException
+from tests.database.util import performance
 from tests.patch_model_registry_helper import FakeModel, PatchModelRegistryMixin
 
 
@@ -106,3 +108,35 @@ class ModelBaseTester(PatchModelRegistryMixin, TestCase):
             optional_properties=["json"]
         )
         validate(schema, {"json": [1, 2]})
+
+    def test_field_metadata(self) -> None:
+        metadata = FakeModel1.field_metadata
+        self.assertEqual(
+            [field.own_field_name for field in metadata.required_fields],
+            ["id", "text"],
+        )
+        self.assertEqual(
+            [field.own_field_name for field in metadata.relation_fields],
+            ["fake_model_2_generic_ids", "fake_model_2_ids"],
+        )
+        self.assertIs(metadata.fields_by_name["json"], FakeModel1.json)
+        self.assertIsNone(FakeModel1.try_get_field("collection"))
+
+    def test_field_metadata_field_added(self) -> None:
+        field = fields.IntegerField()
+        setattr(FakeModel2, "added_field", field)
+        try:
+            self.assertIs(FakeModel2.get_field("added_field"), field)
+            self.assertIn(field, FakeModel2.get_fields())
+        finally:
+            delattr(FakeModel2, "added_field")
+        self.assertFalse(FakeModel2.has_field("added_field"))
+
+    @performance
+    def test_field_metadata_performance(self) -> None:
+        start = time()
+        for _ in range(100_000):
+            FakeModel1.get_field("text")
+            FakeModel1.get_relation_fields()
+            FakeModel1.get_required_fields()
+        print(f"field lookups: {time() - start:.3f} seconds")
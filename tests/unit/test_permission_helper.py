@@ -1,5 +1,12 @@
-from openslides_backend.permissions.permission_helper import is_child_permission
-from openslides_backend.permissions.permissions import Permissions
+from openslides_backend.permissions.permission_helper import (
+    filter_surplus_permissions,
+    is_child_permission,
+)
+from openslides_backend.permissions.permissions import (
+    Permissions,
+    implied_permissions,
+    permission_parents,
+)
 
 
 def test_is_child_permission_equal() -> None:
@@ -42,3 +49,21 @@ def test_is_child_permission_different_collections() -> None:
     assert not is_child_permission(
         Permissions.AgendaItem.CAN_SEE, Permissions.Motion.CAN_MANAGE
     )
+
+
+def test_implied_permissions_match_permission_parents() -> None:
+    for permission, parents in permission_parents.items():
+        assert permission in implied_permissions[permission]
+        for parent in parents:
+            assert implied_permissions[permission] < implied_permissions[parent]
+
+
+def test_filter_surplus_permissions() -> None:
+    assert filter_surplus_permissions(
+        [
+            Permissions.Motion.CAN_SEE,
+            Permissions.AgendaItem.CAN_SEE,
+            Permissions.Motion.CAN_MANAGE,
+            Permissions.AgendaItem.CAN_SEE,
+        ]
+    ) == [Permissions.AgendaItem.CAN_SEE, Permissions.Motion.CAN_MANAGE]
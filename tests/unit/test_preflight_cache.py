@@ -0,0 +1,59 @@
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from openslides_backend.services.postgresql import preflight_cache as module
+from openslides_backend.services.postgresql.preflight_cache import PreflightCache
+
+
+class PreflightCacheTest(TestCase):
+    def setUp(self) -> None:
+        self.cache = PreflightCache()
+        self.loads = 0
+        self.values = {"migration_index": 1, "default_language": "en"}
+        patch.object(self.cache, "_ensure_listener").start()
+        patch.object(self.cache, "_load", self.load).start()
+        self.addCleanup(patch.stopall)
+
+    def load(self) -> dict[str, Any]:
+        self.loads += 1
+        return dict(self.values)
+
+    def test_cached_while_listening(self) -> None:
+        self.cache._listening = True
+        for _ in range(3):
+            assert self.cache.get_migration_index() == 1
+            assert self.cache.get_default_language() == "en"
+        assert self.loads == 1
+
+    def test_invalidate(self) -> None:
+        self.cache._listening = True
+        assert self.cache.get_default_language() == "en"
+        self.values["default_language"] = "de"
+        self.cache.invalidate()
+        assert self.cache.get_default_language() == "de"
+        assert self.loads == 2
+
+    def test_fallback_ttl(self) -> None:
+        with patch.object(module, "monotonic", return_value=100.0):
+            self.cache.get_migration_index()
+            self.cache.get_migration_index()
+        assert self.loads == 1
+        with patch.object(
+            module, "monotonic", return_value=100.0 + 2 * module.FALLBACK_TTL
+        ):
+            self.cache.get_migration_index()
+        assert self.loads == 2
+
+    def test_invalidated_while_loading(self) -> None:
+        self.cache._listening = True
+
+        def load() -> dict[str, Any]:
+            self.cache.invalidate()
+            return self.load()
+
+        with patch.object(self.cache, "_load", load):
+            assert self.cache.get_migration_index() == 1
+        self.values["migration_index"] = 2
+        assert self.cache.get_migration_index() == 2
+        assert self.loads == 2
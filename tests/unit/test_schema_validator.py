@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from time import time
+from unittest.mock import patch
+
+import fastjsonschema
+import pytest
+
+from openslides_backend.shared.schema_validator import (
+    SCHEMA_CACHE_DIR_VARIABLE,
+    LazySchemaValidator,
+    clear_schema_validators,
+    get_schema_validator,
+)
+from tests.database.util import performance
+
+
+@pytest.fixture(autouse=True)
+def clear_validators() -> Iterator[None]:
+    clear_schema_validators()
+    yield
+    clear_schema_validators()
+
+
+def test_lazy_schema_validator_compiles_on_first_call() -> None:
+    with patch(
+        "openslides_backend.shared.schema_validator.fastjsonschema.compile",
+        wraps=fastjsonschema.compile,
+    ) as compile_mock:
+        validator = LazySchemaValidator({"type": "integer"})
+        assert compile_mock.call_count == 0
+        assert validator(1) == 1
+        assert validator(2) == 2
+        assert compile_mock.call_count == 1
+        with pytest.raises(fastjsonschema.JsonSchemaException):
+            validator("a")
+
+
+def test_identical_schemas_share_validator() -> None:
+    validator = get_schema_validator({"type": "string", "minLength": 1})
+    assert get_schema_validator({"minLength": 1, "type": "string"}) is validator
+    assert get_schema_validator({"type": "string"}) is not validator
+
+
+def test_schema_validator_disk_cache(tmp_path: Path) -> None:
+    schema = {"type": ["string", "null"], "pattern": "^a"}
+    with patch.dict(os.environ, {SCHEMA_CACHE_DIR_VARIABLE: str(tmp_path)}):
+        validator = get_schema_validator(schema)
+        assert len(list(tmp_path.iterdir())) == 1
+        clear_schema_validators()
+        with patch(
+            "openslides_backend.shared.schema_validator.fastjsonschema.compile_to_code"
+        ) as compile_mock:
+            cached_validator = get_schema_validator(schema)
+        compile_mock.assert_not_called()
+    assert cached_validator is not validator
+    assert cached_validator("abc") == "abc"
+    assert cached_validator(None) is None
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        cached_validator("b")
+
+
+@performance
+def test_startup_performance() -> None:
+    start = time()
+    subprocess.run(
+        [sys.executable, "-c", "import openslides_backend.models.models"],
+        check=True,
+    )
+    print(f"import of the models: {time() - start:.3f} seconds")
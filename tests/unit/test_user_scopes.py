@@ -2,25 +2,38 @@ from typing import Any
 from unittest import TestCase
 from unittest.mock import MagicMock
 
+from openslides_backend.services.database.interface import GetManyRequest
+from openslides_backend.shared.exceptions import ModelDoesNotExist
 from openslides_backend.shared.mixins.user_scope_mixin import UserScope, UserScopeMixin
 
 
 class UserScopeTest(TestCase):
     def setUp(self) -> None:
         self.mock_datastore = MagicMock()
+        self.mock_datastore.get_many = MagicMock(side_effect=self.get_many)
         self.mixin = UserScopeMixin(MagicMock(), self.mock_datastore, MagicMock())
+        self.models: dict[str, dict[int, dict[str, Any]]] = {}
+
+    def get_many(
+        self, requests: list[GetManyRequest], **kwargs: Any
+    ) -> dict[str, dict[int, dict[str, Any]]]:
+        return {
+            request.collection: {
+                id_: model
+                for id_, model in self.models.get(request.collection, {}).items()
+                if id_ in request.ids
+            }
+            for request in requests
+        }
 
     def set_user_data(self, data: dict[str, Any]) -> None:
-        self.mock_datastore.get = MagicMock(return_value=data)
+        self.models["user"] = {1: data}
 
     def set_meeting_committees(self, ids: list[int]) -> None:
-        return_val = {
-            "meeting": {
-                i + 1: {"committee_id": id, "is_active_in_organization_id": 1}
-                for i, id in enumerate(ids)
-            }
+        self.models["meeting"] = {
+            i + 1: {"committee_id": id, "is_active_in_organization_id": 1}
+            for i, id in enumerate(ids)
         }
-        self.mock_datastore.get_many = MagicMock(return_value=return_val)
 
     def get_scope(self) -> UserScope:
         return self.mixin.get_user_scope(1)[0]
@@ -104,3 +117,82 @@ class UserScopeTest(TestCase):
         )
         self.set_meeting_committees([3])
         assert self.get_scope() == UserScope.Organization
+
+    def test_multiple_users(self) -> None:
+        self.models = {
+            "user": {
+                1: {"meeting_ids": [1]},
+                2: {"meeting_ids": [1, 2]},
+                3: {"committee_management_ids": [1]},
+                4: {"organization_management_level": "superadmin"},
+            },
+            "meeting": {
+                1: {"committee_id": 1, "is_active_in_organization_id": 1},
+                2: {"committee_id": 2, "is_active_in_organization_id": 1},
+            },
+        }
+        self.mixin.prefetch_user_scopes([1, 2, 3, 4])
+        assert self.mock_datastore.get_many.call_count == 2
+        scopes = self.mixin.prefetched_user_scopes
+        assert scopes
+        assert {user_id: scope[:3] for user_id, scope in scopes.items()} == {
+            1: (UserScope.Meeting, 1, ""),
+            2: (UserScope.Organization, 1, ""),
+            3: (UserScope.Committee, 1, ""),
+            4: (UserScope.Organization, 1, "superadmin"),
+        }
+        assert scopes[1][3] == {1: [1]}
+        assert scopes[2][3] == {1: [1], 2: [2]}
+        assert self.mixin.prefetched_meeting_ids == {1, 2}
+        assert self.mixin.get_user_scope(2) == scopes[2]
+        assert self.mock_datastore.get_many.call_count == 2
+
+    def test_multiple_users_missing_user(self) -> None:
+        self.set_user_data({})
+        with self.assertRaises(ModelDoesNotExist):
+            self.mixin.get_user_scopes([1, 2])
+
+    def test_admins_of_prefetched_meetings_fetched_once(self) -> None:
+        self.models = {
+            "user": {
+                1: {"meeting_ids": [1]},
+                2: {"meeting_ids": [2]},
+                5: {"meeting_ids": [1, 2]},
+            },
+            "meeting": {
+                1: {
+                    "committee_id": 1,
+                    "is_active_in_organization_id": 1,
+                    "group_ids": [1],
+                },
+                2: {
+                    "committee_id": 2,
+                    "is_active_in_organization_id": 1,
+                    "group_ids": [2],
+                },
+            },
+            "group": {
+                1: {"admin_group_for_meeting_id": 1, "meeting_user_ids": [11]},
+                2: {"permissions": ["user.can_update"], "meeting_user_ids": [12]},
+            },
+            "meeting_user": {
+                11: {"user_id": 5, "meeting_id": 1},
+                12: {"user_id": 5, "meeting_id": 2},
+            },
+        }
+        self.mock_datastore.get = MagicMock(
+            side_effect=lambda fqid, *args, **kwargs: self.models["user"][
+                int(fqid.split("/")[1])
+            ]
+        )
+        cache: dict[Any, Any] = {}
+        self.mock_datastore.get_cached = MagicMock(
+            side_effect=lambda key, collections, fn: cache.get(key)
+            or cache.setdefault(key, fn())
+        )
+        self.mixin.user_id = 5
+        self.mixin.prefetch_user_scopes([1, 2])
+        assert self.mixin.check_for_admin_in_all_meetings(1, {1})
+        assert self.mixin.check_for_admin_in_all_meetings(2, {2})
+        # users and meetings for the scopes, then meetings, groups, meeting users
+        assert self.mock_datastore.get_many.call_count == 5
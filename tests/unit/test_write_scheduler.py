@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock
+
+import pytest
+from psycopg.errors import DeadlockDetected, SerializationFailure
+
+from openslides_backend.services.database.write_scheduler import WriteScheduler
+from openslides_backend.shared.exceptions import DatabaseException
+
+
+def test_write_scheduler_success() -> None:
+    scheduler = WriteScheduler()
+    assert scheduler.run(lambda: 42, 3, 0) == 42
+    metrics = scheduler.get_metrics()
+    assert metrics["transactions"] == 1
+    assert metrics["retries"] == 0
+
+
+def test_write_scheduler_retry() -> None:
+    scheduler = WriteScheduler()
+    fn = MagicMock(side_effect=[SerializationFailure(), DeadlockDetected(), 42])
+    assert scheduler.run(fn, 3, 0) == 42
+    assert fn.call_count == 3
+    metrics = scheduler.get_metrics()
+    assert metrics["transactions"] == 1
+    assert metrics["retries"] == 2
+    assert metrics["failed_transactions"] == 0
+
+
+def test_write_scheduler_retries_exhausted() -> None:
+    scheduler = WriteScheduler()
+    fn = MagicMock(side_effect=SerializationFailure())
+    with pytest.raises(DatabaseException) as e:
+        scheduler.run(fn, 2, 0)
+    assert "concurrent conflicting actions" in e.value.message
+    assert fn.call_count == 2
+    metrics = scheduler.get_metrics()
+    assert metrics["transactions"] == 0
+    assert metrics["retries"] == 1
+    assert metrics["failed_transactions"] == 1
+
+
+def test_write_scheduler_other_exception() -> None:
+    scheduler = WriteScheduler()
+    fn = MagicMock(side_effect=ValueError())
+    with pytest.raises(ValueError):
+        scheduler.run(fn, 3, 0)
+    assert fn.call_count == 1
+
+
+def test_write_scheduler_times() -> None:
+    scheduler = WriteScheduler()
+    scheduler.add_lock_wait_time(0.5)
+    scheduler.add_lock_wait_time(0.25)
+    scheduler.add_write_time(1.0)
+    metrics = scheduler.get_metrics()
+    assert metrics["lock_wait_time"] == 0.75
+    assert metrics["write_time"] == 1.0
+    scheduler.reset_metrics()
+    assert scheduler.get_metrics()["lock_wait_time"] == 0.0